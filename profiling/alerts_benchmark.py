@@ -0,0 +1,101 @@
+"""
+Memory and throughput comparison of alert representations.
+
+Compares the previous alert path, which formatted every alert into a
+string as soon as it was raised, with structured `Alert` records that
+are rendered only at the storage edge. Reports build throughput, the
+cost of rendering at a text backend, and the memory held by a batch of
+alerts (measured with tracemalloc).
+
+Usage:
+    python -m profiling.alerts_benchmark --alerts 100000
+"""
+import argparse
+import random
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from src.processors.alerts import AlertProcessor
+
+
+def legacy_message(data: Dict[str, Any]) -> str:
+    """
+    Format an alert the way the previous path did.
+
+    Args:
+        data (Dict[str, Any]): Metric event data.
+
+    Returns:
+        str: Formatted alert message.
+    """
+    return (
+        f"ALERT: {data['metric']} crossed threshold "
+        f"with value {data['value']}"
+    )
+
+
+def held_bytes(build: Callable[[], List[Any]]) -> int:
+    """
+    Memory retained by the objects a builder returns.
+
+    Args:
+        build (Callable[[], List[Any]]): Builds the batch to measure.
+
+    Returns:
+        int: Bytes still allocated while the batch is alive.
+    """
+    tracemalloc.start()
+    batch = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del batch
+    return current
+
+
+def main() -> None:
+    """
+    Run the comparison and print the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--alerts", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = [f"metric_{i}" for i in range(50)]
+    events = [
+        {
+            "metric": random.choice(names),
+            "value": random.uniform(90, 100),
+            "endpoint": f"http://host-{i % 1000}/metrics",
+        }
+        for i in range(args.alerts)
+    ]
+    build = AlertProcessor().build
+
+    def strings() -> List[str]:
+        return [legacy_message(data) for data in events]
+
+    def records() -> List[Any]:
+        return [build(data) for data in events]
+
+    built = records()
+
+    timings = {
+        "format strings": strings,
+        "build records": records,
+        "render records": lambda: [record.render() for record in built],
+    }
+
+    for label, func in timings.items():
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{label:>16}: {args.alerts / best:>12,.0f} alerts/s")
+
+    for label, func in (("strings", strings), ("records", records)):
+        size = held_bytes(func)
+        print(f"{label:>16}: {size / 2 ** 20:>9.2f} MB "
+              f"({size / args.alerts:.0f} B/alert)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Throughput benchmark of the batched SQLite alert writer.
+
+Stores the same alerts twice into a fresh SQLite database: once with
+one committed INSERT per alert on the calling thread, as a naive
+writer would, and once through `DatabaseStorageStrategy`, whose writer
+thread commits queued batches with `executemany`. Reports alerts per
+second, transactions and the time callers spent enqueueing.
+
+Usage:
+    python -m profiling.db_benchmark --alerts 20000 --batch 100
+"""
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.strategy import ALERT_SCHEMA, DatabaseStorageStrategy
+from src.processors.alerts import Alert
+
+
+def make_alerts(count: int) -> List[Alert]:
+    """
+    Build alert records spread over a few metrics and endpoints.
+
+    Args:
+        count (int): Number of alerts.
+
+    Returns:
+        List[Alert]: Alert records.
+    """
+    return [
+        Alert(f"metric_{i % 50}", 90.0 + i % 10,
+              f"http://host-{i % 500}/metrics", timestamp=float(i))
+        for i in range(count)
+    ]
+
+
+def run_naive(path: Path, alerts: List[Alert]) -> Dict[str, float]:
+    """
+    Insert and commit every alert on its own.
+
+    Args:
+        path (Path): Database file.
+        alerts (List[Alert]): Alerts to store.
+
+    Returns:
+        Dict[str, float]: Alerts per second and transactions.
+    """
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    for statement in ALERT_SCHEMA:
+        conn.execute(statement)
+
+    started = time.perf_counter()
+
+    for alert in alerts:
+        conn.execute(
+            "INSERT INTO alerts "
+            "(ts, metric, value, endpoint, state, detector, score) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            DatabaseStorageStrategy._row(alert),
+        )
+
+    elapsed = time.perf_counter() - started
+    conn.close()
+    return {"alerts_per_s": len(alerts) / elapsed,
+            "transactions": len(alerts), "enqueue_s": elapsed}
+
+
+def run_batched(
+    path: Path,
+    alerts: List[Alert],
+    batch: int
+) -> Dict[str, float]:
+    """
+    Store alerts through the batched writer thread.
+
+    Args:
+        path (Path): Database file.
+        alerts (List[Alert]): Alerts to store.
+        batch (int): Alerts per `store_many` call.
+
+    Returns:
+        Dict[str, float]: Writer stats plus alerts per second and the
+        time callers spent enqueueing.
+    """
+    storage = DatabaseStorageStrategy(str(path))
+    started = time.perf_counter()
+
+    for start in range(0, len(alerts), batch):
+        storage.store_many(alerts[start:start + batch])
+
+    enqueued = time.perf_counter() - started
+    storage.close()
+    elapsed = time.perf_counter() - started
+    return {**storage.stats(), "alerts_per_s": len(alerts) / elapsed,
+            "enqueue_s": enqueued}
+
+
+def main() -> None:
+    """
+    Run both writers and print the comparison.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--alerts", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--synchronous", default="NORMAL")
+    args = parser.parse_args()
+
+    ConfigManager().set("STORAGE_DB_SYNCHRONOUS", args.synchronous)
+    alerts = make_alerts(args.alerts)
+
+    with tempfile.TemporaryDirectory() as root:
+        naive = run_naive(Path(root) / "naive.db", alerts)
+        batched = run_batched(Path(root) / "batched.db", alerts, args.batch)
+
+    for label, stats in (("per-row", naive), ("batched", batched)):
+        print(f"{label:>8}: {stats['alerts_per_s']:>10,.0f} alerts/s, "
+              f"{stats['transactions']:>7,} transactions, "
+              f"{stats['enqueue_s'] * 1000:>8,.1f} ms in callers")
+
+
+if __name__ == "__main__":
+    main()
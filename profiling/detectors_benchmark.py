@@ -0,0 +1,56 @@
+"""
+Online anomaly detector throughput benchmark.
+
+Feeds payloads of `--metrics` metrics from `--endpoints` endpoints
+through each detector, one payload at a time as the monitor does, and
+reports the cost per sample and the memory held per series.
+
+Usage:
+    python -m profiling.detectors_benchmark --endpoints 1000 --metrics 20
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.rules.detectors import DETECTORS
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--endpoints", type=int, default=1000)
+    parser.add_argument("--metrics", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    names = [f"metric_{i}" for i in range(args.metrics)]
+    endpoints = [f"host-{i}" for i in range(args.endpoints)]
+    rounds = [
+        rng.normal(50, 5, (args.endpoints, args.metrics)).tolist()
+        for _ in range(args.rounds)
+    ]
+    samples = args.rounds * args.endpoints * args.metrics
+
+    for name, cls in DETECTORS.items():
+        detector = cls()
+        anomalies = 0
+        started = time.perf_counter()
+
+        for step, values in enumerate(rounds):
+            for endpoint, row in zip(endpoints, values):
+                anomalies += len(
+                    detector.update(endpoint, dict(zip(names, row)), step)
+                )
+
+        elapsed = time.perf_counter() - started
+        print(f"{name:>6}: {elapsed / samples * 1e9:6.0f} ns/sample, "
+              f"{detector.nbytes / len(detector):5.0f} B/series, "
+              f"{anomalies} anomalies")
+
+
+if __name__ == "__main__":
+    main()
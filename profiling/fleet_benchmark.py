@@ -0,0 +1,65 @@
+"""
+Fleet analytics scaling benchmark.
+
+Analyzes `--hosts` x `--metrics` series of `--samples` samples with
+`FleetAnalyticsRunner`, first in the calling process and then on
+process pools of increasing size, and reports the speedup over the
+inline run against the number of cores available.
+
+Usage:
+    python -m profiling.fleet_benchmark --hosts 500 --metrics 20 --samples 1000
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from src.data_handlers.fleet import FleetAnalyticsRunner
+from src.metaclasses.config_manager import ConfigManager
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--hosts", type=int, default=500)
+    parser.add_argument("--metrics", type=int, default=20)
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--workers", type=int, nargs="*", default=[2, 4])
+    args = parser.parse_args()
+
+    ConfigManager().set("FLEET_MIN_PARALLEL_SAMPLES", 0)
+    rng = np.random.default_rng(0)
+    series = {
+        (f"host-{h}", f"metric_{m}"): rng.normal(50, 5, args.samples)
+        for h in range(args.hosts) for m in range(args.metrics)
+    }
+    cores = len(os.sched_getaffinity(0))
+    print(f"{len(series)} series x {args.samples} samples, {cores} core(s)")
+
+    inline = FleetAnalyticsRunner(workers=1)
+    started = time.perf_counter()
+    expected = inline.analyze(series)
+    baseline = time.perf_counter() - started
+    print(f"{'inline':>10}: {baseline:.2f} s")
+
+    for workers in args.workers:
+        runner = FleetAnalyticsRunner(workers=workers)
+        runner.analyze(dict(list(series.items())[:workers]))
+
+        started = time.perf_counter()
+        result = runner.analyze(series)
+        elapsed = time.perf_counter() - started
+        runner.close()
+
+        assert np.allclose(result.to_numpy(), expected.to_numpy())
+        speedup = baseline / elapsed
+        print(f"{workers:>2} workers: {elapsed:.2f} s, speedup {speedup:.2f}x, "
+              f"efficiency {speedup / min(workers, cores):.0%} "
+              f"({runner.stats()['chunks']} chunks)")
+
+
+if __name__ == "__main__":
+    main()
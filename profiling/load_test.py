@@ -0,0 +1,248 @@
+"""
+Synthetic fleet load test for the collection path.
+
+Starts a stub fleet of aiohttp metric endpoints in a separate process,
+then drives full `MonitoringApp.run_once` cycles against it and reports
+cycle latency percentiles, fetch throughput, CPU time and memory usage
+of the collecting process.
+
+Each simulated endpoint gets its own loopback address (127.x.y.z), so
+per-host connection pooling behaves like it would against a real fleet.
+Pass ``--same-host`` on platforms that only route 127.0.0.1.
+
+Usage:
+    python -m profiling.load_test --endpoints 5000 --cycles 10 \\
+        --latency lognormal --latency-ms 20 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import resource
+import statistics
+import time
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+
+LATENCY_MODELS = {
+    "constant": lambda mean: mean,
+    "uniform": lambda mean: random.uniform(0, 2 * mean),
+    "exponential": lambda mean: random.expovariate(1 / mean) if mean else 0,
+    "lognormal": lambda mean: random.lognormvariate(0, 1) * mean / 1.6487,
+}
+
+
+def run_fleet(
+    port: int,
+    latency: str,
+    latency_ms: float,
+    error_rate: float,
+    metrics_per_payload: int,
+    ready: Any
+) -> None:
+    """
+    Serve the stub fleet until the process is terminated.
+
+    Args:
+        port (int): Port to listen on (all interfaces).
+        latency (str): Name of the latency model.
+        latency_ms (float): Mean response latency in milliseconds.
+        error_rate (float): Fraction of requests answered with HTTP 500.
+        metrics_per_payload (int): Number of metrics in each payload.
+        ready (multiprocessing.Event): Set once the server is listening.
+    """
+    draw = LATENCY_MODELS[latency]
+    names = [f"metric_{i}" for i in range(metrics_per_payload)]
+
+    async def handler(request: web.Request) -> web.Response:
+        delay = draw(latency_ms) / 1000
+
+        if delay:
+            await asyncio.sleep(delay)
+
+        if random.random() < error_rate:
+            return web.Response(status=500)
+
+        return web.json_response(
+            {name: random.uniform(0, 100) for name in names}
+        )
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_get("/metrics", handler)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "0.0.0.0", port, backlog=4096).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+def fleet_endpoints(count: int, port: int, same_host: bool) -> List[str]:
+    """
+    Build the endpoint URLs of the stub fleet.
+
+    Args:
+        count (int): Number of simulated endpoints.
+        port (int): Port the stub fleet listens on.
+        same_host (bool): Use 127.0.0.1 for all endpoints.
+
+    Returns:
+        List[str]: Endpoint URLs, one distinct loopback host per endpoint
+        unless `same_host` is set.
+    """
+    if same_host:
+        return [f"http://127.0.0.1:{port}/metrics?ep={i}" for i in range(count)]
+
+    return [
+        f"http://127.{(i + 1) // 65536}.{(i + 1) // 256 % 256}."
+        f"{(i + 1) % 256}:{port}/metrics"
+        for i in range(count)
+    ]
+
+
+def rss_bytes() -> int:
+    """
+    Current resident set size of this process.
+
+    Returns:
+        int: RSS in bytes, or 0 when /proc is unavailable.
+    """
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return 0
+
+
+async def drive(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run the configured number of collection cycles.
+
+    Args:
+        args (argparse.Namespace): Parsed command line options.
+
+    Returns:
+        Dict[str, Any]: Load test report.
+    """
+    from src.app import MonitoringApp
+    from src.metaclasses.config_manager import ConfigManager
+
+    config = ConfigManager()
+    endpoints = fleet_endpoints(args.endpoints, args.port, args.same_host)
+    config.set("METRIC_ENDPOINTS", endpoints)
+    config.set("FETCH_CONCURRENCY", args.concurrency)
+    config.set("HTTP_POOL_LIMIT", args.concurrency)
+    config.set("CYCLE_DEADLINE", args.deadline)
+    config.set("METRIC_THRESHOLD", args.threshold)
+
+    app = MonitoringApp(replica_index=0, replica_count=1)
+    await app.start()
+
+    for _ in range(args.warmup):
+        await app.run_once()
+
+    cycle_times: List[float] = []
+    evaluated = 0
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    try:
+        for _ in range(args.cycles):
+            started = time.perf_counter()
+            evaluated += await app.run_once()
+            cycle_times.append(time.perf_counter() - started)
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        collector_stats = app._collector.stats()
+        await app.close()
+
+    report: Dict[str, Any] = {
+        "endpoints": args.endpoints,
+        "cycles": args.cycles,
+    }
+
+    # Percentiles need at least two cycles.
+    if len(cycle_times) > 1:
+        cuts = statistics.quantiles(cycle_times, n=100, method="inclusive")
+        report.update(cycle_p50_s=cuts[49], cycle_p95_s=cuts[94],
+                      cycle_p99_s=cuts[98])
+    else:
+        report["cycle_s"] = cycle_times[0]
+
+    return {
+        **report,
+        "fetches_per_s": args.endpoints * args.cycles / wall,
+        "evaluated_per_s": evaluated / wall,
+        "cpu_s": cpu,
+        "cpu_utilisation": cpu / wall,
+        "rss_mb": rss_bytes() / 2 ** 20,
+        "peak_rss_mb": resource.getrusage(
+            resource.RUSAGE_SELF
+        ).ru_maxrss / 1024,
+        "connection_reuse_ratio": collector_stats["reuse_ratio"],
+        "deadline_cancelled": collector_stats["deadline_cancelled"],
+    }
+
+
+def main() -> None:
+    """
+    Parse options, start the stub fleet and print the load test report.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--endpoints", type=int, default=1000)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument(
+        "--latency", choices=sorted(LATENCY_MODELS), default="lognormal"
+    )
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--metrics-per-payload", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--deadline", type=float, default=30.0)
+    parser.add_argument("--threshold", type=float, default=100.0)
+    parser.add_argument("--same-host", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    if args.cycles < 1:
+        parser.error("--cycles must be at least 1")
+
+    ready = multiprocessing.Event()
+    fleet = multiprocessing.Process(
+        target=run_fleet,
+        args=(
+            args.port, args.latency, args.latency_ms, args.error_rate,
+            args.metrics_per_payload, ready,
+        ),
+        daemon=True,
+    )
+    fleet.start()
+
+    try:
+        if not ready.wait(timeout=10):
+            raise RuntimeError("Stub fleet failed to start")
+
+        report = asyncio.run(drive(args))
+    finally:
+        fleet.terminate()
+        fleet.join()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    for key, value in report.items():
+        print(f"{key:>24}: {value:.4f}" if isinstance(value, float)
+              else f"{key:>24}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Exact versus sketch-based percentile benchmark.
+
+Compares `MetricsAnalytics.percentiles()` (pandas sort and interpolate)
+with the ``"sketch"`` method on the same data, and measures the
+streaming update rate and merge cost of `StreamingPercentiles`. Reports
+the largest relative error of the sketch against the exact results.
+
+Usage:
+    python -m profiling.percentiles_benchmark --samples 1000000 --series 10
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.data_handlers.analytics import MetricsAnalytics, StreamingPercentiles
+
+
+def main() -> None:
+    """
+    Run the comparison and print the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--series", type=int, default=10)
+    parser.add_argument("--stream-samples", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = {
+        f"series_{i}": rng.lognormal(3, 1, args.samples)
+        for i in range(args.series)
+    }
+    analytics = MetricsAnalytics(data)
+
+    started = time.perf_counter()
+    exact = analytics.percentiles()
+    exact_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    estimate = analytics.percentiles(method="sketch")
+    sketch_time = time.perf_counter() - started
+
+    error = float(np.max(np.abs(estimate - exact) / np.abs(exact)))
+    print(f"{'exact':>16}: {exact_time:.3f} s")
+    print(f"{'sketch (bulk)':>16}: {sketch_time:.3f} s "
+          f"(max relative error {error:.2%})")
+
+    streaming = StreamingPercentiles()
+    values = data["series_0"][:args.stream_samples].tolist()
+    started = time.perf_counter()
+
+    for value in values:
+        streaming.add("series_0", value)
+
+    elapsed = time.perf_counter() - started
+    print(f"{'streaming add':>16}: {elapsed / len(values) * 1e9:.0f} ns/sample")
+
+    replicas = []
+    for chunk in np.array_split(data["series_0"], 16):
+        replica = StreamingPercentiles()
+        replica.extend("series_0", chunk)
+        replicas.append(replica)
+
+    started = time.perf_counter()
+    merged = StreamingPercentiles()
+    for replica in replicas:
+        merged.merge(replica)
+    merged.percentiles()
+    print(f"{'merge 16 + query':>16}: "
+          f"{(time.perf_counter() - started) * 1e3:.2f} ms, "
+          f"{len(merged.sketch('series_0')._positive)} buckets per series")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Ring-buffer history benchmark.
+
+Measures the append rate of `RingBufferHistory` for monitor-sized
+payloads and compares building `MetricsAnalytics` from last-N ring
+views with building it from per-series Python lists.
+
+Usage:
+    python -m profiling.ring_benchmark --metrics 50 --capacity 10000
+"""
+import argparse
+import time
+from collections import deque
+
+import numpy as np
+
+from src.data_handlers.analytics import MetricsAnalytics
+from src.timeseries.ring import RingBufferHistory
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--metrics", type=int, default=50)
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--payloads", type=int, default=20_000)
+    args = parser.parse_args()
+
+    names = [f"metric_{i}" for i in range(args.metrics)]
+    rng = np.random.default_rng(0)
+    payloads = [
+        dict(zip(names, row))
+        for row in rng.normal(50, 5, (args.payloads, args.metrics)).tolist()
+    ]
+
+    ring = RingBufferHistory(args.capacity, args.metrics)
+    print(f"{'preallocated':>18}: {ring.nbytes / 2**20:.1f} MiB "
+          f"({RingBufferHistory.required_bytes(args.metrics, args.capacity)}"
+          f" bytes)")
+
+    started = time.perf_counter()
+    for step, payload in enumerate(payloads):
+        ring.record("host", payload, float(step))
+    elapsed = time.perf_counter() - started
+    print(f"{'ring append':>18}: {elapsed / args.payloads * 1e6:.1f} us/payload")
+
+    lists = {name: deque(maxlen=args.capacity) for name in names}
+    started = time.perf_counter()
+    for payload in payloads:
+        for name, value in payload.items():
+            lists[name].append(value)
+    elapsed = time.perf_counter() - started
+    print(f"{'deque append':>18}: {elapsed / args.payloads * 1e6:.1f} us/payload")
+
+    started = time.perf_counter()
+    for _ in range(100):
+        MetricsAnalytics({name: list(values) for name, values in lists.items()})
+    lists_time = (time.perf_counter() - started) / 100
+
+    started = time.perf_counter()
+    for _ in range(100):
+        MetricsAnalytics.from_history(ring, "host")
+    ring_time = (time.perf_counter() - started) / 100
+
+    print(f"{'frame from lists':>18}: {lists_time * 1e3:.2f} ms")
+    print(f"{'frame from ring':>18}: {ring_time * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Ingest and range-scan benchmark for the metric history store.
+
+Records synthetic payloads for a fleet of endpoints into a
+`TimeSeriesStore` in a temporary directory, then measures how fast
+samples are recorded and flushed, and how fast full-series and narrow
+time-range scans return.
+
+Usage:
+    python -m profiling.timeseries_benchmark --endpoints 200 --metrics 20 \\
+        --samples 1000
+"""
+import argparse
+import random
+import tempfile
+import time
+
+from src.metaclasses.config_manager import ConfigManager
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--endpoints", type=int, default=200)
+    parser.add_argument("--metrics", type=int, default=20)
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--segment-samples", type=int, default=65536)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    config = ConfigManager()
+    config.set("HISTORY_FLUSH_INTERVAL", 0)
+    config.set("HISTORY_SEGMENT_SAMPLES", args.segment_samples)
+
+    from src.timeseries.store import TimeSeriesStore
+
+    endpoints = [f"http://host-{i}/metrics" for i in range(args.endpoints)]
+    names = [f"metric_{i}" for i in range(args.metrics)]
+    total = args.endpoints * args.metrics * args.samples
+
+    with tempfile.TemporaryDirectory() as root:
+        store = TimeSeriesStore(root)
+        started = time.perf_counter()
+
+        for ts in range(args.samples):
+            for endpoint in endpoints:
+                store.record(
+                    endpoint,
+                    {name: random.uniform(0, 100) for name in names},
+                    float(ts),
+                )
+
+        recorded = time.perf_counter() - started
+        store.flush()
+        flushed = time.perf_counter() - started - recorded
+
+        print(f"{'record':>12}: {total / recorded:>14,.0f} samples/s")
+        print(f"{'flush':>12}: {total / flushed:>14,.0f} samples/s")
+
+        for label, span in (("full scan", args.samples),
+                            ("10% range", args.samples // 10)):
+            started = time.perf_counter()
+            scanned = 0
+
+            for _ in range(args.queries):
+                start = random.randrange(args.samples - span + 1)
+                _, values = store.query(
+                    random.choice(endpoints), random.choice(names),
+                    start, start + span,
+                )
+                scanned += len(values)
+
+            elapsed = time.perf_counter() - started
+            print(f"{label:>12}: {elapsed / args.queries * 1e6:>10,.0f} us/query"
+                  f" ({scanned / elapsed:,.0f} samples/s)")
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Throughput and object-count benchmark of batched alert uploads.
+
+Stores the same alerts through `CloudStorageStrategy` twice against a
+local-directory object store with simulated request latency: once with
+one object per alert, as the previous per-alert upload path did, and
+once with size-bounded compressed chunks. Reports alerts per second,
+objects uploaded and bytes sent for both.
+
+Usage:
+    python -m profiling.upload_benchmark --alerts 5000 --latency-ms 20
+"""
+import argparse
+import tempfile
+import time
+from typing import Dict
+
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.strategy import CloudStorageStrategy
+from src.processors.alerts import Alert
+from src.storage.object_store import LocalDirectoryClient
+
+
+class SlowClient(LocalDirectoryClient):
+    """
+    Local-directory client adding a fixed delay to every request.
+    """
+
+    def __init__(self, root: str, latency: float) -> None:
+        super().__init__(root)
+        self.latency = latency
+
+    def put(self, key: str, data: bytes) -> None:
+        time.sleep(self.latency)
+        super().put(key, data)
+
+
+def run(alerts: int, chunk_bytes: int, latency: float) -> Dict[str, float]:
+    """
+    Upload alerts with the given chunk size.
+
+    Args:
+        alerts (int): Number of alerts to store.
+        chunk_bytes (int): Chunk size; 1 uploads every alert on its own.
+        latency (float): Simulated request latency in seconds.
+
+    Returns:
+        Dict[str, float]: Uploader stats plus alerts per second.
+    """
+    ConfigManager().set("UPLOAD_CHUNK_BYTES", chunk_bytes)
+
+    with tempfile.TemporaryDirectory() as root:
+        storage = CloudStorageStrategy(SlowClient(root, latency))
+        started = time.perf_counter()
+
+        for i in range(alerts):
+            storage.store(
+                Alert(f"metric_{i % 50}", 95.0, f"http://host-{i}/metrics")
+            )
+
+        storage.close()
+        elapsed = time.perf_counter() - started
+
+    return {**storage.stats(), "alerts_per_s": alerts / elapsed}
+
+
+def main() -> None:
+    """
+    Run both configurations and print the comparison.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--alerts", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--chunk-bytes", type=int, default=1024 * 1024)
+    args = parser.parse_args()
+
+    ConfigManager().set("UPLOAD_CHUNK_SECONDS", 0)
+    latency = args.latency_ms / 1000
+
+    for label, chunk_bytes in (("per-alert", 1), ("batched", args.chunk_bytes)):
+        stats = run(args.alerts, chunk_bytes, latency)
+        print(f"{label:>10}: {stats['alerts_per_s']:>10,.0f} alerts/s, "
+              f"{stats['objects']:>6,} objects, "
+              f"{stats['compressed_bytes'] / 1024:>8,.1f} KiB sent "
+              f"(ratio {stats['compression_ratio']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,22 @@
 import asyncio
+import fnmatch
+import logging
+from typing import Dict, List
+
+from src.async_collectors.metrics_collector import AsyncMetricsCollector
+from src.ingestion.push_server import PushIngestionServer
+from src.instrumentation.registry import MetricFamily, MetricsRegistry
+from src.instrumentation.server import MetricsServer
 from src.metaclasses.config_manager import ConfigManager
 from src.patterns.observer import MetricMonitor, AlertObserver
+from src.rules.detectors import create_detector
+from src.scheduling.scheduler import FixedRateScheduler
+from src.scheduling.sharding import RendezvousSharder
+from src.timeseries.ring import RingBufferHistory
+from src.timeseries.rollups import RollupPipeline
+from src.timeseries.store import TimeSeriesStore
+
+logger = logging.getLogger(__name__)
 
 
 class MonitoringApp:
@@ -11,52 +27,332 @@ class MonitoringApp:
     threshold evaluation, and alert notification.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        replica_index: int | None = None,
+        replica_count: int | None = None
+    ) -> None:
         """
         Initialize the monitoring application.
 
-        Sets up configuration, metric monitor, and registers
-        alert observers.
+        Sets up configuration, endpoint sharding, metric collector,
+        poll scheduler, metric monitor, and registers alert observers.
+        A push ingestion server is created as well when `PUSH_ENABLED`
+        is set, a ``/metrics`` server when `METRICS_ENABLED` is set, a
+        metric history store when `HISTORY_ENABLED` is set, and a ring
+        buffer of recent samples when `RING_HISTORY_ENABLED` is set.
+        Every detector named in `DETECTORS` is registered with the
+        monitor.
+
+        Args:
+            replica_index (int | None): Index of this replica. Read from
+                the environment or configuration when omitted.
+            replica_count (int | None): Total number of replicas. Read from
+                the environment or configuration when omitted.
         """
         self._config = ConfigManager()
-        self._monitor = MetricMonitor()
+
+        if replica_index is None or replica_count is None:
+            self._sharder = RendezvousSharder.from_config()
+        else:
+            self._sharder = RendezvousSharder(replica_index, replica_count)
+
+        self._collector = AsyncMetricsCollector()
+        self._scheduler = FixedRateScheduler(
+            self.run_once,
+            jitter=float(self._config.get("SCHEDULER_JITTER")),
+        )
+        self._monitor = MetricMonitor(
+            dispatch=self._config.get("OBSERVER_DISPATCH")
+        )
         self._monitor.register_observer(AlertObserver())
+        self._history: TimeSeriesStore | None = None
+
+        if self._config.get("HISTORY_ENABLED"):
+            self._history = TimeSeriesStore()
+            self._monitor.register_recorder(self._history)
+
+        self._recent: RingBufferHistory | None = None
+
+        if self._config.get("RING_HISTORY_ENABLED"):
+            self._recent = RingBufferHistory()
+            self._monitor.register_recorder(self._recent)
+
+        self._rollups: RollupPipeline | None = None
+
+        if self._config.get("ROLLUP_ENABLED"):
+            self._rollups = RollupPipeline()
+            self._monitor.register_recorder(self._rollups)
+
+        for name in self._config.get("DETECTORS"):
+            self._monitor.register_detector(create_detector(name))
+
+        self._push_server: PushIngestionServer | None = None
+
+        if self._config.get("PUSH_ENABLED"):
+            self._push_server = PushIngestionServer(self._monitor)
+
+        self._metrics_server: MetricsServer | None = None
+
+        if self._config.get("METRICS_ENABLED"):
+            self._metrics_server = MetricsServer()
+
+        self._gauges: List[MetricFamily] = []
+        self._stats = {"payloads_invalid": 0, "payloads_failed": 0}
+
+    def _register_gauges(self) -> None:
+        """
+        Expose scheduler and collector statistics as scrape-time gauges.
+
+        Gauges are labelled with the replica index, so replicas running
+        in one process report separately, and are removed by `close`.
+
+        Raises:
+            ValueError: If a running app of the same replica already
+                exposes them.
+        """
+        registry = MetricsRegistry()
+        replica = str(self._sharder.replica_index)
+        sources = (
+            (self._scheduler.stats, "lag_last",
+             "monitor_scheduler_lag_seconds",
+             "Delay of the most recent poll behind its scheduled tick."),
+            (self._scheduler.stats, "lag_max",
+             "monitor_scheduler_lag_max_seconds",
+             "Largest delay of a poll behind its scheduled tick."),
+            (self._scheduler.stats, "missed_ticks",
+             "monitor_scheduler_missed_ticks",
+             "Ticks skipped because the scheduler fell behind."),
+            (self._scheduler.stats, "overruns",
+             "monitor_scheduler_overruns",
+             "Ticks skipped because the previous poll was still running."),
+            (self._collector.stats, "reuse_ratio",
+             "monitor_connection_reuse_ratio",
+             "Fraction of requests served on a reused connection."),
+            (self._collector.stats, "not_modified_ratio",
+             "monitor_not_modified_ratio",
+             "Fraction of conditional requests answered with 304."),
+        )
 
-    async def run_once(self):
+        for stats, key, name, documentation in sources:
+            family = registry.gauge(name, documentation, ("replica",))
+            family.labels(replica).set_function(
+                lambda stats=stats, key=key: stats()[key]
+            )
+            self._gauges.append(family)
+
+    def _unregister_gauges(self) -> None:
+        """
+        Remove the gauges exposed by `_register_gauges`.
+        """
+        replica = str(self._sharder.replica_index)
+
+        for family in self._gauges:
+            family.remove(replica)
+
+        self._gauges = []
+
+    @property
+    def push_server(self) -> PushIngestionServer | None:
+        """
+        Push ingestion server, if push mode is enabled.
+
+        Returns:
+            PushIngestionServer | None: Server exposing ingest stats.
+        """
+        return self._push_server
+
+    @property
+    def history(self) -> TimeSeriesStore | None:
+        """
+        Metric history store, if history recording is enabled.
+
+        Returns:
+            TimeSeriesStore | None: Store serving time-range queries.
+        """
+        return self._history
+
+    @property
+    def recent(self) -> RingBufferHistory | None:
+        """
+        In-memory ring buffer of recent samples, if enabled.
+
+        Returns:
+            RingBufferHistory | None: History serving last-N views.
+        """
+        return self._recent
+
+    @property
+    def rollups(self) -> RollupPipeline | None:
+        """
+        Rollup pipeline, if downsampling is enabled.
+
+        Returns:
+            RollupPipeline | None: Pipeline serving aggregate queries.
+        """
+        return self._rollups
+
+    @property
+    def scheduler(self) -> FixedRateScheduler:
+        """
+        Scheduler driving the continuous monitoring loop.
+
+        Returns:
+            FixedRateScheduler: Scheduler exposing lag and missed-tick stats.
+        """
+        return self._scheduler
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report collected payloads that could not be evaluated.
+
+        Returns:
+            Dict[str, int]: Counts of payloads that were not a metrics
+            object and of payloads whose evaluation raised.
+        """
+        return dict(self._stats)
+
+    def owned_endpoints(self) -> List[str]:
+        """
+        List the configured endpoints assigned to this replica.
+
+        Returns:
+            List[str]: This replica's shard of `METRIC_ENDPOINTS`.
+        """
+        return self._sharder.assign(self._config.get("METRIC_ENDPOINTS", []))
+
+    def _interval_for(self, endpoint: str) -> float:
+        """
+        Resolve the poll interval of an endpoint.
+
+        `ENDPOINT_INTERVALS` keys may be exact endpoint URLs or glob
+        patterns naming a group of endpoints (e.g. ``"http://db-*"``).
+        Exact matches win over patterns; unmatched endpoints use
+        `POLL_INTERVAL`.
+
+        Args:
+            endpoint (str): Metrics endpoint URL.
+
+        Returns:
+            float: Poll interval in seconds.
+        """
+        overrides = self._config.get("ENDPOINT_INTERVALS")
+
+        if endpoint in overrides:
+            return float(overrides[endpoint])
+
+        for pattern, interval in overrides.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return float(interval)
+
+        return float(self._config.get("POLL_INTERVAL"))
+
+    async def start(self) -> None:
+        """
+        Acquire long-lived resources such as the pooled HTTP session,
+        observer delivery workers, the metrics endpoint and, in push
+        mode, the ingestion server, and expose the scheduler and
+        collector gauges.
+        """
+        self._register_gauges()
+        await self._collector.start()
+        await self._monitor.start()
+
+        if self._push_server is not None:
+            await self._push_server.start()
+
+        if self._metrics_server is not None:
+            await self._metrics_server.start()
+
+    async def close(self) -> None:
+        """
+        Release long-lived resources acquired by `start`.
+
+        The monitor is closed last, and even if closing anything else
+        fails, so queued alerts are delivered and buffered storage is
+        flushed on every shutdown path.
+        """
+        self._unregister_gauges()
+
+        try:
+            if self._metrics_server is not None:
+                await self._metrics_server.close()
+
+            if self._push_server is not None:
+                await self._push_server.close()
+
+            await self._collector.close()
+        finally:
+            await self._monitor.close()
+
+    async def run_once(self, endpoints: List[str] | None = None) -> int:
         """
         Execute a single monitoring cycle.
 
-        Fetches metrics from configured endpoints and evaluates
-        them against thresholds.
+        Fetches metrics from the given endpoints (this replica's shard of
+        the configured endpoints by default) concurrently and evaluates
+        each response against thresholds as soon as it arrives. A
+        payload that is not a metrics object, or whose evaluation fails,
+        is logged and counted in `stats` without ending the cycle.
+
+        Args:
+            endpoints (List[str] | None): Endpoints to poll in this cycle.
+
+        Returns:
+            int: Number of endpoint responses that were evaluated.
         """
-        endpoints = self._config.get("METRIC_ENDPOINTS", [])
+        if endpoints is None:
+            endpoints = self.owned_endpoints()
+
+        evaluated = 0
+
+        async for endpoint, metrics in self._collector.iter_collect(endpoints):
+            if not isinstance(metrics, dict):
+                self._stats["payloads_invalid"] += 1
+                logger.warning("Ignoring non-object payload from %s", endpoint)
+                continue
 
-        for endpoint in endpoints:
-            metrics = await self._fetcher.fetch_metrics(endpoint)
+            if not metrics or "error" in metrics:
+                continue
 
-            if metrics:
-                self._monitor.update_metrics(metrics)
+            try:
+                await self._monitor.update_metrics_async(metrics, endpoint)
+            except Exception:
+                self._stats["payloads_failed"] += 1
+                logger.exception("Failed to evaluate payload from %s", endpoint)
+            else:
+                evaluated += 1
+
+        return evaluated
 
     async def run_forever(self):
         """
         Run the monitoring loop continuously.
 
-        Periodically executes monitoring cycles based on the
-        configured polling interval and handles graceful shutdown.
+        Polls every endpoint of this replica's shard on a fixed-rate
+        schedule at its own interval (unless `POLL_ENABLED` is off),
+        accepts pushed metrics alongside polling in push mode, and
+        handles graceful shutdown.
         """
-        interval = int(self._config.get("POLL_INTERVAL", 5))
+        if self._config.get("POLL_ENABLED"):
+            for endpoint in self.owned_endpoints():
+                self._scheduler.add(endpoint, self._interval_for(endpoint))
 
+        await self.start()
         print(" Monitoring system running continuously")
 
         try:
-            while True:
-                await self.run_once()
-                await asyncio.sleep(interval)
+            await self._scheduler.run()
+            # Nothing left to poll: stay alive until cancelled.
+            await asyncio.Event().wait()
 
         except asyncio.CancelledError:
             print(" Monitoring system shutting down gracefully...")
             raise
 
+        finally:
+            await self.close()
+
 
 def main():
     """
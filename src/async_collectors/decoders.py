@@ -0,0 +1,151 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from src.metaclasses.config_manager import ConfigManager
+
+
+_BACKENDS: Dict[str, Callable[[bytes], Any]] = {"json": json.loads}
+
+if orjson is not None:
+    _BACKENDS["orjson"] = orjson.loads
+
+
+class PayloadTooLargeError(ValueError):
+    """
+    Raised when a response body exceeds the configured size limit.
+    """
+
+
+async def read_body(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+    """
+    Read a raw response body, refusing bodies above a size limit.
+
+    The declared ``Content-Length`` is checked before anything is read,
+    and the streamed size is checked again while reading so that
+    chunked responses cannot bypass the limit.
+
+    Args:
+        response (aiohttp.ClientResponse): Response to read.
+        max_bytes (int): Maximum accepted body size in bytes.
+
+    Returns:
+        bytes: Raw response body.
+
+    Raises:
+        PayloadTooLargeError: If the body exceeds `max_bytes`.
+    """
+    if response.content_length is not None and (
+        response.content_length > max_bytes
+    ):
+        raise PayloadTooLargeError(
+            f"Payload of {response.content_length} bytes exceeds limit"
+        )
+
+    body = bytearray()
+
+    async for chunk in response.content.iter_any():
+        body += chunk
+
+        if len(body) > max_bytes:
+            raise PayloadTooLargeError(
+                f"Payload exceeds limit of {max_bytes} bytes"
+            )
+
+    return bytes(body)
+
+
+class JsonDecoder:
+    """
+    Pluggable JSON decoder for raw response bodies.
+
+    Uses the fastest available backend (``orjson`` when installed,
+    otherwise the standard library) unless one is configured
+    explicitly. Bodies above the offload threshold are decoded on a
+    small thread pool so that a multi-megabyte document does not hold
+    the event loop for the whole parse.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the decoder.
+
+        Loads the backend name, size limit and offload threshold
+        using the ConfigManager.
+
+        Raises:
+            ValueError: If the configured backend is unavailable.
+        """
+        config = ConfigManager()
+        backend = config.get("DECODER_BACKEND")
+
+        if backend == "auto":
+            backend = "orjson" if "orjson" in _BACKENDS else "json"
+
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unsupported decoder backend: {backend}")
+
+        self.name = backend
+        self.max_bytes = int(config.get("MAX_PAYLOAD_BYTES"))
+        self._loads = _BACKENDS[backend]
+        self._offload_threshold = int(config.get("DECODE_OFFLOAD_BYTES"))
+        self._workers = int(config.get("DECODE_WORKERS"))
+        self._executor: ThreadPoolExecutor | None = None
+        self.offloaded = 0
+
+    def decode_bytes(self, body: bytes) -> Any:
+        """
+        Decode a JSON document synchronously.
+
+        Args:
+            body (bytes): Raw JSON document.
+
+        Returns:
+            Any: Decoded document.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return self._loads(body)
+
+    async def decode(self, body: bytes) -> Any:
+        """
+        Decode a JSON document, offloading large bodies to a thread.
+
+        Args:
+            body (bytes): Raw JSON document.
+
+        Returns:
+            Any: Decoded document.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        if len(body) < self._offload_threshold:
+            return self._loads(body)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers,
+                thread_name_prefix="json-decode",
+            )
+
+        self.offloaded += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._loads, body)
+
+    def close(self) -> None:
+        """
+        Shut down the offload thread pool, if it was started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
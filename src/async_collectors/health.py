@@ -0,0 +1,211 @@
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from src.metaclasses.config_manager import ConfigManager
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class EndpointHealth:
+    """
+    Health record of a single endpoint.
+
+    Holds only per-endpoint state; the thresholds and backoff policy
+    that act on it live in `CircuitBreaker`.
+    """
+
+    __slots__ = (
+        "state",
+        "failures",
+        "open_until",
+        "probe_in_flight",
+        "latencies",
+        "cached_timeout",
+    )
+
+    def __init__(self, window: int) -> None:
+        """
+        Initialize a healthy endpoint record.
+
+        Args:
+            window (int): Number of recent latencies kept for
+                adaptive timeout estimation.
+        """
+        self.state = CLOSED
+        self.failures = 0
+        self.open_until = 0.0
+        self.probe_in_flight = False
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.cached_timeout: float | None = None
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker with exponential backoff.
+
+    After `CB_FAILURE_THRESHOLD` consecutive failures an endpoint is
+    opened and skipped for a backoff period that doubles with every
+    further failure, with jitter so that endpoints failing together do
+    not recover in lockstep. Once the backoff expires a single half-open
+    probe is let through; its outcome closes or reopens the circuit.
+
+    Request timeouts adapt to each endpoint's observed latency: a high
+    percentile of recent successful fetches times a safety multiplier,
+    clamped between `CB_MIN_TIMEOUT` and the global `ASYNC_TIMEOUT`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Loads thresholds, backoff and adaptive timeout settings
+        using the ConfigManager.
+        """
+        config = ConfigManager()
+        self._threshold = int(config.get("CB_FAILURE_THRESHOLD"))
+        self._backoff_base = float(config.get("CB_BACKOFF_BASE"))
+        self._backoff_max = float(config.get("CB_BACKOFF_MAX"))
+        self._window = int(config.get("CB_LATENCY_WINDOW"))
+        self._percentile = float(config.get("CB_TIMEOUT_PERCENTILE"))
+        self._multiplier = float(config.get("CB_TIMEOUT_MULTIPLIER"))
+        self._min_timeout = float(config.get("CB_MIN_TIMEOUT"))
+        self._max_timeout = float(config.get("ASYNC_TIMEOUT"))
+        self._endpoints: Dict[str, EndpointHealth] = {}
+
+    def _health(self, url: str) -> EndpointHealth:
+        """
+        Return the health record of an endpoint, creating it if needed.
+
+        Args:
+            url (str): Metrics endpoint URL.
+
+        Returns:
+            EndpointHealth: Health record of the endpoint.
+        """
+        health = self._endpoints.get(url)
+
+        if health is None:
+            health = self._endpoints[url] = EndpointHealth(self._window)
+
+        return health
+
+    def allow(self, url: str) -> bool:
+        """
+        Decide whether a request to the endpoint may be sent now.
+
+        Args:
+            url (str): Metrics endpoint URL.
+
+        Returns:
+            bool: False while the circuit is open or a half-open
+            probe is already in flight, otherwise True.
+        """
+        health = self._health(url)
+
+        if health.state == CLOSED:
+            return True
+
+        if health.state == OPEN and time.monotonic() >= health.open_until:
+            health.state = HALF_OPEN
+
+        if health.state == HALF_OPEN and not health.probe_in_flight:
+            health.probe_in_flight = True
+            return True
+
+        return False
+
+    def timeout(self, url: str) -> float:
+        """
+        Compute the adaptive request timeout of an endpoint.
+
+        Args:
+            url (str): Metrics endpoint URL.
+
+        Returns:
+            float: Timeout in seconds. Falls back to `ASYNC_TIMEOUT`
+            until enough latency samples have been observed.
+        """
+        health = self._health(url)
+
+        if health.cached_timeout is None:
+            samples = sorted(health.latencies)
+
+            if len(samples) < min(10, self._window):
+                health.cached_timeout = self._max_timeout
+            else:
+                index = min(
+                    len(samples) - 1, int(self._percentile * len(samples))
+                )
+                health.cached_timeout = min(
+                    self._max_timeout,
+                    max(self._min_timeout, samples[index] * self._multiplier),
+                )
+
+        return health.cached_timeout
+
+    def record_success(self, url: str, latency: float) -> None:
+        """
+        Record a successful fetch and close the circuit.
+
+        Args:
+            url (str): Metrics endpoint URL.
+            latency (float): Observed request latency in seconds.
+        """
+        health = self._health(url)
+        health.state = CLOSED
+        health.failures = 0
+        health.probe_in_flight = False
+        health.latencies.append(latency)
+        health.cached_timeout = None
+
+    def record_failure(self, url: str) -> None:
+        """
+        Record a failed fetch and open the circuit if warranted.
+
+        Args:
+            url (str): Metrics endpoint URL.
+        """
+        health = self._health(url)
+        health.failures += 1
+        health.probe_in_flight = False
+
+        if health.state == HALF_OPEN or health.failures >= self._threshold:
+            exponent = max(0, health.failures - self._threshold)
+            delay = min(self._backoff_max, self._backoff_base * 2 ** exponent)
+            delay = delay / 2 + random.uniform(0, delay / 2)
+            health.state = OPEN
+            health.open_until = time.monotonic() + delay
+
+    def release(self, url: str) -> None:
+        """
+        Release a half-open probe whose request was abandoned.
+
+        Used when a fetch is cancelled before it produced an outcome,
+        so that the next tick may send a fresh probe.
+
+        Args:
+            url (str): Metrics endpoint URL.
+        """
+        self._health(url).probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report the health state of every known endpoint.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Circuit state, consecutive failures
+            and current adaptive timeout, keyed by endpoint URL.
+        """
+        return {
+            url: {
+                "state": health.state,
+                "failures": health.failures,
+                "timeout": self.timeout(url),
+            }
+            for url, health in self._endpoints.items()
+        }
@@ -1,10 +1,60 @@
 import asyncio
-from typing import List, Dict, Any
+import time
+from typing import AsyncIterator, List, Dict, Any, Tuple
 import aiohttp
 
+from src.async_collectors.decoders import (
+    JsonDecoder,
+    PayloadTooLargeError,
+    read_body,
+)
+from src.async_collectors.health import CircuitBreaker
+from src.instrumentation.registry import MetricsRegistry
 from src.metaclasses.config_manager import ConfigManager
 
 
+class CachedResponse:
+    """
+    Validators and last payload remembered for one endpoint.
+    """
+
+    __slots__ = ("etag", "last_modified", "payload")
+
+    def __init__(
+        self,
+        etag: str | None,
+        last_modified: str | None,
+        payload: Any
+    ) -> None:
+        """
+        Initialize a cached response.
+
+        Args:
+            etag (str | None): Value of the response ``ETag`` header.
+            last_modified (str | None): Value of the ``Last-Modified`` header.
+            payload (Any): Decoded response body.
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        self.payload = payload
+
+    def headers(self) -> Dict[str, str]:
+        """
+        Build conditional request headers from the stored validators.
+
+        Returns:
+            Dict[str, str]: ``If-None-Match`` and/or ``If-Modified-Since``.
+        """
+        headers = {}
+
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
 class AsyncMetricsCollector:
     """
     Asynchronously collects system or application metrics
@@ -12,17 +62,220 @@ class AsyncMetricsCollector:
 
     This class is designed for high-concurrency environments
     where metrics must be fetched in parallel with timeout handling.
+    A single pooled HTTP session is kept alive between collection
+    cycles so that connections to each endpoint are reused instead
+    of being re-established on every poll.
     """
 
     def __init__(self) -> None:
         """
         Initialize the AsyncMetricsCollector.
 
-        Loads configuration values such as request timeout
+        Loads configuration values such as request timeout,
+        connection pool limits and the fetch concurrency cap
         using the ConfigManager.
         """
         self._config = ConfigManager()
         self._timeout = self._config.get("ASYNC_TIMEOUT")
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore = asyncio.Semaphore(
+            int(self._config.get("FETCH_CONCURRENCY"))
+        )
+        self._breaker = CircuitBreaker()
+        self._decoder = JsonDecoder()
+        self._conditional = bool(self._config.get("CONDITIONAL_FETCH"))
+        self._delta = bool(self._config.get("DELTA_FETCH"))
+        self._responses: Dict[str, CachedResponse] = {}
+
+        registry = MetricsRegistry()
+        self._fetch_latency = registry.histogram(
+            "monitor_fetch_latency_seconds",
+            "Latency of metric fetches per endpoint.",
+            ("endpoint",),
+        )
+        self._decode_time = registry.histogram(
+            "monitor_decode_seconds",
+            "Time spent decoding metric payloads.",
+        )
+        self._fetch_errors = registry.counter(
+            "monitor_fetch_errors_total",
+            "Failed metric fetches by reason.",
+            ("reason",),
+        )
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "deadline_cancelled": 0,
+            "short_circuited": 0,
+            "conditional_requests": 0,
+            "not_modified": 0,
+            "bytes_decoded": 0,
+            "oversized_payloads": 0,
+            "invalid_payloads": 0,
+        }
+
+    @property
+    def started(self) -> bool:
+        """
+        Whether the pooled HTTP session is currently open.
+
+        Returns:
+            bool: True if `start` has been called and the session
+            has not been closed since.
+        """
+        return self._session is not None and not self._session.closed
+
+    def _build_connector(self) -> aiohttp.TCPConnector:
+        """
+        Build the pooled TCP connector from configuration.
+
+        Returns:
+            aiohttp.TCPConnector: Connector with total and per-host
+            limits, keep-alive and DNS caching applied.
+        """
+        return aiohttp.TCPConnector(
+            limit=int(self._config.get("HTTP_POOL_LIMIT")),
+            limit_per_host=int(self._config.get("HTTP_POOL_LIMIT_PER_HOST")),
+            keepalive_timeout=float(
+                self._config.get("HTTP_KEEPALIVE_TIMEOUT")
+            ),
+            ttl_dns_cache=int(self._config.get("HTTP_DNS_CACHE_TTL")),
+            use_dns_cache=True,
+        )
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build a trace config that counts new and reused connections.
+
+        Returns:
+            aiohttp.TraceConfig: Trace hooks updating collector stats.
+        """
+
+        async def on_request_start(session, context, params) -> None:
+            self._stats["requests"] += 1
+
+        async def on_connection_create_end(session, context, params) -> None:
+            self._stats["connections_created"] += 1
+
+        async def on_connection_reuseconn(session, context, params) -> None:
+            self._stats["connections_reused"] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    async def start(self) -> None:
+        """
+        Open the pooled HTTP session.
+
+        Calling this method on an already started collector is a no-op.
+        """
+        if self.started:
+            return
+
+        self._session = aiohttp.ClientSession(
+            connector=self._build_connector(),
+            timeout=aiohttp.ClientTimeout(total=self._timeout),
+            trace_configs=[self._build_trace_config()],
+        )
+
+    async def close(self) -> None:
+        """
+        Close the pooled HTTP session and release its connections.
+
+        Calling this method on a collector that is not started is a no-op.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+        self._decoder.close()
+
+    async def __aenter__(self) -> "AsyncMetricsCollector":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report connection pooling counters.
+
+        Returns:
+            Dict[str, float]: Request and connection counters, plus the
+            fraction of requests that were served on a reused connection
+            and the fraction of conditional requests answered with 304.
+        """
+        opened = self._stats["connections_created"]
+        reused = self._stats["connections_reused"]
+        total = opened + reused
+        conditional = self._stats["conditional_requests"]
+
+        return {
+            **self._stats,
+            "offloaded_decodes": self._decoder.offloaded,
+            "reuse_ratio": reused / total if total else 0.0,
+            "not_modified_ratio": (
+                self._stats["not_modified"] / conditional
+                if conditional else 0.0
+            ),
+        }
+
+    def health(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report per-endpoint circuit breaker state.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Circuit state, consecutive failures
+            and adaptive timeout, keyed by endpoint URL.
+        """
+        return self._breaker.snapshot()
+
+    def _remember(
+        self,
+        url: str,
+        response: aiohttp.ClientResponse,
+        payload: Any
+    ) -> Any:
+        """
+        Cache validators and payload of a full response.
+
+        In delta mode only the keys whose values changed since the
+        previous payload of the endpoint are returned.
+
+        Args:
+            url (str): Metrics endpoint URL.
+            response (aiohttp.ClientResponse): Full (non-304) response.
+            payload (Any): Decoded response body.
+
+        Returns:
+            Any: The payload, or its changed keys in delta mode.
+        """
+        previous = self._responses.get(url)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if self._delta or etag is not None or last_modified is not None:
+            self._responses[url] = CachedResponse(etag, last_modified, payload)
+
+        if (
+            self._delta
+            and previous is not None
+            and isinstance(payload, dict)
+            and isinstance(previous.payload, dict)
+        ):
+            old = previous.payload
+            return {
+                key: value
+                for key, value in payload.items()
+                if key not in old or old[key] != value
+            }
+
+        return payload
 
     async def _fetch_metrics(
         self,
@@ -32,6 +285,15 @@ class AsyncMetricsCollector:
         """
         Fetch metrics from a single HTTP endpoint.
 
+        The request timeout adapts to the endpoint's observed latency,
+        and the outcome is reported to the circuit breaker. When the
+        endpoint previously returned an ``ETag`` or ``Last-Modified``
+        header, a conditional request is sent; a ``304 Not Modified``
+        answer reuses the cached payload without decoding anything,
+        or yields an empty delta in delta mode. Full bodies are read as
+        raw bytes, bounded by `MAX_PAYLOAD_BYTES`, and decoded by the
+        configured `JsonDecoder`.
+
         Args:
             session (aiohttp.ClientSession): Shared HTTP session.
             url (str): Metrics endpoint URL.
@@ -40,17 +302,131 @@ class AsyncMetricsCollector:
             Dict[str, Any]: Parsed JSON response on success,
             or an error dictionary containing the failure reason.
         """
+        timeout = aiohttp.ClientTimeout(total=self._breaker.timeout(url))
+        cached = self._responses.get(url) if self._conditional else None
+        headers = cached.headers() if cached is not None else None
+        started = time.monotonic()
+
+        if headers:
+            self._stats["conditional_requests"] += 1
+
         try:
-            async with session.get(url, timeout=self._timeout) as response:
-                response.raise_for_status()
-                return await response.json()
+            async with session.get(
+                url, timeout=timeout, headers=headers
+            ) as response:
+                if response.status == 304 and cached is not None:
+                    self._stats["not_modified"] += 1
+                    metrics = {} if self._delta else cached.payload
+                else:
+                    response.raise_for_status()
+                    body = await read_body(response, self._decoder.max_bytes)
+                    self._stats["bytes_decoded"] += len(body)
+                    decode_started = time.perf_counter()
+                    payload = await self._decoder.decode(body)
+                    self._decode_time.observe(
+                        time.perf_counter() - decode_started
+                    )
+                    metrics = self._remember(url, response, payload)
 
         except asyncio.TimeoutError:
+            self._breaker.record_failure(url)
+            self._fetch_errors.labels("timeout").inc()
             return {"error": "timeout", "url": url}
 
         except aiohttp.ClientError as exc:
+            self._breaker.record_failure(url)
+            self._fetch_errors.labels("client_error").inc()
             return {"error": str(exc), "url": url}
 
+        except PayloadTooLargeError:
+            self._stats["oversized_payloads"] += 1
+            self._breaker.record_failure(url)
+            self._fetch_errors.labels("payload_too_large").inc()
+            return {"error": "payload_too_large", "url": url}
+
+        except ValueError:
+            self._stats["invalid_payloads"] += 1
+            self._breaker.record_failure(url)
+            self._fetch_errors.labels("invalid_json").inc()
+            return {"error": "invalid_json", "url": url}
+
+        latency = time.monotonic() - started
+        self._fetch_latency.labels(url).observe(latency)
+        self._breaker.record_success(url, latency)
+        return metrics
+
+    async def _bounded_fetch(self, url: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Fetch a single endpoint while holding a concurrency slot.
+
+        Endpoints whose circuit is open are answered immediately
+        with a ``circuit_open`` error and never take a slot.
+
+        Args:
+            url (str): Metrics endpoint URL.
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The endpoint URL paired with
+            its metric response or error object.
+        """
+        if not self._breaker.allow(url):
+            self._stats["short_circuited"] += 1
+            self._fetch_errors.labels("circuit_open").inc()
+            return url, {"error": "circuit_open", "url": url}
+
+        try:
+            async with self._semaphore:
+                return url, await self._fetch_metrics(self._session, url)
+
+        except asyncio.CancelledError:
+            self._breaker.release(url)
+            raise
+
+    async def iter_collect(
+        self,
+        endpoints: List[str],
+        deadline: float | None = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Fetch all endpoints concurrently and yield results as they arrive.
+
+        At most `FETCH_CONCURRENCY` requests are in flight at once.
+        Endpoints that have not answered when the cycle deadline
+        expires are cancelled and counted in `deadline_cancelled`.
+
+        Args:
+            endpoints (List[str]): List of metrics endpoint URLs.
+            deadline (float | None): Seconds allowed for the whole cycle.
+                Defaults to the `CYCLE_DEADLINE` configuration value.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: Endpoint URL and its metric
+            response or error object, in completion order.
+        """
+        if not endpoints:
+            return
+
+        if deadline is None:
+            deadline = float(self._config.get("CYCLE_DEADLINE"))
+
+        await self.start()
+
+        tasks = [
+            asyncio.create_task(self._bounded_fetch(url))
+            for url in endpoints
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=deadline):
+                yield await next_done
+
+        except asyncio.TimeoutError:
+            pending = [task for task in tasks if not task.done()]
+            self._stats["deadline_cancelled"] += len(pending)
+
+        finally:
+            await shutdown([task for task in tasks if not task.done()])
+
     async def collect(
         self,
         endpoints: List[str]
@@ -58,6 +434,9 @@ class AsyncMetricsCollector:
         """
         Collect metrics concurrently from multiple endpoints.
 
+        The pooled session is opened on first use if `start`
+        has not been called explicitly.
+
         Args:
             endpoints (List[str]): List of metrics endpoint URLs.
 
@@ -65,13 +444,18 @@ class AsyncMetricsCollector:
             List[Dict[str, Any]]: List of metric responses or error objects,
             one per endpoint, preserving input order.
         """
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                asyncio.create_task(self._fetch_metrics(session, url))
-                for url in endpoints
-            ]
+        if not endpoints:
+            return []
+
+        await self.start()
+
+        tasks = [
+            asyncio.create_task(self._bounded_fetch(url))
+            for url in endpoints
+        ]
 
-            return await asyncio.gather(*tasks, return_exceptions=False)
+        results = await asyncio.gather(*tasks, return_exceptions=False)
+        return [metrics for _, metrics in results]
 
 
 async def shutdown(tasks: List[asyncio.Task]) -> None:
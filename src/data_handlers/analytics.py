@@ -1,6 +1,159 @@
+import warnings
+
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from src.data_handlers.sketches import DDSketch
+from src.metaclasses.config_manager import ConfigManager
+
+if TYPE_CHECKING:
+    from src.timeseries.ring import RingBufferHistory
+
+
+PERCENTILES = [0.25, 0.50, 0.75, 0.95]
+
+
+def iqr_mask(
+    values: np.ndarray,
+    axis: int = 0,
+    quartiles: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Flag values more than 1.5 IQR outside the quartiles of their series.
+
+    Args:
+        values (np.ndarray): 2-D array of series, NaN where missing.
+        axis (int): Axis running along each series: 0 for one series
+            per column, 1 for one series per row.
+        quartiles (np.ndarray | None): First and third quartiles of
+            every series, stacked, when already computed.
+
+    Returns:
+        np.ndarray: Boolean array shaped like `values`.
+    """
+    if not values.size:
+        return np.zeros(values.shape, dtype=bool)
+
+    if quartiles is None:
+        with warnings.catch_warnings():
+            # All-NaN series have no quartiles and flag nothing.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            quartiles = np.nanquantile(values, [0.25, 0.75], axis=axis)
+
+    q1 = np.expand_dims(quartiles[0], axis)
+    q3 = np.expand_dims(quartiles[1], axis)
+    iqr = q3 - q1
+    return (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+
+
+class StreamingPercentiles:
+    """
+    Streaming percentile estimates for many series.
+
+    Keeps one `DDSketch` per series, so adding a sample is O(1), memory
+    per series is bounded by the sketch bucket limit regardless of how
+    many samples arrive, and estimates from different hosts or replicas
+    can be merged. Every estimate is within `SKETCH_RELATIVE_ACCURACY`
+    (1% by default) relative error of the exact lower-rank quantile.
+    """
+
+    def __init__(self, relative_accuracy: float | None = None) -> None:
+        """
+        Initialize an empty set of sketches.
+
+        Args:
+            relative_accuracy (float | None): Relative error bound.
+                Defaults to `SKETCH_RELATIVE_ACCURACY`.
+        """
+        if relative_accuracy is None:
+            relative_accuracy = ConfigManager().get("SKETCH_RELATIVE_ACCURACY")
+
+        self.relative_accuracy = float(relative_accuracy)
+        self._sketches: Dict[str, DDSketch] = {}
+
+    def sketch(self, series: str) -> DDSketch:
+        """
+        Get or create the sketch of a series.
+
+        Args:
+            series (str): Series name.
+
+        Returns:
+            DDSketch: Sketch of the series.
+        """
+        sketch = self._sketches.get(series)
+
+        if sketch is None:
+            sketch = self._sketches[series] = DDSketch(self.relative_accuracy)
+
+        return sketch
+
+    def add(self, series: str, value: float) -> None:
+        """
+        Add one sample of a series.
+
+        Args:
+            series (str): Series name.
+            value (float): Sample value.
+        """
+        self.sketch(series).add(value)
+
+    def update(self, metrics: Dict[str, float]) -> None:
+        """
+        Add one sample of every metric in a payload.
+
+        Args:
+            metrics (Dict[str, float]): Mapping of series names to values.
+        """
+        for series, value in metrics.items():
+            self.sketch(series).add(value)
+
+    def extend(self, series: str, values: Iterable[float]) -> None:
+        """
+        Add many samples of a series at once.
+
+        Args:
+            series (str): Series name.
+            values (Iterable[float]): Sample values.
+        """
+        self.sketch(series).extend(values)
+
+    def merge(self, other: "StreamingPercentiles") -> None:
+        """
+        Fold the sketches of another instance into this one.
+
+        Args:
+            other (StreamingPercentiles): Estimates with the same accuracy,
+                e.g. from another host or replica.
+        """
+        for series, sketch in other._sketches.items():
+            self.sketch(series).merge(sketch)
+
+    def percentiles(
+        self,
+        quantiles: List[float] | None = None
+    ) -> pd.DataFrame:
+        """
+        Estimate percentiles of every series.
+
+        Args:
+            quantiles (List[float] | None): Quantiles to estimate.
+                Defaults to the 25th, 50th, 75th and 95th percentiles.
+
+        Returns:
+            pd.DataFrame: Estimates indexed by quantile, one column per
+            series, shaped like `MetricsAnalytics.percentiles`.
+        """
+        quantiles = PERCENTILES if quantiles is None else quantiles
+
+        return pd.DataFrame(
+            {
+                series: sketch.quantiles(quantiles)
+                for series, sketch in self._sketches.items()
+            },
+            index=quantiles,
+        )
 
 
 class MetricsAnalytics:
@@ -11,46 +164,142 @@ class MetricsAnalytics:
     utility methods for percentile analysis and anomaly detection.
     """
 
-    def __init__(self, metrics: Dict[str, list[float]]) -> None:
+    def __init__(
+        self,
+        metrics: Dict[str, list[float]],
+        copy: bool = True
+    ) -> None:
         """
         Initialize MetricsAnalytics with metric data.
 
+        Series of different lengths, such as history ranges of metrics
+        that were not always reported together, are padded with NaN,
+        which the statistics below skip.
+
         Args:
             metrics (Dict[str, list[float]]): Dictionary where keys are metric
-            names and values are lists of numeric observations.
+            names and values are lists or arrays of numeric observations.
+            copy (bool): Whether to copy NumPy arrays of equal length
+                into the DataFrame. When False the columns share memory
+                with the arrays.
+        """
+        if len({len(values) for values in metrics.values()}) > 1:
+            metrics = {
+                name: pd.Series(values) for name, values in metrics.items()
+            }
+
+        self.df = pd.DataFrame(metrics, copy=copy)
+
+    @classmethod
+    def from_history(
+        cls,
+        history: "RingBufferHistory",
+        endpoint: str,
+        metrics: Iterable[str] | None = None,
+        n: int | None = None
+    ) -> "MetricsAnalytics":
+        """
+        Analyze the newest samples held in a ring-buffer history.
+
+        The DataFrame columns are zero-copy views of the ring, aligned
+        on the newest sample. They are overwritten once the history
+        records `capacity - n` more samples, so analyze right away or
+        call ``df.copy()`` first.
+
+        Args:
+            history (RingBufferHistory): History holding the samples.
+            endpoint (str): Endpoint that reports the metrics.
+            metrics (Iterable[str] | None): Metric names; all metrics of
+                the endpoint when omitted.
+            n (int | None): Number of newest samples per metric.
+
+        Returns:
+            MetricsAnalytics: Analytics over the selected window.
         """
-        self.df = pd.DataFrame(metrics)
+        return cls(history.window(endpoint, metrics, n), copy=False)
 
-    def percentiles(self) -> pd.DataFrame:
+    def percentiles(self, method: str = "exact") -> pd.DataFrame:
         """
         Compute key percentiles for all metrics.
 
+        The ``"exact"`` method sorts every column and interpolates
+        linearly between ranks. The ``"sketch"`` method loads each column
+        into a `DDSketch` without sorting; each estimate is within
+        `SKETCH_RELATIVE_ACCURACY` relative error of the exact lower-rank
+        value, so it differs from the interpolated exact result by at
+        most that error plus the gap between neighbouring samples.
+
+        Args:
+            method (str): ``"exact"`` or ``"sketch"``.
+
         Returns:
             pd.DataFrame: DataFrame containing 25th, 50th, 75th,
             and 95th percentiles for each metric.
+
+        Raises:
+            ValueError: If the method is unsupported.
+        """
+        if method == "exact":
+            return self.df.quantile(PERCENTILES)
+
+        if method != "sketch":
+            raise ValueError(f"Unsupported percentile method: {method}")
+
+        streaming = StreamingPercentiles()
+
+        for column in self.df.columns:
+            streaming.extend(column, self.df[column].to_numpy(np.float64))
+
+        return streaming.percentiles()
+
+    def anomaly_mask(self) -> np.ndarray:
         """
-        return self.df.quantile([0.25, 0.50, 0.75, 0.95])
+        Flag anomalous cells using the Interquartile Range (IQR) method.
+
+        All first and third quartiles are computed in a single NumPy
+        call over the 2-D array, and the bounds are applied to every
+        column at once.
+
+        Returns:
+            np.ndarray: Boolean array shaped like the data, True where a
+            value lies more than 1.5 IQR outside its column's quartiles.
+        """
+        return iqr_mask(self.df.to_numpy(np.float64))
+
+    def anomaly_rows(self) -> np.ndarray:
+        """
+        Find the rows holding at least one anomalous value.
+
+        Returns:
+            np.ndarray: Row positions in ascending order.
+        """
+        return np.flatnonzero(self.anomaly_mask().any(axis=1))
 
     def detect_anomalies(self) -> pd.DataFrame:
         """
         Detect anomalies using the Interquartile Range (IQR) method.
 
         This approach is robust for small and non-normally distributed datasets.
+        Rows are ordered by the first column that flags them, then by
+        position, and rows with identical values are reported once.
 
         Returns:
             pd.DataFrame: Rows containing anomalous values across all metrics.
         """
-        anomalies = pd.DataFrame()
-
-        for column in self.df.columns:
-            q1 = self.df[column].quantile(0.25)
-            q3 = self.df[column].quantile(0.75)
-            iqr = q3 - q1
+        if not len(self.df.columns):
+            return pd.DataFrame()
 
-            lower = q1 - 1.5 * iqr
-            upper = q3 + 1.5 * iqr
+        values = self.df.to_numpy(np.float64)
+        mask = iqr_mask(values)
+        rows = np.flatnonzero(mask.any(axis=1))
+        first = mask[rows].argmax(axis=1)
+        order = rows[np.lexsort((rows, first))]
+        anomalies = self.df.iloc[order]
 
-            mask = (self.df[column] < lower) | (self.df[column] > upper)
-            anomalies = pd.concat([anomalies, self.df[mask]])
+        # Rows cannot repeat if one column is already unique; skip the
+        # costly whole-row hashing of drop_duplicates in that case.
+        probe = values[order, 0]
+        if np.unique(probe).size == probe.size and not np.isnan(probe).any():
+            return anomalies
 
         return anomalies.drop_duplicates()
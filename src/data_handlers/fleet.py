@@ -0,0 +1,366 @@
+import math
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data_handlers.analytics import PERCENTILES, iqr_mask
+from src.instrumentation.registry import MetricsRegistry
+from src.metaclasses.config_manager import ConfigManager
+
+if TYPE_CHECKING:
+    from src.timeseries.ring import RingBufferHistory
+
+
+COLUMNS = PERCENTILES + ["anomalies", "count"]
+
+
+def _analyze_block(block: np.ndarray) -> np.ndarray:
+    """
+    Compute percentiles and IQR anomaly counts for rows of series.
+
+    Args:
+        block (np.ndarray): One series per row, padded with NaN.
+
+    Returns:
+        np.ndarray: One row per series holding the `PERCENTILES`, the
+        number of anomalous samples and the number of samples.
+    """
+    result = np.empty((len(block), len(COLUMNS)))
+
+    if not block.size:
+        result[:, :len(PERCENTILES)] = np.nan
+        result[:, len(PERCENTILES):] = 0
+        return result
+
+    with warnings.catch_warnings():
+        # All-NaN series have no percentiles and flag nothing.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        quantiles = np.nanquantile(block, PERCENTILES, axis=1)
+
+    mask = iqr_mask(block, axis=1,
+                    quartiles=quantiles[[PERCENTILES.index(0.25),
+                                         PERCENTILES.index(0.75)]])
+
+    result[:, :len(PERCENTILES)] = quantiles.T
+    result[:, -2] = mask.sum(axis=1)
+    result[:, -1] = np.count_nonzero(~np.isnan(block), axis=1)
+    return result
+
+
+def _analyze_shared(
+    name: str,
+    offset: int,
+    shape: Tuple[int, int]
+) -> Tuple[int, np.ndarray, float]:
+    """
+    Analyze one chunk of a shared-memory segment in a worker.
+
+    Args:
+        name (str): Shared memory segment name.
+        offset (int): Byte offset of the chunk's float64 block.
+        shape (Tuple[int, int]): Series and padded length of the chunk.
+
+    Returns:
+        Tuple[int, np.ndarray, float]: Chunk offset, chunk results and
+        the seconds spent computing them.
+    """
+    started = time.perf_counter()
+    segment = shared_memory.SharedMemory(name=name)
+
+    try:
+        block = np.ndarray(shape, np.float64, buffer=segment.buf,
+                           offset=offset)
+        result = _analyze_block(block)
+        del block
+    finally:
+        segment.close()
+
+    return offset, result, time.perf_counter() - started
+
+
+class FleetAnalyticsRunner:
+    """
+    Runs percentile and anomaly analysis over many series in parallel.
+
+    Series are ordered by length and split into chunks of at most
+    `FLEET_CHUNK_SERIES` series, each packed into its own NaN-padded
+    2-D float64 block padded only to the longest series of the chunk,
+    so a few long series do not inflate every row. For pooled runs the
+    blocks are written once into shared memory, which worker processes
+    read directly, so only chunk bounds and the small per-series
+    results cross process boundaries.
+
+    Inputs smaller than `FLEET_MIN_PARALLEL_SAMPLES` samples, or runs
+    with a single worker, are analyzed in the calling process, where
+    pool overhead would outweigh the parallel speedup. The pool is
+    started on first use and reused until `close`.
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            workers (int | None): Worker processes. Defaults to
+                `FLEET_WORKERS`, where 0 means one per available core.
+        """
+        config = ConfigManager()
+        self._cores = len(os.sched_getaffinity(0)) if hasattr(
+            os, "sched_getaffinity"
+        ) else os.cpu_count() or 1
+        self.workers = int(workers or config.get("FLEET_WORKERS")
+                           or self._cores)
+        self._chunk_series = int(config.get("FLEET_CHUNK_SERIES"))
+        self._min_parallel = int(config.get("FLEET_MIN_PARALLEL_SAMPLES"))
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._stats: Dict[str, Any] = {"runs": 0}
+        self._run_time = MetricsRegistry().histogram(
+            "monitor_fleet_analysis_seconds",
+            "Time spent analyzing all series of one fleet analysis run.",
+        )
+
+    def _executor(self) -> ProcessPoolExecutor:
+        """
+        Start the worker pool once.
+
+        Returns:
+            ProcessPoolExecutor: Shared pool.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+            return self._pool
+
+    @staticmethod
+    def _chunks(
+        lengths: np.ndarray,
+        size: int
+    ) -> List[Tuple[np.ndarray, int]]:
+        """
+        Group series of similar length into chunks.
+
+        Args:
+            lengths (np.ndarray): Length of every series.
+            size (int): Maximum series per chunk.
+
+        Returns:
+            List[Tuple[np.ndarray, int]]: Input positions of the series
+            of each chunk and the chunk's padded length.
+        """
+        order = np.argsort(lengths, kind="stable")
+        return [
+            (order[start:start + size],
+             int(lengths[order[start:start + size]].max()))
+            for start in range(0, len(order), size)
+        ]
+
+    def analyze(self, series: Dict[Hashable, Any]) -> pd.DataFrame:
+        """
+        Analyze every series.
+
+        Args:
+            series (Dict[Hashable, Any]): Values keyed by series, such as
+                (endpoint, metric) pairs. Series may differ in length.
+
+        Returns:
+            pd.DataFrame: One row per series with its `PERCENTILES`, the
+            number of IQR anomalies and the number of samples.
+        """
+        started = time.perf_counter()
+        keys = list(series)
+        arrays = [np.asarray(values, np.float64) for values in series.values()]
+        lengths = np.fromiter((len(a) for a in arrays), np.intp, len(arrays))
+        samples = int(lengths.sum())
+        parallel = (self.workers > 1 and len(arrays) > 1
+                    and samples >= self._min_parallel)
+
+        if parallel:
+            size = min(self._chunk_series,
+                       math.ceil(len(arrays) / self.workers))
+            chunks = self._chunks(lengths, size)
+            results, busy = self._run_parallel(arrays, chunks)
+        else:
+            chunks = self._chunks(lengths, self._chunk_series)
+            results = self._run_inline(arrays, chunks)
+            busy = time.perf_counter() - started
+
+        elapsed = time.perf_counter() - started
+        self._run_time.observe(elapsed)
+        self._stats = {
+            "runs": self._stats["runs"] + 1,
+            "mode": "process" if parallel else "inline",
+            "series": len(arrays),
+            "samples": samples,
+            "cells": sum(len(rows) * width for rows, width in chunks),
+            "chunks": len(chunks),
+            "workers": self.workers if parallel else 1,
+            "cores": self._cores,
+            "seconds": elapsed,
+            "busy_seconds": busy,
+        }
+
+        return pd.DataFrame(results, index=pd.Index(keys), columns=COLUMNS)
+
+    @staticmethod
+    def _fill(
+        block: np.ndarray,
+        arrays: List[np.ndarray],
+        rows: np.ndarray
+    ) -> None:
+        """
+        Copy series into a NaN-padded chunk block.
+
+        Args:
+            block (np.ndarray): Chunk block, one row per series.
+            arrays (List[np.ndarray]): Series values.
+            rows (np.ndarray): Input positions of the chunk's series.
+        """
+        block.fill(np.nan)
+
+        for row, index in enumerate(rows.tolist()):
+            block[row, :len(arrays[index])] = arrays[index]
+
+    def _run_inline(
+        self,
+        arrays: List[np.ndarray],
+        chunks: List[Tuple[np.ndarray, int]]
+    ) -> np.ndarray:
+        """
+        Analyze series in the calling process, one chunk at a time.
+
+        Chunking keeps the working set of each quantile pass small,
+        which is markedly faster than one pass over a large block.
+
+        Args:
+            arrays (List[np.ndarray]): Series values.
+            chunks (List[Tuple[np.ndarray, int]]): Chunks from `_chunks`.
+
+        Returns:
+            np.ndarray: Results in input order.
+        """
+        results = np.empty((len(arrays), len(COLUMNS)))
+
+        for rows, width in chunks:
+            block = np.empty((len(rows), width))
+            self._fill(block, arrays, rows)
+            results[rows] = _analyze_block(block)
+
+        return results
+
+    def _run_parallel(
+        self,
+        arrays: List[np.ndarray],
+        chunks: List[Tuple[np.ndarray, int]]
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Pack chunks into shared memory and analyze them on the pool.
+
+        Args:
+            arrays (List[np.ndarray]): Series values.
+            chunks (List[Tuple[np.ndarray, int]]): Chunks from `_chunks`.
+
+        Returns:
+            Tuple[np.ndarray, float]: Results in input order and total
+            worker compute time.
+        """
+        offsets = np.cumsum(
+            [0] + [len(rows) * width * 8 for rows, width in chunks]
+        ).tolist()
+        segment = shared_memory.SharedMemory(
+            create=True, size=max(1, offsets[-1])
+        )
+
+        try:
+            for (rows, width), offset in zip(chunks, offsets):
+                block = np.ndarray((len(rows), width), np.float64,
+                                   buffer=segment.buf, offset=offset)
+                self._fill(block, arrays, rows)
+                del block
+
+            futures = [
+                self._executor().submit(
+                    _analyze_shared, segment.name, offset, (len(rows), width)
+                )
+                for (rows, width), offset in zip(chunks, offsets)
+            ]
+            rows_at = {offset: rows
+                       for (rows, _), offset in zip(chunks, offsets)}
+            results = np.empty((len(arrays), len(COLUMNS)))
+            busy = 0.0
+
+            for future in futures:
+                offset, chunk, seconds = future.result()
+                results[rows_at[offset]] = chunk
+                busy += seconds
+        finally:
+            segment.close()
+            segment.unlink()
+
+        return results, busy
+
+    def analyze_history(
+        self,
+        history: "RingBufferHistory",
+        n: int | None = None
+    ) -> pd.DataFrame:
+        """
+        Analyze the newest samples of every series in a ring history.
+
+        Args:
+            history (RingBufferHistory): History holding the samples.
+            n (int | None): Number of newest samples per series.
+
+        Returns:
+            pd.DataFrame: Results indexed by (endpoint, metric).
+        """
+        return self.analyze({
+            (endpoint, metric): history.last(endpoint, metric, n)[1]
+            for endpoint, metric in history.series()
+        })
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool.
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the last run.
+
+        ``utilization`` is the worker compute time divided by the wall
+        time of the run, i.e. the average number of cores kept busy; it
+        is not a speedup over the inline path, which the run does not
+        measure. ``efficiency`` is the utilization divided by the cores
+        the run could use. ``cells`` counts the padded block entries
+        analyzed for the ``samples``.
+
+        Returns:
+            Dict[str, Any]: Run count, mode, series, samples, cells,
+            chunks, workers, cores, wall and compute seconds,
+            utilization and efficiency.
+        """
+        stats = dict(self._stats)
+
+        if "seconds" in stats:
+            stats["utilization"] = (
+                stats["busy_seconds"] / stats["seconds"]
+                if stats["seconds"] else 0.0
+            )
+            stats["efficiency"] = (
+                stats["utilization"] / min(stats["workers"], stats["cores"])
+            )
+
+        return stats
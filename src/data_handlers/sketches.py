@@ -0,0 +1,376 @@
+import math
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+MIN_INDEXABLE = 1e-9
+
+
+class DDSketch:
+    """
+    Mergeable quantile sketch with a relative error guarantee.
+
+    Values are counted in logarithmically sized buckets: with relative
+    accuracy ``alpha`` every bucket spans ``(gamma^(k-1), gamma^k]`` with
+    ``gamma = (1 + alpha) / (1 - alpha)``, so any quantile is returned
+    within ``alpha`` relative error of the exact lower-rank value
+    (``values[floor(q * (n - 1))]`` of the sorted data).
+
+    Adding a value is O(1), memory is bounded by `max_bins` buckets per
+    sign, and two sketches with the same accuracy merge by adding
+    their bucket counts, so sketches built on different hosts or
+    replicas combine into the sketch of the union. When the bucket
+    limit is reached the lowest buckets are collapsed, which only
+    affects the accuracy of the lowest quantiles.
+    """
+
+    __slots__ = ("alpha", "max_bins", "count", "zero_count", "sum", "min",
+                 "max", "_gamma", "_log_gamma", "_positive", "_negative")
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        max_bins: int = 2048
+    ) -> None:
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy (float): Relative error bound ``alpha``,
+                between 0 and 1.
+            max_bins (int): Maximum number of buckets per sign.
+
+        Raises:
+            ValueError: If the accuracy or bucket limit is out of range.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"Relative accuracy must be in (0, 1): {relative_accuracy}"
+            )
+
+        if max_bins < 1:
+            raise ValueError(f"Bucket limit must be positive: {max_bins}")
+
+        self.alpha = relative_accuracy
+        self.max_bins = max_bins
+        self.count = 0
+        self.zero_count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+
+    def _key(self, value: float) -> int:
+        """
+        Bucket index of a positive value.
+
+        Args:
+            value (float): Value above `MIN_INDEXABLE`.
+
+        Returns:
+            int: Bucket index.
+        """
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        """
+        Representative value of a bucket.
+
+        Args:
+            key (int): Bucket index.
+
+        Returns:
+            float: Value within ``alpha`` of every value in the bucket.
+        """
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _collapse(self, bins: Dict[int, int]) -> None:
+        """
+        Merge the lowest buckets until the bucket limit is respected.
+
+        Args:
+            bins (Dict[int, int]): Buckets of one sign.
+        """
+        keys = sorted(bins)
+        excess = len(keys) - self.max_bins
+
+        if excess > 0:
+            target = keys[excess]
+            bins[target] += sum(bins.pop(key) for key in keys[:excess])
+
+    def add(self, value: float) -> None:
+        """
+        Add one value to the sketch. NaN and infinite values are ignored.
+
+        Args:
+            value (float): Observed value.
+        """
+        if not math.isfinite(value):
+            return
+
+        self.count += 1
+        self.sum += value
+
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value > MIN_INDEXABLE:
+            bins = self._positive
+            key = self._key(value)
+        elif value < -MIN_INDEXABLE:
+            bins = self._negative
+            key = self._key(-value)
+        else:
+            self.zero_count += 1
+            return
+
+        bins[key] = bins.get(key, 0) + 1
+
+        if len(bins) > self.max_bins:
+            self._collapse(bins)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Add many values to the sketch at once.
+
+        Bucket indexes are computed with NumPy, so bulk loading costs a
+        few vectorized passes instead of one Python call per value.
+        NaN and infinite values are ignored.
+
+        Args:
+            values (Iterable[float]): Observed values.
+        """
+        values = np.asarray(
+            values if hasattr(values, "__len__") else list(values),
+            dtype=np.float64,
+        ).ravel()
+        values = values[np.isfinite(values)]
+
+        if not values.size:
+            return
+
+        self.count += int(values.size)
+        self.sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        for bins, magnitudes in (
+            (self._positive, values[values > MIN_INDEXABLE]),
+            (self._negative, -values[values < -MIN_INDEXABLE]),
+        ):
+            if not magnitudes.size:
+                continue
+
+            keys, counts = np.unique(
+                np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64),
+                return_counts=True,
+            )
+
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                bins[key] = bins.get(key, 0) + count
+
+            if len(bins) > self.max_bins:
+                self._collapse(bins)
+
+        self.zero_count += int(
+            np.count_nonzero(np.abs(values) <= MIN_INDEXABLE)
+        )
+
+    def merge(self, other: "DDSketch") -> None:
+        """
+        Add the contents of another sketch to this one.
+
+        Args:
+            other (DDSketch): Sketch with the same relative accuracy.
+
+        Raises:
+            ValueError: If the sketches use different accuracies.
+        """
+        if other.alpha != self.alpha:
+            raise ValueError("Cannot merge sketches of different accuracy")
+
+        if not other.count:
+            return
+
+        for mine, theirs in ((self._positive, other._positive),
+                             (self._negative, other._negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            if len(mine) > self.max_bins:
+                self._collapse(mine)
+
+        self.count += other.count
+        self.zero_count += other.zero_count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def bins(self) -> Tuple[List[int], List[int]]:
+        """
+        Export the bucket counts as two integer lists.
+
+        Each bucket is encoded as ``2 * key`` for positive values and
+        ``2 * key + 1`` for negative values, so the bins of many
+        sketches can be stored in flat integer arrays. Zero values are
+        not part of the bins; see `zero_count`.
+
+        Returns:
+            Tuple[List[int], List[int]]: Bucket codes and counts.
+        """
+        codes = [2 * key for key in self._positive]
+        codes.extend(2 * key + 1 for key in self._negative)
+        counts = list(self._positive.values())
+        counts.extend(self._negative.values())
+        return codes, counts
+
+    def add_bins(
+        self,
+        codes: np.ndarray,
+        counts: np.ndarray,
+        zero_count: int,
+        total: float,
+        minimum: float,
+        maximum: float
+    ) -> None:
+        """
+        Add pre-aggregated bucket counts exported with `bins`.
+
+        Codes may repeat, e.g. when the bins of several sketches are
+        concatenated; their counts are summed.
+
+        Args:
+            codes (np.ndarray): Bucket codes, as returned by `bins`.
+            counts (np.ndarray): Count of each code.
+            zero_count (int): Number of zero values.
+            total (float): Sum of the values.
+            minimum (float): Smallest value.
+            maximum (float): Largest value.
+        """
+        codes = np.asarray(codes, np.int64)
+        counts = np.asarray(counts, np.int64)
+        unique, inverse = np.unique(codes, return_inverse=True)
+        summed = np.bincount(inverse, counts, len(unique)).astype(np.int64)
+
+        for code, count in zip(unique.tolist(), summed.tolist()):
+            bins = self._negative if code & 1 else self._positive
+            key = code >> 1
+            bins[key] = bins.get(key, 0) + count
+
+        for bins in (self._positive, self._negative):
+            if len(bins) > self.max_bins:
+                self._collapse(bins)
+
+        self.count += int(counts.sum()) + int(zero_count)
+        self.zero_count += int(zero_count)
+        self.sum += total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    def quantiles(self, quantiles: Iterable[float]) -> List[float]:
+        """
+        Estimate several quantiles in one pass over the buckets.
+
+        Args:
+            quantiles (Iterable[float]): Quantiles between 0 and 1.
+
+        Returns:
+            List[float]: Estimates in the order requested; NaN for an
+            empty sketch.
+
+        Raises:
+            ValueError: If a quantile is outside [0, 1].
+        """
+        quantiles = list(quantiles)
+
+        if any(not 0 <= q <= 1 for q in quantiles):
+            raise ValueError(f"Quantiles must be in [0, 1]: {quantiles}")
+
+        if not self.count:
+            return [math.nan] * len(quantiles)
+
+        buckets = [
+            (-self._value(key), count)
+            for key, count in sorted(self._negative.items(), reverse=True)
+        ]
+        buckets.append((0.0, self.zero_count))
+        buckets.extend(
+            (self._value(key), count)
+            for key, count in sorted(self._positive.items())
+        )
+
+        order = sorted(range(len(quantiles)), key=quantiles.__getitem__)
+        results = [math.nan] * len(quantiles)
+        index, seen = 0, buckets[0][1]
+
+        for position in order:
+            rank = math.floor(quantiles[position] * (self.count - 1))
+
+            while seen <= rank:
+                index += 1
+                seen += buckets[index][1]
+
+            results[position] = min(max(buckets[index][0], self.min), self.max)
+
+        return results
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate one quantile.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            float: Estimate within the relative accuracy of the exact
+            lower-rank value; NaN for an empty sketch.
+        """
+        return self.quantiles([q])[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the sketch to JSON-compatible data.
+
+        Returns:
+            Dict[str, Any]: Sketch state.
+        """
+        return {
+            "alpha": self.alpha,
+            "max_bins": self.max_bins,
+            "count": self.count,
+            "zero_count": self.zero_count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "positive": [[k, c] for k, c in self._positive.items()],
+            "negative": [[k, c] for k, c in self._negative.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DDSketch":
+        """
+        Restore a sketch serialized with `to_dict`.
+
+        Args:
+            data (Dict[str, Any]): Sketch state.
+
+        Returns:
+            DDSketch: Restored sketch.
+        """
+        sketch = cls(data["alpha"], data["max_bins"])
+        sketch.count = data["count"]
+        sketch.zero_count = data["zero_count"]
+        sketch.sum = data["sum"]
+
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+
+        sketch._positive = {k: c for k, c in data["positive"]}
+        sketch._negative = {k: c for k, c in data["negative"]}
+        return sketch
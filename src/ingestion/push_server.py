@@ -0,0 +1,245 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+from aiohttp import web
+
+from src.async_collectors.decoders import JsonDecoder
+from src.instrumentation.registry import MetricsRegistry
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.observer import MetricMonitor
+
+
+class PushIngestionServer:
+    """
+    Embedded HTTP server that accepts pushed metric batches.
+
+    Hosts POST batches to ``/ingest`` instead of being polled. Accepted
+    batches are placed on a bounded queue and evaluated by a single
+    consumer task, so request handling never waits on threshold
+    evaluation. When the queue is full the server answers ``429 Too
+    Many Requests`` and the client is expected to retry later.
+
+    A batch is a JSON array of samples (a single sample object is also
+    accepted), where each sample looks like::
+
+        {"endpoint": "host-1", "metrics": {"cpu": 42.0}}
+
+    Request bodies may be gzip-compressed (``Content-Encoding: gzip``);
+    aiohttp decompresses them before the size limit is applied.
+    """
+
+    def __init__(self, monitor: MetricMonitor) -> None:
+        """
+        Initialize the push ingestion server.
+
+        Args:
+            monitor (MetricMonitor): Monitor that evaluates pushed metrics.
+        """
+        config = ConfigManager()
+        self._monitor = monitor
+        self._host = config.get("PUSH_HOST")
+        self._port = int(config.get("PUSH_PORT"))
+        self._decoder = JsonDecoder()
+        self._queue: asyncio.Queue = asyncio.Queue(
+            maxsize=int(config.get("PUSH_QUEUE_SIZE"))
+        )
+        self._runner: web.AppRunner | None = None
+        self._consumer: asyncio.Task | None = None
+        self._started_at = 0.0
+        self._stats: Dict[str, int] = {
+            "batches_accepted": 0,
+            "batches_rejected": 0,
+            "batches_invalid": 0,
+            "samples_received": 0,
+            "samples_processed": 0,
+            "samples_failed": 0,
+        }
+
+        registry = MetricsRegistry()
+        self._depth = registry.gauge(
+            "monitor_push_queue_depth",
+            "Pushed batches waiting for evaluation per listening port.",
+            ("port",),
+        )
+        self._depth_port: str | None = None
+        self._ingested = registry.counter(
+            "monitor_push_samples_total",
+            "Samples accepted by the push ingestion endpoint.",
+        )
+        self._rejected = registry.counter(
+            "monitor_push_rejected_total",
+            "Batches rejected with 429 because the queue was full.",
+        )
+
+        self.app = web.Application(client_max_size=self._decoder.max_bytes)
+        self.app.router.add_post("/ingest", self._handle_ingest)
+
+    @property
+    def port(self) -> int:
+        """
+        Port the server is listening on.
+
+        Returns:
+            int: Bound port, which differs from `PUSH_PORT` when
+            port 0 was configured to pick a free port.
+        """
+        if self._runner is not None and self._runner.addresses:
+            return self._runner.addresses[0][1]
+        return self._port
+
+    @staticmethod
+    def _parse_batch(payload: Any) -> List[Tuple[str, Dict[str, float]]]:
+        """
+        Validate a decoded batch and flatten it into samples.
+
+        Args:
+            payload (Any): Decoded request body.
+
+        Returns:
+            List[Tuple[str, Dict[str, float]]]: Endpoint and metrics
+            of every sample in the batch.
+
+        Raises:
+            ValueError: If the batch is malformed.
+        """
+        if isinstance(payload, dict):
+            payload = [payload]
+
+        if not isinstance(payload, list):
+            raise ValueError("Batch must be a list of samples")
+
+        samples = []
+
+        for sample in payload:
+            if not (
+                isinstance(sample, dict)
+                and isinstance(sample.get("metrics"), dict)
+            ):
+                raise ValueError("Sample must contain a metrics object")
+
+            samples.append((str(sample.get("endpoint", "")), sample["metrics"]))
+
+        return samples
+
+    async def _handle_ingest(self, request: web.Request) -> web.Response:
+        """
+        Accept one pushed batch.
+
+        Args:
+            request (web.Request): Incoming POST request.
+
+        Returns:
+            web.Response: 202 when queued, 400 when malformed,
+            413 when too large, or 429 when the queue is full.
+        """
+        if self._queue.full():
+            self._stats["batches_rejected"] += 1
+            self._rejected.inc()
+            return web.json_response(
+                {"error": "queue full"}, status=429,
+                headers={"Retry-After": "1"},
+            )
+
+        try:
+            samples = self._parse_batch(
+                await self._decoder.decode(await request.read())
+            )
+        except web.HTTPRequestEntityTooLarge:
+            self._stats["batches_invalid"] += 1
+            raise
+        except ValueError as exc:
+            self._stats["batches_invalid"] += 1
+            return web.json_response({"error": str(exc)}, status=400)
+
+        try:
+            self._queue.put_nowait(samples)
+        except asyncio.QueueFull:
+            self._stats["batches_rejected"] += 1
+            self._rejected.inc()
+            return web.json_response(
+                {"error": "queue full"}, status=429,
+                headers={"Retry-After": "1"},
+            )
+
+        self._stats["batches_accepted"] += 1
+        self._stats["samples_received"] += len(samples)
+        self._ingested.inc(len(samples))
+        return web.json_response({"accepted": len(samples)}, status=202)
+
+    async def _consume(self) -> None:
+        """
+        Evaluate queued batches against thresholds until cancelled.
+        """
+        while True:
+            samples = await self._queue.get()
+
+            try:
+                for endpoint, metrics in samples:
+                    try:
+                        await self._monitor.update_metrics_async(
+                            metrics, endpoint or None
+                        )
+                    except (TypeError, ValueError):
+                        self._stats["samples_failed"] += 1
+                    else:
+                        self._stats["samples_processed"] += 1
+            finally:
+                self._queue.task_done()
+
+    async def start(self) -> None:
+        """
+        Start listening, launch the queue consumer and expose the queue
+        depth gauge for the listening port until `close`.
+        """
+        if self._runner is not None:
+            return
+
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        self._depth_port = str(self.port)
+        self._depth.labels(self._depth_port).set_function(self._queue.qsize)
+        self._consumer = asyncio.create_task(self._consume())
+        self._started_at = time.monotonic()
+
+    async def close(self) -> None:
+        """
+        Stop accepting pushes, drain the queue and stop the consumer.
+        """
+        if self._runner is None:
+            return
+
+        await self._runner.cleanup()
+        self._runner = None
+        self._depth.remove(self._depth_port)
+        self._depth_port = None
+
+        if self._consumer is not None:
+            if not self._consumer.done():
+                await self._queue.join()
+            self._consumer.cancel()
+            await asyncio.gather(self._consumer, return_exceptions=True)
+            self._consumer = None
+
+        self._decoder.close()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report ingestion counters.
+
+        Returns:
+            Dict[str, float]: Batch and sample counters, current queue
+            depth and the average ingest rate in samples per second.
+        """
+        uptime = (
+            time.monotonic() - self._started_at if self._started_at else 0.0
+        )
+
+        return {
+            **self._stats,
+            "queue_depth": self._queue.qsize(),
+            "samples_per_second": (
+                self._stats["samples_received"] / uptime if uptime else 0.0
+            ),
+        }
@@ -0,0 +1,406 @@
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from src.metaclasses.singleton_meta import SingletonMeta
+
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """
+    Render a label set in Prometheus text format.
+
+    Args:
+        names (Sequence[str]): Label names.
+        values (Sequence[str]): Label values, in the same order.
+
+    Returns:
+        str: ``{name="value",...}``, or an empty string without labels.
+    """
+    if not names:
+        return ""
+
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n"),
+        )
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram for one label set.
+
+    Bucket counts are preallocated when the histogram is created,
+    so recording a sample is a bisect and two in-place increments.
+    """
+
+    __slots__ = ("_bounds", "_counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds (Tuple[float, ...]): Sorted upper bucket bounds.
+        """
+        self._bounds = bounds
+        self._counts: List[int] = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record one sample.
+
+        Args:
+            value (float): Observed value.
+        """
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """
+        Cumulative bucket counts as exposed by Prometheus.
+
+        Returns:
+            List[Tuple[str, int]]: ``le`` bound and cumulative count pairs,
+            ending with ``+Inf``.
+        """
+        total = 0
+        buckets = []
+
+        for bound, count in zip(self._bounds, self._counts):
+            total += count
+            buckets.append((repr(bound), total))
+
+        buckets.append(("+Inf", total + self._counts[-1]))
+        return buckets
+
+
+class Counter:
+    """
+    Monotonic counter for one label set.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount (float): Non-negative increment.
+        """
+        self.value += amount
+
+
+class Gauge:
+    """
+    Gauge for one label set, either set directly or read from a callback.
+    """
+
+    __slots__ = ("value", "function")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.function: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge to a value.
+
+        Args:
+            value (float): New value.
+        """
+        self.value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Read the gauge from a callback at scrape time.
+
+        Args:
+            function (Callable[[], float]): Zero-argument callback.
+
+        Raises:
+            ValueError: If the gauge is already bound to a callback.
+        """
+        if self.function is not None:
+            raise ValueError("Gauge is already bound to a callback")
+
+        self.function = function
+
+    def read(self) -> float:
+        """
+        Current value of the gauge.
+
+        Returns:
+            float: Callback result if one is set, otherwise the set value.
+        """
+        return self.function() if self.function is not None else self.value
+
+
+class MetricFamily:
+    """
+    A named metric with one child per label value combination.
+
+    Children are created the first time a label combination is seen
+    and then reused, so the recording hot path only performs a
+    dictionary lookup.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ) -> None:
+        """
+        Initialize a metric family.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text.
+            kind (str): ``"counter"``, ``"gauge"`` or ``"histogram"``.
+            labelnames (Tuple[str, ...]): Label names.
+            buckets (Tuple[float, ...]): Histogram bucket bounds.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = labelnames
+        self._buckets = tuple(sorted(buckets))
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._default = self.labels() if not labelnames else None
+
+    def labels(self, *values: str):
+        """
+        Return the child for a label value combination.
+
+        Args:
+            *values (str): Label values, in `labelnames` order.
+
+        Returns:
+            Counter | Gauge | Histogram: Child metric.
+
+        Raises:
+            ValueError: If the number of values does not match the labels.
+        """
+        child = self._children.get(values)
+
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}"
+                )
+            if self.kind == "histogram":
+                child = Histogram(self._buckets)
+            elif self.kind == "counter":
+                child = Counter()
+            else:
+                child = Gauge()
+            self._children[values] = child
+
+        return child
+
+    def remove(self, *values: str) -> None:
+        """
+        Drop the child of a label value combination.
+
+        Owners of callback gauges call this when they close, which
+        unbinds the callback and stops exposing the series.
+
+        Args:
+            *values (str): Label values, in `labelnames` order.
+        """
+        self._children.pop(values, None)
+
+    def observe(self, value: float) -> None:
+        """
+        Record a sample on the unlabelled histogram.
+
+        Args:
+            value (float): Observed value.
+        """
+        self._default.observe(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the unlabelled counter.
+
+        Args:
+            amount (float): Non-negative increment.
+        """
+        self._default.inc(amount)
+
+    def set(self, value: float) -> None:
+        """
+        Set the unlabelled gauge.
+
+        Args:
+            value (float): New value.
+        """
+        self._default.set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Read the unlabelled gauge from a callback at scrape time.
+
+        Args:
+            function (Callable[[], float]): Zero-argument callback.
+        """
+        self._default.set_function(function)
+
+    def render(self) -> List[str]:
+        """
+        Render the family in Prometheus text exposition format.
+
+        Returns:
+            List[str]: Exposition lines.
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+        for values, child in list(self._children.items()):
+            labels = _format_labels(self.labelnames, values)
+
+            if self.kind == "histogram":
+                names = self.labelnames + ("le",)
+                for bound, count in child.cumulative():
+                    bucket_labels = _format_labels(names, values + (bound,))
+                    lines.append(f"{self.name}_bucket{bucket_labels} {count}")
+                lines.append(f"{self.name}_sum{labels} {child.sum}")
+                lines.append(f"{self.name}_count{labels} {child.count}")
+            elif self.kind == "counter":
+                lines.append(f"{self.name}{labels} {child.value}")
+            else:
+                lines.append(f"{self.name}{labels} {child.read()}")
+
+        return lines
+
+
+class MetricsRegistry(metaclass=SingletonMeta):
+    """
+    Process-wide registry of self-instrumentation metrics.
+
+    Components ask the registry for their metric families once, at
+    construction time, and keep the returned objects for recording.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty registry.
+        """
+        self._families: Dict[str, MetricFamily] = {}
+
+    def _family(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Tuple[str, ...],
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ) -> MetricFamily:
+        """
+        Get or create a metric family.
+
+        Raises:
+            ValueError: If the name is registered with another type.
+        """
+        family = self._families.get(name)
+
+        if family is None:
+            family = MetricFamily(name, documentation, kind, labelnames,
+                                  buckets)
+            self._families[name] = family
+        elif family.kind != kind or family.labelnames != labelnames:
+            raise ValueError(f"Metric {name} already registered differently")
+
+        return family
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()
+    ) -> MetricFamily:
+        """
+        Get or create a counter family.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text.
+            labelnames (Tuple[str, ...]): Label names.
+
+        Returns:
+            MetricFamily: Counter family.
+        """
+        return self._family(name, documentation, "counter", labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()
+    ) -> MetricFamily:
+        """
+        Get or create a gauge family.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text.
+            labelnames (Tuple[str, ...]): Label names.
+
+        Returns:
+            MetricFamily: Gauge family.
+        """
+        return self._family(name, documentation, "gauge", labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ) -> MetricFamily:
+        """
+        Get or create a histogram family.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text.
+            labelnames (Tuple[str, ...]): Label names.
+            buckets (Tuple[float, ...]): Upper bucket bounds.
+
+        Returns:
+            MetricFamily: Histogram family.
+        """
+        return self._family(
+            name, documentation, "histogram", labelnames, buckets
+        )
+
+    def render(self) -> str:
+        """
+        Render every registered family in Prometheus text format.
+
+        Returns:
+            str: Exposition document.
+        """
+        lines: List[str] = []
+
+        for family in list(self._families.values()):
+            lines.extend(family.render())
+
+        return "\n".join(lines) + "\n"
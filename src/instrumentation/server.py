@@ -0,0 +1,74 @@
+from aiohttp import web
+
+from src.instrumentation.registry import MetricsRegistry
+from src.metaclasses.config_manager import ConfigManager
+
+
+class MetricsServer:
+    """
+    Lightweight HTTP server exposing ``/metrics`` in Prometheus
+    text format.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the metrics server.
+
+        Loads the listen address using the ConfigManager.
+        """
+        config = ConfigManager()
+        self._host = config.get("METRICS_HOST")
+        self._port = int(config.get("METRICS_PORT"))
+        self._registry = MetricsRegistry()
+        self._runner: web.AppRunner | None = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/metrics", self._handle_metrics)
+
+    @property
+    def port(self) -> int:
+        """
+        Port the server is listening on.
+
+        Returns:
+            int: Bound port, which differs from `METRICS_PORT` when
+            port 0 was configured to pick a free port.
+        """
+        if self._runner is not None and self._runner.addresses:
+            return self._runner.addresses[0][1]
+        return self._port
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        """
+        Serve the current registry contents.
+
+        Args:
+            request (web.Request): Incoming scrape request.
+
+        Returns:
+            web.Response: Exposition document.
+        """
+        return web.Response(
+            text=self._registry.render(),
+            content_type="text/plain",
+            headers={"X-Content-Type-Options": "nosniff"},
+        )
+
+    async def start(self) -> None:
+        """
+        Start listening for scrapes.
+        """
+        if self._runner is not None:
+            return
+
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+
+    async def close(self) -> None:
+        """
+        Stop listening for scrapes.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -20,9 +20,116 @@ class ConfigManager(metaclass=SingletonMeta):
         "METRIC_THRESHOLD": 90.0,
         "ASYNC_TIMEOUT": 5,
         "STORAGE_BACKEND": "file",
-        "METRIC_ENDPOINTS": []
+        "STORAGE_FILE_PATH": "/app/data/storage.txt",
+        "STORAGE_FLUSH_BYTES": 64 * 1024,
+        "STORAGE_FLUSH_INTERVAL": 1.0,
+        "STORAGE_FSYNC": "interval",
+        "STORAGE_FSYNC_EVERY": 100,
+        "STORAGE_FSYNC_INTERVAL": 5.0,
+        "STORAGE_ROTATE_BYTES": 64 * 1024 * 1024,
+        "STORAGE_ROTATE_INTERVAL": 0.0,
+        "STORAGE_ROTATE_COMPRESS": True,
+        "STORAGE_ROTATE_KEEP": 10,
+        "STORAGE_DB_PATH": "/app/data/alerts.db",
+        "STORAGE_DB_BATCH_SIZE": 5000,
+        "STORAGE_DB_QUEUE_SIZE": 1000,
+        "STORAGE_DB_SYNCHRONOUS": "NORMAL",
+        "UPLOAD_BACKEND": "local",
+        "UPLOAD_LOCAL_PATH": "/app/data/objects",
+        "UPLOAD_PREFIX": "alerts",
+        "UPLOAD_CHUNK_BYTES": 1024 * 1024,
+        "UPLOAD_CHUNK_SECONDS": 60.0,
+        "UPLOAD_COMPRESSION_LEVEL": 6,
+        "UPLOAD_CONCURRENCY": 4,
+        "UPLOAD_MAX_PENDING": 16,
+        "UPLOAD_RETRIES": 3,
+        "UPLOAD_BACKOFF_BASE": 0.5,
+        "UPLOAD_SPILL_PATH": "/app/data/upload-spill",
+        "METRIC_ENDPOINTS": [],
+        "HTTP_POOL_LIMIT": 100,
+        "HTTP_POOL_LIMIT_PER_HOST": 4,
+        "HTTP_KEEPALIVE_TIMEOUT": 30.0,
+        "HTTP_DNS_CACHE_TTL": 300,
+        "FETCH_CONCURRENCY": 50,
+        "CYCLE_DEADLINE": 10.0,
+        "POLL_INTERVAL": 5,
+        "ENDPOINT_INTERVALS": {},
+        "SCHEDULER_JITTER": 1.0,
+        "CB_FAILURE_THRESHOLD": 3,
+        "CB_BACKOFF_BASE": 1.0,
+        "CB_BACKOFF_MAX": 300.0,
+        "CB_LATENCY_WINDOW": 100,
+        "CB_TIMEOUT_PERCENTILE": 0.99,
+        "CB_TIMEOUT_MULTIPLIER": 3.0,
+        "CB_MIN_TIMEOUT": 0.5,
+        "CONDITIONAL_FETCH": True,
+        "DELTA_FETCH": False,
+        "DECODER_BACKEND": "auto",
+        "MAX_PAYLOAD_BYTES": 32 * 1024 * 1024,
+        "DECODE_OFFLOAD_BYTES": 256 * 1024,
+        "DECODE_WORKERS": 2,
+        "POLL_ENABLED": True,
+        "PUSH_ENABLED": False,
+        "PUSH_HOST": "0.0.0.0",
+        "PUSH_PORT": 8000,
+        "PUSH_QUEUE_SIZE": 1000,
+        "REPLICA_INDEX": 0,
+        "REPLICA_COUNT": 1,
+        "METRICS_ENABLED": True,
+        "METRICS_HOST": "0.0.0.0",
+        "METRICS_PORT": 9100,
+        "OBSERVER_DISPATCH": "async",
+        "OBSERVER_QUEUE_SIZE": 1000,
+        "OBSERVER_OVERFLOW": "drop_oldest",
+        "OBSERVER_SAMPLE_EVERY": 10,
+        "METRIC_RULES": [],
+        "RULES_VECTORIZE_MIN": 1024,
+        "ALERT_STATE_ENABLED": True,
+        "ALERT_FOR_SECONDS": 0.0,
+        "ALERT_RENOTIFY_SECONDS": 0.0,
+        "HISTORY_ENABLED": False,
+        "HISTORY_PATH": "/app/data/history",
+        "HISTORY_FLUSH_INTERVAL": 5.0,
+        "HISTORY_SEGMENT_SAMPLES": 65536,
+        "HISTORY_SEGMENT_SECONDS": 86400.0,
+        "HISTORY_RETENTION_SECONDS": 7 * 86400.0,
+        "RING_HISTORY_ENABLED": False,
+        "RING_HISTORY_CAPACITY": 1024,
+        "RING_HISTORY_SERIES": 1024,
+        "ROLLUP_ENABLED": False,
+        "ROLLUP_RESOLUTIONS": {60: 360, 300: 288, 3600: 168},
+        "ROLLUP_MAX_POINTS": 300,
+        "ROLLUP_CHECKPOINT_PATH": "/app/data/rollups.npz",
+        "ROLLUP_CHECKPOINT_INTERVAL": 60.0,
+        "SKETCH_RELATIVE_ACCURACY": 0.01,
+        "DETECTORS": [],
+        "DETECTOR_WARMUP": 10,
+        "DETECTOR_EWMA_ALPHA": 0.1,
+        "DETECTOR_Z_THRESHOLD": 4.0,
+        "DETECTOR_WINDOW": 60,
+        "DETECTOR_IQR_K": 1.5,
+        "DETECTOR_MAX_RATE": 100.0,
+        "DETECTOR_HOLDDOWN_SECONDS": 300.0,
+        "FLEET_WORKERS": 0,
+        "FLEET_CHUNK_SERIES": 256,
+        "FLEET_MIN_PARALLEL_SAMPLES": 1_000_000,
     }
 
+    _version: int = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented on every `set`.
+
+        Lets components that precompute state from configuration
+        detect changes with a single integer comparison.
+
+        Returns:
+            int: Current configuration version.
+        """
+        return self._version
+
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         """
         Retrieve a configuration value.
@@ -54,3 +161,4 @@ class ConfigManager(metaclass=SingletonMeta):
             value (Any): Value to associate with the key.
         """
         self._config[key] = value
+        self._version += 1
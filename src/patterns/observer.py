@@ -1,8 +1,16 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
 
+from src.instrumentation.registry import MetricsRegistry
 from src.metaclasses.config_manager import ConfigManager
-from src.processors.alerts import AlertProcessor
+from src.processors.alerts import ANOMALY, AlertProcessor
+from src.rules.alert_state import AlertStateTable
+from src.rules.detectors import Detector
+from src.rules.engine import RuleEngine
 from src.patterns.strategy import StorageContext
 
 
@@ -11,9 +19,13 @@ class Observer(ABC):
     Abstract base class for observers in the Observer pattern.
 
     Concrete observers must implement the `update` method to
-    react to notifications from the subject.
+    react to notifications from the subject. Observers that perform
+    blocking I/O should set `blocking` so that asynchronous dispatch
+    runs them on a worker thread instead of the event loop.
     """
 
+    blocking: bool = False
+
     @abstractmethod
     def update(self, data: Dict[str, Any]) -> None:
         """
@@ -24,24 +36,384 @@ class Observer(ABC):
         """
         pass
 
+    def update_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Receive all updates of one evaluation cycle at once.
+
+        Observers that can handle a batch more cheaply than item by
+        item should override this; the default forwards each item
+        to `update`.
+
+        Args:
+            batch (List[Dict[str, Any]]): Update payloads, in order.
+        """
+        for data in batch:
+            self.update(data)
+
+    def close(self) -> None:
+        """
+        Release resources held by the observer on shutdown.
+
+        Observers that buffer output should override this to flush it;
+        the default does nothing.
+        """
+
+
+class Recorder(ABC):
+    """
+    Abstract base class for consumers of every evaluated payload.
+
+    Unlike observers, which only hear about threshold breaches,
+    recorders receive each metrics payload the monitor evaluates,
+    e.g. to keep metric history. `record` is called on the evaluating
+    thread and must not block on I/O.
+    """
+
+    @abstractmethod
+    def record(
+        self,
+        endpoint: str,
+        metrics: Dict[str, float],
+        timestamp: float
+    ) -> None:
+        """
+        Receive one evaluated metrics payload.
+
+        Args:
+            endpoint (str): Endpoint that reported the payload, or an
+                empty string when unknown.
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            timestamp (float): Evaluation time in seconds since the epoch.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Flush and release resources on shutdown; the default does nothing.
+        """
+
+
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+SAMPLE = "sample"
+
+
+class QueuedObserver(Observer):
+    """
+    Observer wrapper that decouples delivery from notification.
+
+    Notifications are placed on a bounded queue and delivered to the
+    wrapped observer by a dedicated worker task, or by a single worker
+    thread when the observer is `blocking`. When the queue is full the
+    overflow policy decides what happens:
+
+    - ``drop_oldest``: discard the oldest queued batch to make room.
+    - ``block``: producers using `submit` wait for room; synchronous
+      notifications that cannot wait are parked, in order, in a backlog
+      that a feeder task moves into the queue as room appears. Batches
+      are never delivered on the notifying thread.
+    - ``sample``: once the queue is half full, admit only one batch in
+      every `OBSERVER_SAMPLE_EVERY`; drop new batches when it is full.
+    """
+
+    def __init__(self, observer: Observer) -> None:
+        """
+        Wrap an observer for asynchronous dispatch.
+
+        Loads queue size, overflow policy and sampling rate
+        using the ConfigManager.
+
+        Args:
+            observer (Observer): Observer receiving the notifications.
+
+        Raises:
+            ValueError: If the configured overflow policy is unsupported.
+        """
+        config = ConfigManager()
+        self.observer = observer
+        self._policy = config.get("OBSERVER_OVERFLOW")
+
+        if self._policy not in (DROP_OLDEST, BLOCK, SAMPLE):
+            raise ValueError(f"Unsupported overflow policy: {self._policy}")
+
+        self._queue: asyncio.Queue = asyncio.Queue(
+            maxsize=int(config.get("OBSERVER_QUEUE_SIZE"))
+        )
+        self._sample_every = int(config.get("OBSERVER_SAMPLE_EVERY"))
+        self._offered = 0
+        self._worker: asyncio.Task | None = None
+        self._backlog: deque = deque()
+        self._feeder: asyncio.Task | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._stats: Dict[str, float] = {
+            "delivered": 0,
+            "dropped": 0,
+            "errors": 0,
+            "lag_last": 0.0,
+            "lag_max": 0.0,
+        }
+
+        name = type(observer).__name__
+        registry = MetricsRegistry()
+        self._depth = registry.gauge(
+            "monitor_observer_queue_depth",
+            "Alert batches waiting for delivery per observer.",
+            ("observer",),
+        )
+        self._lag = registry.histogram(
+            "monitor_observer_lag_seconds",
+            "Delay between notification and delivery per observer.",
+            ("observer",),
+        ).labels(name)
+        self._dropped = registry.counter(
+            "monitor_observer_dropped_total",
+            "Alert batches dropped by the overflow policy per observer.",
+            ("observer",),
+        ).labels(name)
+
+    def _drop(self) -> None:
+        """
+        Count one batch discarded by the overflow policy.
+        """
+        self._stats["dropped"] += 1
+        self._dropped.inc()
+
+    def update(self, data: Dict[str, Any]) -> None:
+        """
+        Queue a single notification.
+
+        Args:
+            data (Dict[str, Any]): Payload containing update information.
+        """
+        self.update_batch([data])
+
+    def update_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Queue a batch without waiting, applying the overflow policy.
+
+        Args:
+            batch (List[Dict[str, Any]]): Update payloads, in order.
+        """
+        if self._policy == SAMPLE and (
+            2 * self._queue.qsize() >= self._queue.maxsize
+        ):
+            self._offered += 1
+
+            if self._offered % self._sample_every:
+                self._drop()
+                return
+
+        if self._policy == BLOCK and self._backlog:
+            self._park((time.monotonic(), batch))
+            return
+
+        try:
+            self._queue.put_nowait((time.monotonic(), batch))
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self._policy == DROP_OLDEST:
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._drop()
+            self._queue.put_nowait((time.monotonic(), batch))
+        elif self._policy == BLOCK:
+            self._park((time.monotonic(), batch))
+        else:
+            self._drop()
+
+    def _park(self, item: Tuple[float, List[Dict[str, Any]]]) -> None:
+        """
+        Hold a batch until the queue has room, starting the feeder.
+
+        Args:
+            item (Tuple[float, List[Dict[str, Any]]]): Enqueue time and
+                batch.
+        """
+        self._backlog.append(item)
+
+        if self._feeder is None or self._feeder.done():
+            try:
+                self._feeder = asyncio.get_running_loop().create_task(
+                    self._feed()
+                )
+            except RuntimeError:
+                # No loop yet: `start` launches the feeder.
+                self._feeder = None
+
+    async def _feed(self) -> None:
+        """
+        Move parked batches into the queue, waiting for room.
+        """
+        while self._backlog:
+            await self._queue.put(self._backlog[0])
+            self._backlog.popleft()
+
+    async def submit(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Queue a batch, waiting for room under the ``block`` policy.
+
+        Args:
+            batch (List[Dict[str, Any]]): Update payloads, in order.
+        """
+        if self._policy == BLOCK:
+            if self._feeder is not None and not self._feeder.done():
+                # Stay behind batches parked by `update_batch`.
+                await self._feeder
+            await self._queue.put((time.monotonic(), batch))
+        else:
+            self.update_batch(batch)
+
+    async def _run(self) -> None:
+        """
+        Deliver queued batches to the wrapped observer until cancelled.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            enqueued_at, batch = await self._queue.get()
+            lag = time.monotonic() - enqueued_at
+            self._lag.observe(lag)
+            self._stats["lag_last"] = lag
+            self._stats["lag_max"] = max(self._stats["lag_max"], lag)
+
+            try:
+                if self._executor is not None:
+                    await loop.run_in_executor(
+                        self._executor, self.observer.update_batch, batch
+                    )
+                else:
+                    self.observer.update_batch(batch)
+                self._stats["delivered"] += 1
+            except Exception:
+                self._stats["errors"] += 1
+            finally:
+                self._queue.task_done()
+
+    async def start(self) -> None:
+        """
+        Start the delivery worker and expose the queue depth gauge.
+
+        Raises:
+            ValueError: If a running queue of another observer of the
+                same class already exposes the gauge.
+        """
+        if self._worker is not None:
+            return
+
+        self._depth.labels(type(self.observer).__name__).set_function(
+            self._queue.qsize
+        )
+
+        if self.observer.blocking:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=type(self.observer).__name__,
+            )
+
+        self._worker = asyncio.create_task(self._run())
+
+        if self._backlog and self._feeder is None:
+            self._feeder = asyncio.create_task(self._feed())
+
+    async def close(self) -> None:
+        """
+        Deliver every queued batch, stop the worker and close the
+        wrapped observer.
+        """
+        if self._feeder is not None:
+            await self._feeder
+            self._feeder = None
+
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+            self._depth.remove(type(self.observer).__name__)
+
+        if self._executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.observer.close
+            )
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        else:
+            self.observer.close()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report delivery counters.
+
+        Returns:
+            Dict[str, float]: Delivered, dropped and failed batch counts,
+            current queue depth, batches parked by the ``block`` policy,
+            and the last and maximum delivery lag.
+        """
+        return {**self._stats, "queue_depth": self._queue.qsize(),
+                "backlog": len(self._backlog)}
+
 
 class MetricMonitor:
     """
     Subject in the Observer pattern that monitors metric values.
 
-    This class evaluates incoming metrics against a configured
-    threshold and notifies registered observers when the threshold
+    This class evaluates incoming metrics against the configured
+    threshold rules and notifies registered observers when a rule
     is breached.
+
+    When `ALERT_STATE_ENABLED` is set, breaches pass through an
+    `AlertStateTable` so that observers only see state transitions
+    (``"firing"`` and ``"resolved"`` events) instead of every breach
+    on every poll.
+
+    In ``"async"`` dispatch mode every registered observer is wrapped
+    in a `QueuedObserver`, so evaluation only enqueues alert batches
+    and never waits for observers to handle them.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, dispatch: str = "sync") -> None:
         """
         Initialize the MetricMonitor.
 
-        Sets up the observer list and loads configuration values.
+        Sets up the observer list, loads configuration values and
+        registers self-instrumentation metrics.
+
+        Args:
+            dispatch (str): ``"sync"`` to notify observers inline, or
+                ``"async"`` to deliver through per-observer queues.
+
+        Raises:
+            ValueError: If the dispatch mode is unsupported.
         """
+        if dispatch not in ("sync", "async"):
+            raise ValueError(f"Unsupported dispatch mode: {dispatch}")
+
         self._observers: List[Observer] = []
+        self._recorders: List[Recorder] = []
+        self._detectors: List[Detector] = []
         self._config = ConfigManager()
+        self._rules = RuleEngine()
+        self._alert_states: AlertStateTable | None = None
+        self._dispatch = dispatch
+
+        if self._config.get("ALERT_STATE_ENABLED"):
+            self._alert_states = AlertStateTable(self._rules)
+
+        registry = MetricsRegistry()
+        self._evaluate_time = registry.histogram(
+            "monitor_evaluate_seconds",
+            "Time spent evaluating one metrics payload.",
+        )
+        self._dispatch_time = registry.histogram(
+            "monitor_observer_dispatch_seconds",
+            "Time spent notifying observers of one alert or alert batch.",
+        )
+        self._alerts = registry.counter(
+            "monitor_alerts_total",
+            "Threshold breaches raised to observers.",
+        )
 
     def register_observer(self, observer: Observer) -> None:
         """
@@ -50,8 +422,35 @@ class MetricMonitor:
         Args:
             observer (Observer): Observer instance to register.
         """
+        if self._dispatch == "async":
+            observer = QueuedObserver(observer)
+
         self._observers.append(observer)
 
+    def register_recorder(self, recorder: Recorder) -> None:
+        """
+        Register a recorder to receive every evaluated payload.
+
+        Args:
+            recorder (Recorder): Recorder instance to register.
+        """
+        self._recorders.append(recorder)
+
+    def register_detector(self, detector: Detector) -> None:
+        """
+        Register an online anomaly detector.
+
+        Detectors see every evaluated payload and report anomalous
+        samples as alerts with ``state="anomaly"``, the detector name
+        and score, alongside threshold breaches. Repeated anomalies of
+        a series are held down by the detector itself, see
+        `Detector.holddown`.
+
+        Args:
+            detector (Detector): Detector instance to register.
+        """
+        self._detectors.append(detector)
+
     def remove_observer(self, observer: Observer) -> None:
         """
         Remove a previously registered observer.
@@ -59,7 +458,50 @@ class MetricMonitor:
         Args:
             observer (Observer): Observer instance to remove.
         """
-        self._observers.remove(observer)
+        for registered in self._observers:
+            if registered is observer or (
+                isinstance(registered, QueuedObserver)
+                and registered.observer is observer
+            ):
+                self._observers.remove(registered)
+                return
+
+        raise ValueError("Observer is not registered")
+
+    async def start(self) -> None:
+        """
+        Start delivery workers of queued observers.
+        """
+        for observer in self._observers:
+            if isinstance(observer, QueuedObserver):
+                await observer.start()
+
+    async def close(self) -> None:
+        """
+        Flush queued observers, stop their delivery workers and close
+        every observer and recorder.
+        """
+        for observer in self._observers:
+            if isinstance(observer, QueuedObserver):
+                await observer.close()
+            else:
+                observer.close()
+
+        for recorder in self._recorders:
+            recorder.close()
+
+    def observer_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Report delivery counters of queued observers.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Stats keyed by observer class name.
+        """
+        return {
+            type(observer.observer).__name__: observer.stats()
+            for observer in self._observers
+            if isinstance(observer, QueuedObserver)
+        }
 
     def notify_observers(self, data: Dict[str, Any]) -> None:
         """
@@ -68,34 +510,153 @@ class MetricMonitor:
         Args:
             data (Dict[str, Any]): Metric information to broadcast.
         """
+        started = time.perf_counter()
+
         for observer in self._observers:
             observer.update(data)
 
-    def update_metrics(self, metrics: Dict[str, float]) -> None:
+        self._dispatch_time.observe(time.perf_counter() - started)
+
+    def notify_observers_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Notify all registered observers with a batch of metric data.
+
+        Args:
+            batch (List[Dict[str, Any]]): Metric information to broadcast.
+        """
+        started = time.perf_counter()
+
+        for observer in self._observers:
+            observer.update_batch(batch)
+
+        self._dispatch_time.observe(time.perf_counter() - started)
+
+    def _evaluate(
+        self,
+        metrics: Dict[str, float],
+        endpoint: str | None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the metrics of a payload that need to be reported.
+
+        The payload is handed to every registered recorder first, and
+        anomalies found by registered detectors follow the breaches.
+
+        Args:
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            endpoint (str | None): Endpoint that reported the payload.
+
+        Returns:
+            List[Dict[str, Any]]: Alert payloads, in payload order. Each
+            carries the endpoint when one was given, and the ``state``
+            event when alert state tracking is enabled.
+        """
+        started = time.perf_counter()
+
+        if self._recorders or self._detectors:
+            now = time.time()
+
+        if self._recorders:
+            for recorder in self._recorders:
+                recorder.record(endpoint or "", metrics, now)
+
+        breaches = self._rules.evaluate(metrics, endpoint or "")
+
+        if self._alert_states is None:
+            alerts = [
+                {"metric": metric, "value": value}
+                for metric, value in breaches
+            ]
+        else:
+            alerts = [
+                {"metric": metric, "value": value, "state": state}
+                for metric, value, state in self._alert_states.update(
+                    endpoint or "", metrics, breaches
+                )
+            ]
+
+        for detector in self._detectors:
+            alerts.extend(
+                {"metric": metric, "value": value, "state": ANOMALY,
+                 "detector": detector.name, "score": score}
+                for metric, value, score in detector.update(
+                    endpoint or "", metrics, now
+                )
+            )
+
+        if endpoint is not None:
+            for alert in alerts:
+                alert["endpoint"] = endpoint
+
+        self._evaluate_time.observe(time.perf_counter() - started)
+        self._alerts.inc(len(alerts))
+        return alerts
+
+    def update_metrics(
+        self,
+        metrics: Dict[str, float],
+        endpoint: str | None = None
+    ) -> None:
         """
         Evaluate metrics and notify observers if thresholds are exceeded.
 
+        All breaches found in the payload are delivered to observers
+        as a single batch.
+
+        Args:
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            endpoint (str | None): Endpoint that reported the payload,
+                used for per-host rules.
+        """
+        breaches = self._evaluate(metrics, endpoint)
+
+        if breaches:
+            self.notify_observers_batch(breaches)
+
+    async def update_metrics_async(
+        self,
+        metrics: Dict[str, float],
+        endpoint: str | None = None
+    ) -> None:
+        """
+        Evaluate metrics and hand breaches to observers from a coroutine.
+
+        Behaves like `update_metrics`, except that queued observers using
+        the ``block`` overflow policy make the caller wait for room
+        instead of delivering inline.
+
         Args:
             metrics (Dict[str, float]): Mapping of metric names to values.
+            endpoint (str | None): Endpoint that reported the payload,
+                used for per-host rules.
         """
-        threshold = self._config.get("METRIC_THRESHOLD")
+        breaches = self._evaluate(metrics, endpoint)
+
+        if not breaches:
+            return
+
+        started = time.perf_counter()
 
-        for metric, value in metrics.items():
-            if value > threshold:
-                self.notify_observers({
-                    "metric": metric,
-                    "value": value
-                })
+        for observer in self._observers:
+            if isinstance(observer, QueuedObserver):
+                await observer.submit(breaches)
+            else:
+                observer.update_batch(breaches)
+
+        self._dispatch_time.observe(time.perf_counter() - started)
 
 
 class AlertObserver(Observer):
     """
     Observer that handles alert generation and persistence.
 
-    When notified, this observer processes alert data and stores
-    the resulting alert using a configurable storage strategy.
+    When notified, this observer builds structured alert records and
+    stores them using a configurable storage strategy. Records are
+    rendered to text only by backends that write text.
     """
 
+    blocking = True
+
     def __init__(self) -> None:
         """
         Initialize the AlertObserver.
@@ -121,6 +682,29 @@ class AlertObserver(Observer):
         # store last alert for testing
         self.last_alert = (metric, value)
 
-        # real processing (optional, future-proof)
-        alert_message = self._processor.process(data)
-        self._storage.store(alert_message)
+        self._storage.store(self._processor.build(data))
+
+    def update_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Handle all threshold breaches of one cycle with a single store.
+
+        Args:
+            batch (List[Dict[str, Any]]): Alert payloads containing
+            metric name and value.
+        """
+        if not batch:
+            return
+
+        firing = [data for data in batch if data.get("state") != "resolved"]
+
+        if firing:
+            self.last_alert = (firing[-1]["metric"], firing[-1]["value"])
+
+        build = self._processor.build
+        self._storage.store_many([build(data) for data in batch])
+
+    def close(self) -> None:
+        """
+        Flush buffered alerts and close the storage backend.
+        """
+        self._storage.close()
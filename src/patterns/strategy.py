@@ -1,16 +1,35 @@
+import gzip
+import logging
+import os
+import queue
+import shutil
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, BinaryIO, Dict, List, Tuple
 from pathlib import Path
 
+from src.instrumentation.registry import MetricsRegistry
 from src.metaclasses.config_manager import ConfigManager
+from src.processors.alerts import Alert, AlertProcessor
+from src.storage.object_store import (
+    LocalDirectoryClient,
+    ObjectStoreClient,
+    ObjectStoreUploader,
+)
 
 
+logger = logging.getLogger(__name__)
+
 class StorageStrategy(ABC):
     """
     Abstract base class for storage strategies.
 
     Defines a common interface for different storage backends
-    used to persist alert or metric data.
+    used to persist alert or metric data. Alerts arrive as structured
+    `Alert` records; backends that write text render them with `str()`,
+    while structured backends can read their fields directly.
     """
 
     @abstractmethod
@@ -23,24 +42,291 @@ class StorageStrategy(ABC):
         """
         pass
 
+    def store_many(self, items: List[Any]) -> None:
+        """
+        Persist a batch of records.
+
+        Strategies that can write a batch more cheaply than record by
+        record should override this; the default stores each item.
+
+        Args:
+            items (List[Any]): Records to be stored, in order.
+        """
+        for data in items:
+            self.store(data)
+
+    def flush(self) -> None:
+        """
+        Push buffered records to the backend.
+
+        Strategies that buffer writes should override this; the default
+        does nothing.
+        """
+
+    def close(self) -> None:
+        """
+        Flush buffered records and release backend resources.
+
+        Called once on shutdown; the default only flushes.
+        """
+        self.flush()
+
+
+FSYNC_NEVER = "never"
+FSYNC_EVERY_N = "every_n"
+FSYNC_INTERVAL = "interval"
+
 
 class FileStorageStrategy(StorageStrategy):
     """
     Storage strategy that persists data to a local file.
+
+    The file is kept open and writes go through a buffer that is
+    flushed once it holds `STORAGE_FLUSH_BYTES`, and at least every
+    `STORAGE_FLUSH_INTERVAL` seconds by a background thread. How often
+    data is forced to disk follows `STORAGE_FSYNC`:
+
+    - ``never``: leave it to the operating system.
+    - ``every_n``: flush and fsync after every `STORAGE_FSYNC_EVERY`
+      records.
+    - ``interval``: fsync at most every `STORAGE_FSYNC_INTERVAL` seconds.
+      The background thread does the fsync, so without one
+      (`STORAGE_FLUSH_INTERVAL` of 0) every batch is fsynced instead.
+
+    The file is rotated once it exceeds `STORAGE_ROTATE_BYTES` or is
+    older than `STORAGE_ROTATE_INTERVAL` seconds (0 disables either).
+    Rotated segments get a timestamp suffix and only the newest
+    `STORAGE_ROTATE_KEEP` segments are retained (0 keeps all). When
+    `STORAGE_ROTATE_COMPRESS` is set, segments are gzip-compressed by a
+    background thread, so writers only wait for the rename.
     """
 
-    def __init__(self, filepath: str = "/app/data/storage.txt") -> None:
+    def __init__(self, filepath: str | None = None) -> None:
         """
         Initialize file-based storage.
 
-        Ensures that the parent directory exists.
+        Ensures that the parent directory exists and loads buffering,
+        fsync and rotation settings using the ConfigManager. The file
+        itself is opened on the first write.
 
         Args:
-            filepath (str): Path to the storage file.
+            filepath (str | None): Path to the storage file. Defaults to
+                `STORAGE_FILE_PATH`.
+
+        Raises:
+            ValueError: If the configured fsync policy is unsupported.
         """
-        self.filepath = Path(filepath)
+        config = ConfigManager()
+        self.filepath = Path(filepath or config.get("STORAGE_FILE_PATH"))
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        self._fsync = config.get("STORAGE_FSYNC")
+
+        if self._fsync not in (FSYNC_NEVER, FSYNC_EVERY_N, FSYNC_INTERVAL):
+            raise ValueError(f"Unsupported fsync policy: {self._fsync}")
+
+        self._flush_bytes = int(config.get("STORAGE_FLUSH_BYTES"))
+        self._flush_interval = float(config.get("STORAGE_FLUSH_INTERVAL"))
+        self._fsync_every = int(config.get("STORAGE_FSYNC_EVERY"))
+        self._fsync_interval = float(config.get("STORAGE_FSYNC_INTERVAL"))
+        self._rotate_bytes = int(config.get("STORAGE_ROTATE_BYTES"))
+        self._rotate_interval = float(config.get("STORAGE_ROTATE_INTERVAL"))
+        self._compress = bool(config.get("STORAGE_ROTATE_COMPRESS"))
+        self._keep = int(config.get("STORAGE_ROTATE_KEEP"))
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._file: BinaryIO | None = None
+        self._segments: queue.Queue = queue.Queue()
+        self._compressor: threading.Thread | None = None
+        self._opened_at = 0.0
+        self._synced_at = 0.0
+        self._unsynced = 0
+        self._stats = {"records": 0, "fsyncs": 0, "rotations": 0}
+
+    def _open(self) -> BinaryIO:
+        """
+        Open the storage file for appending and start the flush thread.
+
+        Returns:
+            BinaryIO: Buffered file handle.
+        """
+        self._file = open(self.filepath, "ab", buffering=self._flush_bytes)
+        self._opened_at = self._synced_at = time.monotonic()
+
+        if self._flusher is None and self._flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name=f"{type(self).__name__}-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+        return self._file
+
+    def _flush_loop(self) -> None:
+        """
+        Periodically flush, fsync and rotate until the storage is closed.
+        """
+        while not self._stop.wait(self._flush_interval):
+            with self._lock:
+                if self._file is None:
+                    continue
+
+                self._file.flush()
+
+                if (
+                    self._fsync == FSYNC_INTERVAL
+                    and self._unsynced
+                    and time.monotonic() - self._synced_at
+                    >= self._fsync_interval
+                ):
+                    self._sync()
+
+                if self._rotation_due(0):
+                    self._rotate()
+
+    def _sync(self) -> None:
+        """
+        Flush the buffer and force written data to disk.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._synced_at = time.monotonic()
+        self._unsynced = 0
+        self._stats["fsyncs"] += 1
+
+    def _rotation_due(self, incoming: int) -> bool:
+        """
+        Check whether the file must be rotated before the next write.
+
+        Args:
+            incoming (int): Size of the pending write in bytes.
+
+        Returns:
+            bool: True if the size or age limit is reached.
+        """
+        if self._rotate_interval > 0 and (
+            time.monotonic() - self._opened_at >= self._rotate_interval
+        ):
+            return self._file.tell() > 0
+
+        return (
+            self._rotate_bytes > 0
+            and 0 < self._file.tell()
+            and self._file.tell() + incoming > self._rotate_bytes
+        )
+
+    def _rotate(self) -> None:
+        """
+        Close the current file as a timestamped segment and reopen it.
+
+        Must be called with the lock held. Compression is handed to the
+        compressor thread.
+        """
+        if self._fsync != FSYNC_NEVER:
+            self._sync()
+
+        self._file.close()
+        self._file = None
+
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        segment = self.filepath.with_name(f"{self.filepath.name}.{stamp}")
+        suffix = 1
+
+        while segment.exists() or segment.with_suffix(
+            segment.suffix + ".gz"
+        ).exists():
+            segment = self.filepath.with_name(
+                f"{self.filepath.name}.{stamp}-{suffix}"
+            )
+            suffix += 1
+
+        self.filepath.rename(segment)
+
+        if self._keep > 0:
+            segments = sorted(
+                self.filepath.parent.glob(f"{self.filepath.name}.*"),
+                key=lambda path: path.stat().st_mtime,
+            )
+            for old in segments[:-self._keep]:
+                old.unlink()
+
+        if self._compress:
+            if self._compressor is None:
+                self._compressor = threading.Thread(
+                    target=self._compress_loop,
+                    name=f"{type(self).__name__}-compress",
+                    daemon=True,
+                )
+                self._compressor.start()
+
+            self._segments.put(segment)
+
+        self._stats["rotations"] += 1
+        self._open()
+
+    def _compress_loop(self) -> None:
+        """
+        Gzip rotated segments until a None sentinel is queued.
+
+        Each segment is compressed to a hidden temporary file that keeps
+        the segment's modification time, so retention still orders
+        segments by rotation, and only replaces the segment, under the
+        lock, once complete. Segments pruned meanwhile are skipped.
+        """
+        while True:
+            segment = self._segments.get()
+
+            if segment is None:
+                break
+
+            target = segment.with_name(f"{segment.name}.gz")
+            temporary = segment.with_name(f".{segment.name}.gz.tmp")
+
+            try:
+                with open(segment, "rb") as source, gzip.open(
+                    temporary, "wb"
+                ) as compressed:
+                    shutil.copyfileobj(source, compressed)
+                shutil.copystat(segment, temporary)
+
+                with self._lock:
+                    if segment.exists():
+                        os.replace(temporary, target)
+                        segment.unlink()
+            except FileNotFoundError:
+                pass
+            finally:
+                temporary.unlink(missing_ok=True)
+
+    def _write(self, lines: List[Any]) -> None:
+        """
+        Append rendered records to the buffered file.
+
+        Args:
+            lines (List[Any]): Records to be written, one per line.
+        """
+        chunk = "".join(f"{data}\n" for data in lines).encode("utf-8")
+
+        with self._lock:
+            file = self._file or self._open()
+
+            if self._rotation_due(len(chunk)):
+                self._rotate()
+                file = self._file
+
+            file.write(chunk)
+            self._unsynced += len(lines)
+            self._stats["records"] += len(lines)
+
+            if (
+                self._fsync == FSYNC_EVERY_N
+                and self._unsynced >= self._fsync_every
+            ) or (self._fsync == FSYNC_INTERVAL and self._flusher is None):
+                self._sync()
+
     def store(self, data: Any) -> None:
         """
         Append data to the storage file.
@@ -48,40 +334,470 @@ class FileStorageStrategy(StorageStrategy):
         Args:
             data (Any): Data to be written to the file.
         """
-        with open(self.filepath, "a", encoding="utf-8") as file:
-            file.write(f"{data}\n")
+        self._write([data])
+
+    def store_many(self, items: List[Any]) -> None:
+        """
+        Append a batch of records to the storage file in one write.
+
+        Args:
+            items (List[Any]): Records to be written to the file.
+        """
+        if items:
+            self._write(items)
+
+    def flush(self) -> None:
+        """
+        Write buffered records to the file.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush buffered records, fsync unless the policy is ``never``,
+        close the file and wait for pending segment compression.
+        """
+        self._stop.set()
+
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+
+        with self._lock:
+            if self._file is not None:
+                if self._fsync != FSYNC_NEVER:
+                    self._sync()
+
+                self._file.close()
+                self._file = None
+
+        if self._compressor is not None:
+            self._segments.put(None)
+            self._compressor.join()
+            self._compressor = None
+
+        self._stop.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report write counters.
+
+        Returns:
+            Dict[str, int]: Records written, fsync calls and rotations.
+        """
+        return dict(self._stats)
+
+
+ALERT_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS alerts (
+        id INTEGER PRIMARY KEY,
+        ts REAL NOT NULL,
+        metric TEXT NOT NULL,
+        value REAL NOT NULL,
+        endpoint TEXT,
+        state TEXT NOT NULL,
+        detector TEXT,
+        score REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS alerts_metric_ts ON alerts (metric, ts)",
+    "CREATE INDEX IF NOT EXISTS alerts_ts ON alerts (ts)",
+)
+
+# Columns added after the first schema, for databases created before.
+ALERT_MIGRATIONS = {
+    "detector": "ALTER TABLE alerts ADD COLUMN detector TEXT",
+    "score": "ALTER TABLE alerts ADD COLUMN score REAL",
+}
 
 
 class DatabaseStorageStrategy(StorageStrategy):
     """
-    Mock storage strategy simulating database persistence.
+    Storage strategy that persists alerts to a SQLite database.
+
+    A single connection in WAL journal mode is owned by a dedicated
+    writer thread, so callers only enqueue records and never wait on
+    disk. The writer drains up to `STORAGE_DB_BATCH_SIZE` records at a
+    time and inserts them with `executemany` in one transaction. If
+    that transaction fails, the batches are retried one by one, so only
+    a failing batch is lost; failures are logged and counted, and never
+    stop the writer. Query helpers use a separate read connection,
+    which WAL lets run alongside the writer.
     """
 
+    def __init__(self, path: str | None = None) -> None:
+        """
+        Initialize SQLite storage.
+
+        Ensures that the parent directory exists. The database, schema
+        and writer thread are created on first use.
+
+        Args:
+            path (str | None): Database file. Defaults to
+                `STORAGE_DB_PATH`.
+
+        Raises:
+            ValueError: If the configured synchronous mode is unsupported.
+        """
+        config = ConfigManager()
+        self.path = Path(path or config.get("STORAGE_DB_PATH"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = int(config.get("STORAGE_DB_BATCH_SIZE"))
+        self._synchronous = str(config.get("STORAGE_DB_SYNCHRONOUS")).upper()
+
+        if self._synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(
+                f"Unsupported synchronous mode: {self._synchronous}"
+            )
+
+        self._queue: queue.Queue = queue.Queue(
+            maxsize=int(config.get("STORAGE_DB_QUEUE_SIZE"))
+        )
+        self._lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._reader: sqlite3.Connection | None = None
+        self._stats = {"rows": 0, "transactions": 0, "failed_rows": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the database.
+
+        Returns:
+            sqlite3.Connection: Connection usable from any thread.
+        """
+        return sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+
+    def _ensure_started(self) -> None:
+        """
+        Create the schema and start the writer thread if needed.
+        """
+        with self._lock:
+            if self._writer is not None:
+                return
+
+            conn = self._connect()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self._synchronous}")
+
+            for statement in ALERT_SCHEMA:
+                conn.execute(statement)
+
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(alerts)")
+            }
+            for column, statement in ALERT_MIGRATIONS.items():
+                if column not in columns:
+                    conn.execute(statement)
+
+            self._writer = threading.Thread(
+                target=self._write_loop,
+                args=(conn,),
+                name=f"{type(self).__name__}-writer",
+                daemon=True,
+            )
+            self._writer.start()
+
+    def _write_loop(self, conn: sqlite3.Connection) -> None:
+        """
+        Insert queued rows in batched transactions until closed.
+
+        Args:
+            conn (sqlite3.Connection): Connection owned by this thread.
+        """
+        closing = False
+
+        while not closing:
+            batches = [self._queue.get()]
+            size = len(batches[0] or ())
+
+            while size < self._batch_size:
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batches.append(batch)
+                size += len(batch or ())
+
+            rows = [row for batch in batches if batch for row in batch]
+            closing = any(batch is None for batch in batches)
+
+            try:
+                if rows:
+                    self._commit(
+                        conn, rows, [batch for batch in batches if batch]
+                    )
+            finally:
+                for _ in batches:
+                    self._queue.task_done()
+
+        conn.close()
+
+    def _commit(
+        self,
+        conn: sqlite3.Connection,
+        rows: List[Tuple],
+        batches: List[List[Tuple]]
+    ) -> None:
+        """
+        Insert drained rows, falling back to one transaction per batch.
+
+        Any error is logged and counted instead of stopping the writer.
+
+        Args:
+            conn (sqlite3.Connection): Connection owned by the writer.
+            rows (List[Tuple]): Rows of all drained batches.
+            batches (List[List[Tuple]]): The drained batches.
+        """
+        try:
+            self._insert(conn, rows)
+            return
+        except Exception:
+            if len(batches) == 1:
+                logger.exception("Failed to store %d alerts", len(rows))
+                self._stats["failed_rows"] += len(rows)
+                return
+
+        for batch in batches:
+            try:
+                self._insert(conn, batch)
+            except Exception:
+                logger.exception("Failed to store %d alerts", len(batch))
+                self._stats["failed_rows"] += len(batch)
+
+    def _insert(self, conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+        """
+        Insert rows in one transaction, rolling back on any error.
+
+        Args:
+            conn (sqlite3.Connection): Connection owned by the writer.
+            rows (List[Tuple]): Rows built by `_row`.
+        """
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT INTO alerts "
+                "(ts, metric, value, endpoint, state, detector, "
+                "score) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+        self._stats["rows"] += len(rows)
+        self._stats["transactions"] += 1
+
+    @staticmethod
+    def _row(data: Any) -> Tuple[Any, ...]:
+        """
+        Convert a record into an ``alerts`` table row.
+
+        Args:
+            data (Any): `Alert` record or alert payload dictionary.
+
+        Returns:
+            Tuple[Any, ...]: Timestamp, metric, value, endpoint, state,
+            detector and score.
+
+        Raises:
+            ValueError: If the record is not an alert.
+        """
+        if isinstance(data, dict):
+            data = AlertProcessor().build(data)
+
+        if not isinstance(data, Alert):
+            raise ValueError(f"Unsupported alert record: {data!r}")
+
+        return (data.timestamp, data.metric, data.value,
+                data.endpoint, data.state, data.detector, data.score)
+
     def store(self, data: Any) -> None:
         """
-        Simulate storing data in a database.
+        Queue one alert for insertion.
 
         Args:
-            data (Any): Data to be stored.
+            data (Any): Alert record to be stored.
+        """
+        self.store_many([data])
+
+    def store_many(self, items: List[Any]) -> None:
+        """
+        Queue a batch of alerts for insertion.
+
+        Blocks only when the writer falls `STORAGE_DB_QUEUE_SIZE`
+        batches behind.
+
+        Args:
+            items (List[Any]): Alert records to be stored.
+        """
+        if not items:
+            return
+
+        self._ensure_started()
+        self._queue.put([self._row(data) for data in items])
+
+    def flush(self) -> None:
+        """
+        Wait until every queued alert has been committed.
+        """
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """
+        Commit queued alerts, stop the writer and close connections.
+        """
+        with self._lock:
+            writer, self._writer = self._writer, None
+
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def recent_alerts(
+        self,
+        metric: str | None = None,
+        since: float | None = None,
+        limit: int = 100
+    ) -> List[Alert]:
+        """
+        Fetch the most recent stored alerts, newest first.
+
+        Both filters are served by indexes on ``(metric, ts)`` and
+        ``ts``. Alerts still queued for the writer are not visible;
+        call `flush` first to include them.
+
+        Args:
+            metric (str | None): Only return alerts of this metric.
+            since (float | None): Only return alerts raised at or after
+                this Unix timestamp.
+            limit (int): Maximum number of alerts to return.
+
+        Returns:
+            List[Alert]: Matching alert records.
         """
-        # Simulated database write
-        print(f"[DB] Stored data: {data}")
+        self._ensure_started()
+        clauses, params = [], []
+
+        if metric is not None:
+            clauses.append("metric = ?")
+            params.append(metric)
+
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        params.append(limit)
+
+        with self._lock:
+            if self._reader is None:
+                self._reader = self._connect()
+
+            rows = self._reader.execute(
+                "SELECT ts, metric, value, endpoint, state, detector, score "
+                f"FROM alerts {where}ORDER BY ts DESC LIMIT ?",
+                params,
+            ).fetchall()
+
+        return [
+            Alert(metric, value, endpoint, state, ts, detector, score)
+            for ts, metric, value, endpoint, state, detector, score in rows
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report write counters.
+
+        Returns:
+            Dict[str, int]: Rows inserted, transactions committed, rows
+            that failed to insert and batches waiting for the writer.
+        """
+        return {**self._stats, "queued": self._queue.qsize()}
 
 
 class CloudStorageStrategy(StorageStrategy):
     """
-    Mock storage strategy simulating cloud-based persistence.
+    Storage strategy that persists alerts to an object store.
+
+    Alerts are batched into compressed objects by an
+    `ObjectStoreUploader` instead of being uploaded one by one. The
+    backend is chosen by `UPLOAD_BACKEND`; ``"local"`` writes objects
+    under `UPLOAD_LOCAL_PATH`.
     """
 
+    def __init__(self, client: ObjectStoreClient | None = None) -> None:
+        """
+        Initialize object store persistence.
+
+        Args:
+            client (ObjectStoreClient | None): Backend receiving the
+                objects. Defaults to the configured backend.
+
+        Raises:
+            ValueError: If the configured upload backend is unsupported.
+        """
+        if client is None:
+            config = ConfigManager()
+            backend = config.get("UPLOAD_BACKEND")
+
+            if backend != "local":
+                raise ValueError(f"Unsupported upload backend: {backend}")
+
+            client = LocalDirectoryClient(config.get("UPLOAD_LOCAL_PATH"))
+
+        self._uploader = ObjectStoreUploader(client)
+
     def store(self, data: Any) -> None:
         """
-        Simulate uploading data to cloud storage.
+        Add one alert to the current upload chunk.
 
         Args:
             data (Any): Data to be uploaded.
         """
-        # Simulated cloud upload
-        print(f"[CLOUD] Uploaded data: {data}")
+        self._uploader.add([data])
+
+    def store_many(self, items: List[Any]) -> None:
+        """
+        Add a batch of alerts to the current upload chunk.
+
+        Args:
+            items (List[Any]): Records to be uploaded.
+        """
+        if items:
+            self._uploader.add(items)
+
+    def flush(self) -> None:
+        """
+        Upload the current chunk and wait for pending uploads.
+        """
+        self._uploader.flush()
+
+    def close(self) -> None:
+        """
+        Upload everything still buffered and stop the uploader.
+        """
+        self._uploader.close()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report upload counters.
+
+        Returns:
+            Dict[str, float]: Counters of the underlying uploader.
+        """
+        return self._uploader.stats()
 
 
 class StorageContext:
@@ -101,6 +817,11 @@ class StorageContext:
         """
         self._config = ConfigManager()
         self._strategy = self._select_strategy()
+        self._write_time = MetricsRegistry().histogram(
+            "monitor_storage_write_seconds",
+            "Time spent persisting alerts per storage backend.",
+            ("backend",),
+        )
 
     def _select_strategy(self) -> StorageStrategy:
         """
@@ -135,6 +856,7 @@ class StorageContext:
                 ("file", "db", or "cloud").
         """
         self._config._config["STORAGE_BACKEND"] = backend
+        self._strategy.close()
         self._strategy = self._select_strategy()
 
     def store(self, data: Any) -> None:
@@ -144,4 +866,27 @@ class StorageContext:
         Args:
             data (Any): Data to be persisted.
         """
+        started = time.perf_counter()
         self._strategy.store(data)
+        self._write_time.labels(type(self._strategy).__name__).observe(
+            time.perf_counter() - started
+        )
+
+    def store_many(self, items: List[Any]) -> None:
+        """
+        Store a batch of records using the currently selected strategy.
+
+        Args:
+            items (List[Any]): Records to be persisted.
+        """
+        started = time.perf_counter()
+        self._strategy.store_many(items)
+        self._write_time.labels(type(self._strategy).__name__).observe(
+            time.perf_counter() - started
+        )
+
+    def close(self) -> None:
+        """
+        Flush and release the currently selected strategy.
+        """
+        self._strategy.close()
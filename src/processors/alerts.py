@@ -1,13 +1,109 @@
+import sys
+import time
 from typing import Dict, Any
 from src.processors.base import DataProcessor
 
 
+FIRING = "firing"
+RESOLVED = "resolved"
+ANOMALY = "anomaly"
+
+
+class Alert:
+    """
+    Compact structured alert record.
+
+    Alerts travel from the monitor to storage as slotted records and
+    are only rendered to text by backends that need text, so binary
+    backends never pay for string formatting.
+    """
+
+    __slots__ = ("timestamp", "metric", "value", "endpoint", "state",
+                 "detector", "score")
+
+    def __init__(
+        self,
+        metric: str,
+        value: float,
+        endpoint: str | None = None,
+        state: str = FIRING,
+        timestamp: float | None = None,
+        detector: str | None = None,
+        score: float | None = None
+    ) -> None:
+        """
+        Initialize an alert record.
+
+        Metric names are interned, so records of the same metric share
+        one string however many of them are held.
+
+        Args:
+            metric (str): Metric name.
+            value (float): Metric value that triggered the event.
+            endpoint (str | None): Reporting endpoint, if known.
+            state (str): ``"firing"``, ``"resolved"`` or ``"anomaly"``.
+            timestamp (float | None): Event time in seconds since the
+                epoch. Defaults to now.
+            detector (str | None): Name of the detector that raised an
+                anomaly.
+            score (float | None): Detector score of an anomaly.
+        """
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.metric = sys.intern(metric)
+        self.value = value
+        self.endpoint = endpoint
+        self.state = state
+        self.detector = detector
+        self.score = score
+
+    def render(self) -> str:
+        """
+        Format the record as a human-readable alert message.
+
+        Returns:
+            str: Alert, resolution or anomaly message.
+        """
+        if self.state == RESOLVED:
+            return (
+                f"RESOLVED: {self.metric} back within threshold "
+                f"with value {self.value}"
+            )
+
+        if self.state == ANOMALY:
+            return (
+                f"ANOMALY: {self.metric} deviates from recent behaviour "
+                f"with value {self.value}"
+            )
+
+        return (
+            f"ALERT: {self.metric} crossed threshold "
+            f"with value {self.value}"
+        )
+
+    __str__ = render
+
+    def __repr__(self) -> str:
+        """
+        Debug representation of the record.
+
+        Returns:
+            str: Representation listing all fields.
+        """
+        return (
+            f"Alert(metric={self.metric!r}, value={self.value!r}, "
+            f"endpoint={self.endpoint!r}, state={self.state!r}, "
+            f"timestamp={self.timestamp!r}, detector={self.detector!r}, "
+            f"score={self.score!r})"
+        )
+
+
 class AlertProcessor(DataProcessor):
     """
-    Processor responsible for generating human-readable alert messages.
+    Processor responsible for generating alert records and messages.
 
-    This processor validates metric event data and formats it into
-    an alert message when threshold conditions are met.
+    This processor validates metric event data and turns it into an
+    `Alert` record, which can be rendered into a human-readable alert
+    message when threshold conditions are met.
     """
 
     def validate(self, data: Dict[str, Any]) -> bool:
@@ -27,15 +123,16 @@ class AlertProcessor(DataProcessor):
             and "value" in data
         )
 
-    def process(self, data: Dict[str, Any]) -> str:
+    def build(self, data: Dict[str, Any]) -> Alert:
         """
-        Generate an alert message from validated metric data.
+        Build a structured alert record from metric event data.
 
         Args:
-            data (Dict[str, Any]): Validated metric event data.
+            data (Dict[str, Any]): Metric event data, optionally carrying
+                ``endpoint``, ``state``, ``detector`` and ``score``.
 
         Returns:
-            str: Formatted alert message.
+            Alert: Alert record stamped with the current time.
 
         Raises:
             ValueError: If the input data fails validation.
@@ -43,7 +140,28 @@ class AlertProcessor(DataProcessor):
         if not self.validate(data):
             raise ValueError("Invalid alert data")
 
-        return (
-            f"ALERT: {data['metric']} crossed threshold "
-            f"with value {data['value']}"
+        return Alert(
+            data["metric"],
+            data["value"],
+            data.get("endpoint"),
+            data.get("state", FIRING),
+            detector=data.get("detector"),
+            score=data.get("score"),
         )
+
+    def process(self, data: Dict[str, Any]) -> str:
+        """
+        Generate an alert message from validated metric data.
+
+        Data carrying ``state="resolved"`` produces a resolution message.
+
+        Args:
+            data (Dict[str, Any]): Validated metric event data.
+
+        Returns:
+            str: Formatted alert message.
+
+        Raises:
+            ValueError: If the input data fails validation.
+        """
+        return self.build(data).render()
@@ -0,0 +1,181 @@
+import time
+from array import array
+from typing import Dict, List, Set, Tuple
+
+from src.rules.engine import RuleEngine
+
+
+PENDING = 1
+FIRING = 2
+
+FIRING_EVENT = "firing"
+RESOLVED_EVENT = "resolved"
+
+
+class AlertStateTable:
+    """
+    Tracks the alert state of every (endpoint, metric) series.
+
+    Only state transitions are reported: a series fires once when its
+    breach has lasted the rule's ``for`` duration, is re-notified only
+    every ``renotify`` seconds while it keeps firing, and resolves once
+    its value is back inside the rule's clear interval.
+
+    Series that are not pending or firing are not stored at all. The
+    state of active series lives in parallel typed arrays indexed by a
+    slot number, so each entry costs a dictionary slot plus 17 bytes,
+    and every update is O(1).
+    """
+
+    def __init__(self, rules: RuleEngine) -> None:
+        """
+        Initialize an empty state table.
+
+        Args:
+            rules (RuleEngine): Engine resolving the rule of each series.
+        """
+        self._rules = rules
+        self._slots: Dict[Tuple[str, str], int] = {}
+        self._active: Dict[str, Set[str]] = {}
+        self._free: List[int] = []
+        self._state = array("B")
+        self._since = array("d")
+        self._notified = array("d")
+
+    def __len__(self) -> int:
+        """
+        Number of pending or firing series.
+        """
+        return len(self._slots)
+
+    def _allocate(self, key: Tuple[str, str], state: int, now: float) -> None:
+        """
+        Start tracking a series.
+
+        Args:
+            key (Tuple[str, str]): Endpoint and metric name.
+            state (int): Initial state.
+            now (float): Current monotonic time.
+        """
+        if self._free:
+            slot = self._free.pop()
+            self._state[slot] = state
+            self._since[slot] = now
+            self._notified[slot] = now
+        else:
+            slot = len(self._state)
+            self._state.append(state)
+            self._since.append(now)
+            self._notified.append(now)
+
+        self._slots[key] = slot
+        self._active.setdefault(key[0], set()).add(key[1])
+
+    def _release(self, key: Tuple[str, str]) -> None:
+        """
+        Stop tracking a series and recycle its slot.
+
+        Args:
+            key (Tuple[str, str]): Endpoint and metric name.
+        """
+        self._free.append(self._slots.pop(key))
+        active = self._active[key[0]]
+        active.discard(key[1])
+
+        if not active:
+            del self._active[key[0]]
+
+    def state(self, endpoint: str, metric: str) -> str:
+        """
+        Report the state of a series.
+
+        Args:
+            endpoint (str): Endpoint of the series.
+            metric (str): Metric name of the series.
+
+        Returns:
+            str: ``"ok"``, ``"pending"`` or ``"firing"``.
+        """
+        slot = self._slots.get((endpoint, metric))
+
+        if slot is None:
+            return "ok"
+
+        return "firing" if self._state[slot] == FIRING else "pending"
+
+    def update(
+        self,
+        endpoint: str,
+        metrics: Dict[str, float],
+        breaches: List[Tuple[str, float]],
+        now: float | None = None
+    ) -> List[Tuple[str, float, str]]:
+        """
+        Apply one evaluated payload and collect state transitions.
+
+        Metrics that are active but absent from the payload keep their
+        state, so partial (delta) payloads are handled correctly.
+
+        Args:
+            endpoint (str): Endpoint that reported the payload.
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            breaches (List[Tuple[str, float]]): Breaching metrics of the
+                payload, as returned by `RuleEngine.evaluate`.
+            now (float | None): Monotonic time of the payload.
+
+        Returns:
+            List[Tuple[str, float, str]]: Metric, value and event
+            (``"firing"`` or ``"resolved"``) of every transition.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        events = []
+        active = self._active.get(endpoint)
+        breached = set() if active else None
+
+        for metric, value in breaches:
+            key = (endpoint, metric)
+            slot = self._slots.get(key)
+            rule = self._rules.resolve(metric, endpoint)
+
+            if breached is not None:
+                breached.add(metric)
+
+            if slot is None:
+                if rule.for_seconds > 0:
+                    self._allocate(key, PENDING, now)
+                else:
+                    self._allocate(key, FIRING, now)
+                    events.append((metric, value, FIRING_EVENT))
+
+            elif self._state[slot] == PENDING:
+                if now - self._since[slot] >= rule.for_seconds:
+                    self._state[slot] = FIRING
+                    self._notified[slot] = now
+                    events.append((metric, value, FIRING_EVENT))
+
+            elif rule.renotify_seconds > 0 and (
+                now - self._notified[slot] >= rule.renotify_seconds
+            ):
+                self._notified[slot] = now
+                events.append((metric, value, FIRING_EVENT))
+
+        if not active:
+            return events
+
+        for metric in active - breached:
+            value = metrics.get(metric)
+
+            if value is None:
+                continue
+
+            key = (endpoint, metric)
+
+            if self._state[self._slots[key]] == PENDING:
+                self._release(key)
+            elif self._rules.resolve(metric, endpoint).is_clear(value):
+                self._release(key)
+                events.append((metric, value, RESOLVED_EVENT))
+
+        return events
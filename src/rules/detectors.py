@@ -0,0 +1,693 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.metaclasses.config_manager import ConfigManager
+
+
+INITIAL_CAPACITY = 64
+
+
+class Detector(ABC):
+    """
+    Abstract base class for online anomaly detectors.
+
+    Detectors keep the state of every (endpoint, metric) series in
+    struct-of-arrays form: each state variable is one NumPy array with
+    a row per series, and series are mapped to rows through a single
+    dictionary. A payload is processed with a handful of vectorized
+    operations over the rows of its metrics, so there is no Python
+    object per series and no Python loop per sample.
+
+    A series that keeps misbehaving is reported once per hold-down
+    period: after an anomaly is reported, further anomalies of the same
+    series are suppressed for `holddown` seconds.
+    """
+
+    name = "detector"
+
+    def __init__(self, holddown: float | None = None) -> None:
+        """
+        Initialize empty detector state.
+
+        Args:
+            holddown (float | None): Seconds during which repeated
+                anomalies of a series are suppressed. Defaults to
+                `DETECTOR_HOLDDOWN_SECONDS`.
+        """
+        if holddown is None:
+            holddown = ConfigManager().get("DETECTOR_HOLDDOWN_SECONDS")
+
+        self.holddown = float(holddown)
+        self._slots: Dict[Tuple[str, str], int] = {}
+        self._capacity = 0
+        self._grow(INITIAL_CAPACITY)
+
+    @abstractmethod
+    def _columns(self) -> Dict[str, Tuple[float, Tuple[int, ...]]]:
+        """
+        Describe the per-series state arrays.
+
+        Returns:
+            Dict[str, Tuple[float, Tuple[int, ...]]]: Attribute names
+            mapped to their initial value and per-series shape.
+        """
+        pass
+
+    def _state(self) -> Dict[str, Tuple[float, Tuple[int, ...]]]:
+        """
+        Describe every per-series array, including the report time.
+
+        Returns:
+            Dict[str, Tuple[float, Tuple[int, ...]]]: `_columns` plus
+            the time each series was last reported.
+        """
+        return {**self._columns(), "_reported": (np.nan, ())}
+
+    @abstractmethod
+    def _step(
+        self,
+        rows: np.ndarray,
+        values: np.ndarray,
+        timestamp: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score new samples and fold them into the state.
+
+        Args:
+            rows (np.ndarray): State rows of the sampled series.
+            values (np.ndarray): New sample values.
+            timestamp (float): Sample time in seconds since the epoch.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Anomaly flags and scores.
+        """
+        pass
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Resize every state array to hold `capacity` series.
+
+        Args:
+            capacity (int): New number of rows.
+        """
+        for attribute, (fill, shape) in self._state().items():
+            grown = np.full((capacity,) + shape, fill)
+
+            if self._capacity:
+                grown[:self._capacity] = getattr(self, attribute)
+
+            setattr(self, attribute, grown)
+
+        self._capacity = capacity
+
+    def _rows(self, endpoint: str, names: List[str]) -> np.ndarray:
+        """
+        Map the metrics of a payload to state rows, adding new series.
+
+        Args:
+            endpoint (str): Endpoint that reported the payload.
+            names (List[str]): Metric names.
+
+        Returns:
+            np.ndarray: Row index of each metric.
+        """
+        rows = []
+
+        for name in names:
+            row = self._slots.get((endpoint, name))
+
+            if row is None:
+                row = self._slots[(endpoint, name)] = len(self._slots)
+
+            rows.append(row)
+
+        if len(self._slots) > self._capacity:
+            self._grow(max(len(self._slots), 2 * self._capacity))
+
+        return np.array(rows, dtype=np.intp)
+
+    def update(
+        self,
+        endpoint: str,
+        metrics: Dict[str, float],
+        timestamp: float
+    ) -> List[Tuple[str, float, float]]:
+        """
+        Process one payload.
+
+        Non-finite values are ignored, and anomalies of a series are
+        only reported once per hold-down period.
+
+        Args:
+            endpoint (str): Endpoint that reported the payload.
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            timestamp (float): Sample time in seconds since the epoch.
+
+        Returns:
+            List[Tuple[str, float, float]]: Anomalous metric names,
+            values and scores, in payload order.
+        """
+        names = list(metrics)
+        values = np.fromiter(metrics.values(), np.float64, len(names))
+        finite = np.isfinite(values)
+
+        if not finite.all():
+            names = [name for name, ok in zip(names, finite) if ok]
+            values = values[finite]
+
+        if not names:
+            return []
+
+        rows = self._rows(endpoint, names)
+        flags, scores = self._step(rows, values, timestamp)
+        flags &= ~(timestamp - self._reported[rows] < self.holddown)
+        self._reported[rows[flags]] = timestamp
+        return [
+            (names[i], metrics[names[i]], float(scores[i]))
+            for i in np.flatnonzero(flags).tolist()
+        ]
+
+    def __len__(self) -> int:
+        """
+        Number of tracked series.
+
+        Returns:
+            int: Series count.
+        """
+        return len(self._slots)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the state arrays.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return sum(
+            getattr(self, attribute).nbytes for attribute in self._state()
+        )
+
+
+class EWMADetector(Detector):
+    """
+    Exponentially weighted moving average and variance z-score.
+
+    Each series tracks an EWMA of its values and an exponentially
+    weighted variance, both updated in O(1). A sample is anomalous when
+    it lies more than `threshold` standard deviations from the average,
+    once the series has seen `warmup` samples.
+    """
+
+    name = "ewma"
+
+    def __init__(
+        self,
+        alpha: float | None = None,
+        threshold: float | None = None,
+        warmup: int | None = None,
+        holddown: float | None = None
+    ) -> None:
+        """
+        Initialize the detector.
+
+        Args:
+            alpha (float | None): Smoothing factor between 0 and 1.
+                Defaults to `DETECTOR_EWMA_ALPHA`.
+            threshold (float | None): Z-score limit. Defaults to
+                `DETECTOR_Z_THRESHOLD`.
+            warmup (int | None): Samples before flagging starts.
+                Defaults to `DETECTOR_WARMUP`.
+            holddown (float | None): Seconds between reports of one
+                series. Defaults to `DETECTOR_HOLDDOWN_SECONDS`.
+        """
+        config = ConfigManager()
+        self.alpha = float(
+            config.get("DETECTOR_EWMA_ALPHA") if alpha is None else alpha
+        )
+        self.threshold = float(
+            config.get("DETECTOR_Z_THRESHOLD") if threshold is None
+            else threshold
+        )
+        self.warmup = int(
+            config.get("DETECTOR_WARMUP") if warmup is None else warmup
+        )
+        super().__init__(holddown)
+
+    def _columns(self) -> Dict[str, Tuple[float, Tuple[int, ...]]]:
+        """
+        Average, variance and sample count per series.
+        """
+        return {"_mean": (0.0, ()), "_var": (0.0, ()), "_seen": (0, ())}
+
+    def _step(
+        self,
+        rows: np.ndarray,
+        values: np.ndarray,
+        timestamp: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score samples against the EWMA and update it.
+        """
+        mean = self._mean[rows]
+        var = self._var[rows]
+        seen = self._seen[rows]
+
+        diff = values - mean
+        std = np.sqrt(var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(std > 0, diff / std, 0.0)
+
+        flags = (seen >= self.warmup) & (np.abs(scores) > self.threshold)
+
+        first = seen == 0
+        increment = np.where(first, diff, self.alpha * diff)
+        self._mean[rows] = mean + increment
+        self._var[rows] = np.where(
+            first, 0.0, (1 - self.alpha) * (var + diff * increment)
+        )
+        self._seen[rows] = seen + 1
+        return flags, scores
+
+
+class RollingIQRDetector(Detector):
+    """
+    Interquartile range rule over a sliding window of recent samples.
+
+    Each series keeps its last `window` samples in a ring, in arrival
+    order. For each quartile the ring slots are also split into two
+    binary heaps: a max-heap of the lowest samples, sized so that its
+    top is the sample just below the quartile, and a min-heap of the
+    rest, whose top is the sample just above it. A position array
+    locates every slot in its heap.
+
+    Once the window is full, a new sample overwrites the ring slot of
+    the oldest one, so it takes over that slot's heap position and is
+    sifted from there; if it crossed to the other side of the quartile
+    the two heap tops are exchanged. Filling the window pushes the new
+    slot and moves at most one top across. Either way an update is
+    O(log w) per sample, and the heaps of all series in a payload are
+    sifted together, one vectorized step per heap level. A sample is
+    anomalous when it lies more than `k` IQRs outside the quartiles of
+    the window before it.
+    """
+
+    name = "iqr"
+    quartiles = (0.25, 0.75)
+
+    def __init__(
+        self,
+        window: int | None = None,
+        k: float | None = None,
+        warmup: int | None = None,
+        holddown: float | None = None
+    ) -> None:
+        """
+        Initialize the detector.
+
+        Args:
+            window (int | None): Samples per window. Defaults to
+                `DETECTOR_WINDOW`.
+            k (float | None): IQR multiplier. Defaults to
+                `DETECTOR_IQR_K`.
+            warmup (int | None): Samples before flagging starts.
+                Defaults to `DETECTOR_WARMUP`.
+            holddown (float | None): Seconds between reports of one
+                series. Defaults to `DETECTOR_HOLDDOWN_SECONDS`.
+
+        Raises:
+            ValueError: If the window holds fewer than two samples.
+        """
+        config = ConfigManager()
+        self.window = int(
+            config.get("DETECTOR_WINDOW") if window is None else window
+        )
+        self.k = float(config.get("DETECTOR_IQR_K") if k is None else k)
+        self.warmup = int(
+            config.get("DETECTOR_WARMUP") if warmup is None else warmup
+        )
+
+        if self.window < 2:
+            raise ValueError(f"Window must hold two samples: {self.window}")
+
+        super().__init__(holddown)
+
+    def _columns(self) -> Dict[str, Tuple[float, Tuple[int, ...]]]:
+        """
+        Ring of negated and plain samples, ring head and fill count per
+        series, plus for each quartile the lower and upper heaps of ring
+        slots, their sizes and the heap position of every slot.
+
+        The ring has one extra slot that is never written; it stays NaN
+        and fills the unused heap positions, so a sift can compare with
+        missing children and the root's parent without bounds checks.
+        """
+        window, splits = self.window, len(self.quartiles)
+        return {
+            "_ring": (np.nan, (2, window + 1)),
+            "_head": (0, ()),
+            "_count": (0, ()),
+            "_heaps": (np.int32(window), (splits, 2, 2 * window + 1)),
+            "_sizes": (0, (splits, 2)),
+            "_place": (np.int32(-1), (splits, window)),
+        }
+
+    def _views(self) -> Tuple[np.ndarray, ...]:
+        """
+        Flat views of the heap state.
+
+        Heaps are numbered ``(row * len(quartiles) + quartile) * 2 +
+        side``, with side 0 for the lower max-heap and 1 for the upper
+        min-heap. Keys are read from ``_ring[row, side]``, where the
+        lower side holds negated samples, so every heap is a min-heap.
+
+        Returns:
+            Tuple[np.ndarray, ...]: Heap slots and keys, by heap number;
+            heap sizes; slot positions, by heap number halved.
+        """
+        return (self._heaps.reshape(-1, self._heaps.shape[-1]),
+                self._ring.reshape(-1, self.window + 1),
+                self._sizes.reshape(-1),
+                self._place.reshape(-1, self.window))
+
+    def _key_rows(self, heaps: np.ndarray) -> np.ndarray:
+        """
+        Rows of the flat key view that order each heap.
+
+        Args:
+            heaps (np.ndarray): Heap numbers.
+
+        Returns:
+            np.ndarray: ``row * 2 + side`` of each heap.
+        """
+        return (heaps >> 1) // len(self.quartiles) * 2 + (heaps & 1)
+
+    def _sift_up(self, heaps: np.ndarray, pos: np.ndarray) -> None:
+        """
+        Move entries towards the root while they are below their parent.
+
+        Args:
+            heaps (np.ndarray): Distinct heap numbers.
+            pos (np.ndarray): Position of the entry in each heap.
+        """
+        slots, keys, _, place = self._views()
+        key_rows = self._key_rows(heaps)
+        offset = (heaps & 1) * self.window
+        entry = slots[heaps, pos]
+        key = keys[key_rows, entry]
+
+        while True:
+            # The root's parent is the last, always unused, position.
+            parent = (pos - 1) >> 1
+            above = slots[heaps, parent]
+            move = key < keys[key_rows, above]
+
+            if not move.any():
+                return
+
+            # Entries that stay are rewritten in place.
+            parent = np.where(move, parent, pos)
+            above = np.where(move, above, entry)
+            slots[heaps, pos], slots[heaps, parent] = above, entry
+            place[heaps >> 1, above] = offset + pos
+            place[heaps >> 1, entry] = offset + parent
+            pos = parent
+
+    def _sift_down(self, heaps: np.ndarray, pos: np.ndarray) -> None:
+        """
+        Move entries towards the leaves while they are above a child.
+
+        Args:
+            heaps (np.ndarray): Distinct heap numbers.
+            pos (np.ndarray): Position of the entry in each heap.
+        """
+        slots, keys, _, place = self._views()
+        key_rows = self._key_rows(heaps)
+        offset = (heaps & 1) * self.window
+        entry = slots[heaps, pos]
+        key = keys[key_rows, entry]
+
+        while True:
+            left = 2 * pos + 1
+            left_slot, right_slot = slots[heaps, left], slots[heaps, left + 1]
+            left_key = keys[key_rows, left_slot]
+            right_key = keys[key_rows, right_slot]
+            pick = right_key < left_key
+            move = np.where(pick, right_key, left_key) < key
+
+            if not move.any():
+                return
+
+            # Entries that stay are rewritten in place.
+            child = np.where(move, left + pick, pos)
+            below = np.where(move, np.where(pick, right_slot, left_slot), entry)
+            slots[heaps, pos], slots[heaps, child] = below, entry
+            place[heaps >> 1, below] = offset + pos
+            place[heaps >> 1, entry] = offset + child
+            pos = child
+
+    def _push(self, heaps: np.ndarray, entries: np.ndarray) -> None:
+        """
+        Add one ring slot to each heap.
+
+        Args:
+            heaps (np.ndarray): Distinct heap numbers.
+            entries (np.ndarray): Ring slot to add to each heap.
+        """
+        slots, _, sizes, place = self._views()
+        pos = sizes[heaps]
+        slots[heaps, pos] = entries
+        place[heaps >> 1, entries] = (heaps & 1) * self.window + pos
+        sizes[heaps] = pos + 1
+        self._sift_up(heaps, pos)
+
+    def _pop(self, heaps: np.ndarray) -> np.ndarray:
+        """
+        Remove the top entry of each heap.
+
+        Args:
+            heaps (np.ndarray): Distinct heap numbers.
+
+        Returns:
+            np.ndarray: Removed ring slots.
+        """
+        slots, _, sizes, place = self._views()
+        top = slots[heaps, 0]
+        size = sizes[heaps] - 1
+        moved = slots[heaps, size]
+        slots[heaps, size] = self.window
+        slots[heaps, 0] = moved
+        place[heaps >> 1, top] = -1
+        place[heaps >> 1, moved] = (heaps & 1) * self.window
+        sizes[heaps] = size
+        self._sift_down(heaps, np.zeros_like(heaps))
+        return top
+
+    def _slide(self, rows: np.ndarray, head: np.ndarray) -> None:
+        """
+        Re-sift the overwritten slots of full windows.
+
+        Args:
+            rows (np.ndarray): State rows with a full window.
+            head (np.ndarray): Ring slot that received the new sample.
+        """
+        slots, keys, _, place = self._views()
+        splits, window = len(self.quartiles), self.window
+        pairs = (rows[:, None] * splits + np.arange(splits)).ravel()
+        entries = np.repeat(head, splits)
+
+        position = place[pairs, entries]
+        heaps = pairs * 2 + (position >= window)
+        self._sift_up(heaps, position % window)
+        self._sift_down(heaps, place[pairs, entries] % window)
+
+        # A sample that crossed the quartile swaps the two heap tops.
+        lower = pairs * 2
+        below, above = slots[lower, 0], slots[lower + 1, 0]
+        crossed = np.flatnonzero(
+            -keys[self._key_rows(lower), below]
+            > keys[self._key_rows(lower + 1), above]
+        )
+
+        if not crossed.size:
+            return
+
+        lower, below, above = lower[crossed], below[crossed], above[crossed]
+        slots[lower, 0], slots[lower + 1, 0] = above, below
+        place[lower >> 1, above], place[lower >> 1, below] = 0, window
+        self._sift_down(lower, np.zeros_like(lower))
+        self._sift_down(lower + 1, np.zeros_like(lower))
+
+    def _fill(
+        self,
+        rows: np.ndarray,
+        head: np.ndarray,
+        count: np.ndarray
+    ) -> None:
+        """
+        Add the new slots of windows that are still filling.
+
+        Args:
+            rows (np.ndarray): State rows with room in their window.
+            head (np.ndarray): Ring slot that received the new sample.
+            count (np.ndarray): Samples in each window, including it.
+        """
+        slots, keys, sizes, _ = self._views()
+        splits = len(self.quartiles)
+        lower = (rows[:, None] * splits + np.arange(splits)).ravel() * 2
+        entries = np.repeat(head, splits)
+        sample = keys[self._key_rows(lower + 1), entries]
+
+        side = np.where(
+            sizes[lower] > 0,
+            sample > -keys[self._key_rows(lower), slots[lower, 0]],
+            sample > keys[self._key_rows(lower + 1), slots[lower + 1, 0]],
+        )
+        self._push(lower + side, entries)
+
+        # Move one top across if the lower heap is not at its target
+        # size, which puts its top at the quartile's lower rank.
+        target = np.floor(
+            (count - 1)[:, None] * self.quartiles
+        ).astype(np.intp).ravel() + 1
+        size = sizes[lower]
+        source = np.concatenate((
+            lower[size > target], lower[size < target] + 1
+        ))
+
+        if source.size:
+            self._push(source ^ 1, self._pop(source))
+
+    def _step(
+        self,
+        rows: np.ndarray,
+        values: np.ndarray,
+        timestamp: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score samples against their windows and slide the windows.
+        """
+        window = self.window
+        count = self._count[rows]
+        head = self._head[rows]
+
+        # Quartiles interpolate between the two heap tops.
+        position = np.maximum(count - 1, 0)[:, None] * self.quartiles
+        frac = position - np.floor(position)
+        tops = self._ring[rows[:, None, None], 1, self._heaps[rows, :, :, 0]]
+        below = tops[:, :, 0]
+        above = np.where(frac > 0, tops[:, :, 1], below)
+        quartiles = below + frac * (above - below)
+
+        with np.errstate(invalid="ignore"):
+            q1, q3 = quartiles[:, 0], quartiles[:, -1]
+            iqr = q3 - q1
+            lower = q1 - self.k * iqr
+            upper = q3 + self.k * iqr
+            scores = np.where(
+                values > upper, values - upper,
+                np.where(values < lower, values - lower, 0.0),
+            ) / np.where(iqr > 0, iqr, 1.0)
+
+        flags = (count >= self.warmup) & ((values < lower) | (values > upper))
+
+        self._ring[rows, 0, head] = -values
+        self._ring[rows, 1, head] = values
+        full = count == window
+        grown = np.minimum(count + 1, window)
+
+        if full.any():
+            self._slide(rows[full], head[full])
+        if not full.all():
+            self._fill(rows[~full], head[~full], grown[~full])
+
+        self._head[rows] = (head + 1) % window
+        self._count[rows] = grown
+        return flags, scores
+
+
+class RateOfChangeDetector(Detector):
+    """
+    Flags samples that changed faster than a fixed rate.
+
+    Each series keeps its previous value and timestamp; a sample is
+    anomalous when ``|value - previous| / elapsed`` exceeds `max_rate`
+    units per second.
+    """
+
+    name = "rate"
+
+    def __init__(
+        self,
+        max_rate: float | None = None,
+        holddown: float | None = None
+    ) -> None:
+        """
+        Initialize the detector.
+
+        Args:
+            max_rate (float | None): Largest normal change per second.
+                Defaults to `DETECTOR_MAX_RATE`.
+            holddown (float | None): Seconds between reports of one
+                series. Defaults to `DETECTOR_HOLDDOWN_SECONDS`.
+        """
+        self.max_rate = float(
+            ConfigManager().get("DETECTOR_MAX_RATE") if max_rate is None
+            else max_rate
+        )
+        super().__init__(holddown)
+
+    def _columns(self) -> Dict[str, Tuple[float, Tuple[int, ...]]]:
+        """
+        Previous value and timestamp per series.
+        """
+        return {"_last": (np.nan, ()), "_last_ts": (np.nan, ())}
+
+    def _step(
+        self,
+        rows: np.ndarray,
+        values: np.ndarray,
+        timestamp: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score samples by their rate of change and remember them.
+        """
+        elapsed = timestamp - self._last_ts[rows]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = (values - self._last[rows]) / elapsed
+
+        flags = (elapsed > 0) & (np.abs(scores) > self.max_rate)
+        scores = np.nan_to_num(scores, nan=0.0, posinf=0.0, neginf=0.0)
+
+        self._last[rows] = values
+        self._last_ts[rows] = timestamp
+        return flags, scores
+
+
+DETECTORS = {
+    EWMADetector.name: EWMADetector,
+    RollingIQRDetector.name: RollingIQRDetector,
+    RateOfChangeDetector.name: RateOfChangeDetector,
+}
+
+
+def create_detector(name: str) -> Detector:
+    """
+    Create a detector by name with its configured settings.
+
+    Args:
+        name (str): ``"ewma"``, ``"iqr"`` or ``"rate"``.
+
+    Returns:
+        Detector: New detector.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if name not in DETECTORS:
+        raise ValueError(f"Unsupported detector: {name}")
+
+    return DETECTORS[name]()
@@ -0,0 +1,401 @@
+import fnmatch
+import math
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from src.metaclasses.config_manager import ConfigManager
+
+
+ABOVE = "above"
+BELOW = "below"
+RANGE = "range"
+
+PLAN_CACHE_SIZE = 1024
+RESOLVE_CACHE_SIZE = 65536
+
+
+class _LRUCache(OrderedDict):
+    """
+    Mapping that keeps at most `maxsize` entries, evicting the least
+    recently used one.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries.
+        """
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up an entry and mark it as most recently used.
+
+        Args:
+            key (Hashable): Entry key.
+            default (Any): Value returned when the key is missing.
+
+        Returns:
+            Any: Cached value, or `default`.
+        """
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            return default
+
+        return self[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one when full.
+
+        Args:
+            key (Hashable): Entry key.
+            value (Any): Value to cache.
+        """
+        self[key] = value
+        self.move_to_end(key)
+
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class Rule:
+    """
+    A compiled threshold rule.
+
+    Every rule is reduced to an allowed interval ``[low, high]``: a
+    value breaches the rule when it falls outside of it. ``above``
+    rules only set `high`, ``below`` rules only set `low`, and
+    ``range`` rules set both.
+
+    A firing alert only resolves once the value is back inside the
+    clear interval ``[clear_low, clear_high]``, which may be narrower
+    than the trigger interval to provide hysteresis.
+    """
+
+    __slots__ = ("metric", "host", "direction", "low", "high",
+                 "clear_low", "clear_high", "for_seconds",
+                 "renotify_seconds", "_metric_regex", "_host_regex")
+
+    def __init__(
+        self,
+        spec: Dict[str, Any],
+        for_seconds: float = 0.0,
+        renotify_seconds: float = 0.0
+    ) -> None:
+        """
+        Compile a rule from its configuration entry.
+
+        Args:
+            spec (Dict[str, Any]): Rule definition with a ``metric`` name
+                or glob, an optional ``host`` glob, and either a
+                ``threshold`` with ``direction`` (``"above"`` by default)
+                or ``min``/``max`` bounds. Optional keys: ``clear`` (or
+                ``clear_min``/``clear_max`` for ranges) for the clear
+                threshold, ``for`` for the seconds a breach must last
+                before firing, and ``renotify`` for the seconds between
+                repeated notifications of a firing alert (0 disables).
+            for_seconds (float): Default for ``for``.
+            renotify_seconds (float): Default for ``renotify``.
+
+        Raises:
+            ValueError: If the definition is incomplete or inconsistent.
+        """
+        if "metric" not in spec:
+            raise ValueError(f"Rule without metric: {spec}")
+
+        self.metric = spec["metric"]
+        self.host = spec.get("host")
+        self.low = -math.inf
+        self.high = math.inf
+
+        if "min" in spec or "max" in spec:
+            self.direction = RANGE
+            self.low = float(spec.get("min", -math.inf))
+            self.high = float(spec.get("max", math.inf))
+        elif "threshold" in spec:
+            self.direction = spec.get("direction", ABOVE)
+            if self.direction == ABOVE:
+                self.high = float(spec["threshold"])
+            elif self.direction == BELOW:
+                self.low = float(spec["threshold"])
+            else:
+                raise ValueError(f"Unsupported direction: {self.direction}")
+        else:
+            raise ValueError(f"Rule without threshold or range: {spec}")
+
+        self.clear_low = self.low
+        self.clear_high = self.high
+
+        if self.direction == RANGE:
+            self.clear_low = float(spec.get("clear_min", self.low))
+            self.clear_high = float(spec.get("clear_max", self.high))
+        elif self.direction == ABOVE:
+            self.clear_high = float(spec.get("clear", self.high))
+        else:
+            self.clear_low = float(spec.get("clear", self.low))
+
+        if not self.low <= self.clear_low <= self.clear_high <= self.high:
+            raise ValueError(f"Clear bounds must lie within bounds: {spec}")
+
+        self.for_seconds = float(spec.get("for", for_seconds))
+        self.renotify_seconds = float(spec.get("renotify", renotify_seconds))
+
+        self._metric_regex = (
+            re.compile(fnmatch.translate(self.metric))
+            if self.is_pattern else None
+        )
+        self._host_regex = (
+            re.compile(fnmatch.translate(self.host))
+            if self.host is not None else None
+        )
+
+    @property
+    def is_pattern(self) -> bool:
+        """
+        Whether the metric name is a glob pattern.
+
+        Returns:
+            bool: True if the name contains glob metacharacters.
+        """
+        return any(char in self.metric for char in "*?[")
+
+    def is_clear(self, value: float) -> bool:
+        """
+        Check whether a value is inside the clear interval.
+
+        Args:
+            value (float): Metric value.
+
+        Returns:
+            bool: True if a firing alert on this value may resolve.
+        """
+        return self.clear_low <= value <= self.clear_high
+
+    def matches(self, metric: str, host: str) -> bool:
+        """
+        Check whether the rule applies to a metric of a host.
+
+        Args:
+            metric (str): Metric name.
+            host (str): Host name of the reporting endpoint.
+
+        Returns:
+            bool: True if both the metric and host selectors match.
+        """
+        if self._host_regex is not None and not self._host_regex.match(host):
+            return False
+
+        if self._metric_regex is not None:
+            return self._metric_regex.match(metric) is not None
+
+        return metric == self.metric
+
+
+class RuleEngine:
+    """
+    Evaluates metric payloads against per-metric and per-host rules.
+
+    Rules from `METRIC_RULES` are compiled into an index: rules naming
+    an exact metric are found with a hash lookup, and glob rules are
+    tried afterwards in configuration order with precompiled regexes.
+    The resolved rule for each metric is memoised in a bounded LRU
+    cache, so in steady state a lookup is a single dictionary access.
+    Metrics that no rule matches fall back to `METRIC_THRESHOLD`.
+
+    Payloads with at least `RULES_VECTORIZE_MIN` metrics are evaluated
+    with NumPy against bound arrays cached per metric-name layout, so
+    endpoints reporting the same metrics share one plan. Both caches
+    are keyed by host as well only when some rule is host-scoped. The
+    index is rebuilt only when the configuration version changes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the rule engine and compile the configured rules.
+        """
+        self._config = ConfigManager()
+        self._compiled_version = -1
+        self._compile()
+
+    def _compile(self) -> None:
+        """
+        Rebuild the rule index from configuration.
+
+        Raises:
+            ValueError: If a configured rule is invalid.
+        """
+        for_seconds = float(self._config.get("ALERT_FOR_SECONDS"))
+        renotify_seconds = float(self._config.get("ALERT_RENOTIFY_SECONDS"))
+        rules = [
+            Rule(spec, for_seconds, renotify_seconds)
+            for spec in self._config.get("METRIC_RULES")
+        ]
+
+        self._exact: Dict[str, List[Rule]] = {}
+        self._patterns: List[Rule] = []
+        self._scoped = any(rule.host is not None for rule in rules)
+
+        for rule in rules:
+            if rule.is_pattern:
+                self._patterns.append(rule)
+            else:
+                self._exact.setdefault(rule.metric, []).append(rule)
+
+        self._default = Rule(
+            {"metric": "*", "threshold": self._config.get("METRIC_THRESHOLD")},
+            for_seconds,
+            renotify_seconds,
+        )
+        self._vectorize_min = int(self._config.get("RULES_VECTORIZE_MIN"))
+        self._resolved = _LRUCache(RESOLVE_CACHE_SIZE)
+        self._plans = _LRUCache(PLAN_CACHE_SIZE)
+        self._hosts = _LRUCache(RESOLVE_CACHE_SIZE)
+        self._compiled_version = self._config.version
+
+    def _host(self, endpoint: str) -> str:
+        """
+        Extract the host name rules are matched against.
+
+        Args:
+            endpoint (str): Endpoint URL or bare host name.
+
+        Returns:
+            str: Host name of the endpoint.
+        """
+        host = self._hosts.get(endpoint)
+
+        if host is None:
+            host = (
+                urlsplit(endpoint).hostname or endpoint
+                if "://" in endpoint else endpoint
+            )
+            self._hosts.put(endpoint, host)
+
+        return host
+
+    def _scope(self, endpoint: str) -> str | None:
+        """
+        Host part of the cache keys for an endpoint.
+
+        Args:
+            endpoint (str): Endpoint URL or host name.
+
+        Returns:
+            str | None: Host name when host-scoped rules exist, else None
+            so that all endpoints share cache entries.
+        """
+        return self._host(endpoint) if self._scoped else None
+
+    def resolve(self, metric: str, endpoint: str = "") -> Rule:
+        """
+        Find the rule governing a metric of an endpoint.
+
+        Exact-name rules take precedence over glob rules; within each
+        group the first rule in configuration order wins.
+
+        Args:
+            metric (str): Metric name.
+            endpoint (str): Endpoint URL or host name.
+
+        Returns:
+            Rule: Matching rule, or the global default rule.
+        """
+        key = (self._scope(endpoint), metric)
+        rule = self._resolved.get(key)
+
+        if rule is not None:
+            return rule
+
+        host = key[0] if self._scoped else self._host(endpoint)
+        rule = self._default
+
+        for candidate in self._exact.get(metric, ()):
+            if candidate.matches(metric, host):
+                rule = candidate
+                break
+        else:
+            for candidate in self._patterns:
+                if candidate.matches(metric, host):
+                    rule = candidate
+                    break
+
+        self._resolved.put(key, rule)
+        return rule
+
+    def refresh(self) -> None:
+        """
+        Recompile the index if the configuration changed since last use.
+        """
+        if self._config.version != self._compiled_version:
+            self._compile()
+
+    def _plan(
+        self,
+        names: Tuple[str, ...],
+        endpoint: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build (or reuse) the bound arrays for a payload key set.
+
+        Args:
+            names (Tuple[str, ...]): Metric names in payload order.
+            endpoint (str): Endpoint URL or host name.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Lower and upper bounds.
+        """
+        key = (self._scope(endpoint), names)
+        plan = self._plans.get(key)
+
+        if plan is None:
+            rules = [self.resolve(name, endpoint) for name in names]
+            plan = (
+                np.fromiter((rule.low for rule in rules), float, len(rules)),
+                np.fromiter((rule.high for rule in rules), float, len(rules)),
+            )
+            self._plans.put(key, plan)
+
+        return plan
+
+    def evaluate(
+        self,
+        metrics: Dict[str, float],
+        endpoint: str = ""
+    ) -> List[Tuple[str, float]]:
+        """
+        Evaluate a whole payload in one pass.
+
+        Args:
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            endpoint (str): Endpoint URL or host name of the payload.
+
+        Returns:
+            List[Tuple[str, float]]: Breaching metric names and values,
+            in payload order.
+        """
+        self.refresh()
+
+        if len(metrics) >= self._vectorize_min:
+            names = tuple(metrics)
+            low, high = self._plan(names, endpoint)
+            values = np.fromiter(metrics.values(), float, len(names))
+            breached = np.flatnonzero((values < low) | (values > high))
+            return [(names[i], metrics[names[i]]) for i in breached.tolist()]
+
+        breaches = []
+
+        for metric, value in metrics.items():
+            rule = self.resolve(metric, endpoint)
+            if value > rule.high or value < rule.low:
+                breaches.append((metric, value))
+
+        return breaches
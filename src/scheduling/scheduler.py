@@ -0,0 +1,244 @@
+import asyncio
+import heapq
+import logging
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FixedRateScheduler:
+    """
+    Drift-free scheduler that polls endpoints on a fixed-rate clock.
+
+    Every endpoint has its own poll interval and a stable phase offset
+    inside that interval, so polls are spread out instead of firing in
+    one burst. Tick times are computed from the schedule rather than
+    from when the previous poll finished, which keeps the period exact
+    regardless of how long each poll takes.
+
+    A tick that comes due while the previous poll of the same endpoint
+    is still running is skipped and counted as an overrun. Ticks that
+    were missed entirely because the event loop fell behind are skipped
+    and counted as missed ticks instead of being replayed in a burst.
+    A poll batch that raises is logged and counted as a poll error.
+    """
+
+    def __init__(
+        self,
+        poll: Callable[[List[str]], Awaitable[Any]],
+        jitter: float = 1.0,
+        coalesce: float = 0.01
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            poll (Callable[[List[str]], Awaitable[Any]]): Coroutine function
+                called with the batch of endpoints due at a tick.
+            jitter (float): Fraction of each interval over which endpoint
+                phase offsets are spread (0 disables spreading).
+            coalesce (float): Endpoints due within this many seconds of each
+                other are dispatched in the same batch.
+        """
+        self._poll = poll
+        self._jitter = jitter
+        self._coalesce = coalesce
+        self._intervals: Dict[str, float] = {}
+        self._queue: List[Tuple[float, str]] = []
+        self._in_flight: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._changed: asyncio.Event | None = None
+        self._stats: Dict[str, float] = {
+            "ticks": 0,
+            "batches": 0,
+            "overruns": 0,
+            "missed_ticks": 0,
+            "poll_errors": 0,
+            "lag_last": 0.0,
+            "lag_max": 0.0,
+            "lag_total": 0.0,
+        }
+
+    def add(self, endpoint: str, interval: float) -> None:
+        """
+        Schedule an endpoint, or change the interval of a scheduled one.
+
+        An endpoint added while `run` is active is queued at its phase
+        offset from now. A changed interval applies from the next tick.
+        Must be called from the event loop thread.
+
+        Args:
+            endpoint (str): Metrics endpoint URL.
+            interval (float): Poll interval in seconds.
+
+        Raises:
+            ValueError: If the interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError(f"Invalid poll interval: {interval}")
+
+        new = endpoint not in self._intervals
+        self._intervals[endpoint] = float(interval)
+
+        if new and self._loop is not None:
+            heapq.heappush(self._queue, (
+                self._loop.time() + self._phase(endpoint, interval), endpoint
+            ))
+            self._changed.set()
+
+    def _phase(self, endpoint: str, interval: float) -> float:
+        """
+        Compute the stable phase offset of an endpoint within its interval.
+
+        Args:
+            endpoint (str): Metrics endpoint URL.
+            interval (float): Poll interval in seconds.
+
+        Returns:
+            float: Offset in seconds from the start of the schedule.
+        """
+        fraction = zlib.crc32(endpoint.encode("utf-8")) / 2 ** 32
+        return fraction * interval * self._jitter
+
+    def _reset(self, now: float) -> None:
+        """
+        Rebuild the tick queue from the registered endpoints.
+
+        Args:
+            now (float): Current loop time used as the schedule origin.
+        """
+        self._queue = [
+            (now + self._phase(endpoint, interval), endpoint)
+            for endpoint, interval in self._intervals.items()
+        ]
+        heapq.heapify(self._queue)
+
+    def _take_due(self, now: float) -> List[str]:
+        """
+        Pop every endpoint due at `now` and reschedule its next tick.
+
+        Args:
+            now (float): Current loop time.
+
+        Returns:
+            List[str]: Endpoints to poll in this batch.
+        """
+        batch: List[str] = []
+
+        while self._queue and self._queue[0][0] <= now + self._coalesce:
+            due, endpoint = heapq.heappop(self._queue)
+            interval = self._intervals.get(endpoint)
+
+            if interval is None:
+                continue
+
+            self._stats["ticks"] += 1
+            lag = max(0.0, now - due)
+            missed = int(lag // interval)
+
+            if missed:
+                self._stats["missed_ticks"] += missed
+                due += missed * interval
+                lag -= missed * interval
+
+            heapq.heappush(self._queue, (due + interval, endpoint))
+
+            if endpoint in self._in_flight:
+                self._stats["overruns"] += 1
+                continue
+
+            self._stats["lag_last"] = lag
+            self._stats["lag_max"] = max(self._stats["lag_max"], lag)
+            self._stats["lag_total"] += lag
+            batch.append(endpoint)
+
+        return batch
+
+    async def _dispatch(self, batch: List[str]) -> None:
+        """
+        Run one poll batch and release its endpoints when it finishes.
+
+        Args:
+            batch (List[str]): Endpoints to poll.
+        """
+        try:
+            await self._poll(batch)
+        finally:
+            self._in_flight.difference_update(batch)
+
+    def _finished(self, task: asyncio.Task) -> None:
+        """
+        Forget a finished poll task, logging and counting its error.
+
+        Args:
+            task (asyncio.Task): Completed `_dispatch` task.
+        """
+        self._tasks.discard(task)
+
+        if task.cancelled() or task.exception() is None:
+            return
+
+        self._stats["poll_errors"] += 1
+        logger.error("Poll batch failed", exc_info=task.exception())
+
+    async def run(self) -> None:
+        """
+        Run the scheduling loop until cancelled.
+
+        Returns once no endpoint is scheduled. In-flight poll batches
+        are cancelled when the loop stops.
+        """
+        loop = asyncio.get_running_loop()
+        self._reset(loop.time())
+        self._loop = loop
+        self._changed = asyncio.Event()
+
+        try:
+            while self._queue:
+                delay = max(0.0, self._queue[0][0] - loop.time())
+
+                try:
+                    # Wake early when `add` queues an endpoint.
+                    await asyncio.wait_for(self._changed.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+                self._changed.clear()
+                batch = self._take_due(loop.time())
+
+                if not batch:
+                    continue
+
+                self._stats["batches"] += 1
+                self._in_flight.update(batch)
+                task = asyncio.create_task(self._dispatch(batch))
+                self._tasks.add(task)
+                task.add_done_callback(self._finished)
+
+        finally:
+            self._loop = None
+            self._changed = None
+
+            for task in list(self._tasks):
+                task.cancel()
+
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report scheduling counters.
+
+        Returns:
+            Dict[str, float]: Tick, batch, overrun, missed-tick and poll
+            error counts, along with the last, maximum and mean dispatch lag in seconds.
+        """
+        dispatched = self._stats["ticks"] - self._stats["overruns"]
+
+        return {
+            **self._stats,
+            "lag_mean": (
+                self._stats["lag_total"] / dispatched if dispatched else 0.0
+            ),
+        }
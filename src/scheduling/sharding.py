@@ -0,0 +1,138 @@
+import hashlib
+import os
+import re
+from typing import Iterable, List
+
+from src.metaclasses.config_manager import ConfigManager
+
+
+class RendezvousSharder:
+    """
+    Assigns endpoints to replicas with rendezvous (highest random weight)
+    hashing.
+
+    Every replica scores every endpoint with a hash of the pair and an
+    endpoint belongs to the replica with the highest score. The result
+    is stable across restarts, needs no coordination between replicas,
+    and when the replica count changes only the endpoints whose winning
+    replica was added or removed move — about 1/N of them.
+    """
+
+    def __init__(self, replica_index: int, replica_count: int) -> None:
+        """
+        Initialize the sharder for one replica.
+
+        Args:
+            replica_index (int): Zero-based index of this replica.
+            replica_count (int): Total number of replicas.
+
+        Raises:
+            ValueError: If the index is outside ``[0, replica_count)``.
+        """
+        if replica_count < 1 or not 0 <= replica_index < replica_count:
+            raise ValueError(
+                f"Invalid replica {replica_index} of {replica_count}"
+            )
+
+        self.replica_index = replica_index
+        self.replica_count = replica_count
+
+    @classmethod
+    def from_config(cls) -> "RendezvousSharder":
+        """
+        Build the sharder of the current process.
+
+        The replica count is read from the ``REPLICA_COUNT`` environment
+        variable, then from configuration. The replica index is read from
+        the ``REPLICA_INDEX`` environment variable. Otherwise, when more
+        than one replica is configured, it is taken from the ordinal
+        suffix of ``HOSTNAME`` as assigned to StatefulSet pods (e.g.
+        ``monitoring-system-2``); a single replica ignores the hostname
+        and uses the configured index.
+
+        Returns:
+            RendezvousSharder: Sharder for this replica.
+
+        Raises:
+            ValueError: If several replicas are configured and the index
+                cannot be determined or is out of range.
+        """
+        config = ConfigManager()
+        count = int(os.environ.get("REPLICA_COUNT",
+                                   config.get("REPLICA_COUNT")))
+        index = os.environ.get("REPLICA_INDEX")
+
+        if index is None and count > 1:
+            hostname = os.environ.get("HOSTNAME", "")
+            ordinal = re.search(r"-(\d+)$", hostname)
+
+            if ordinal is None:
+                raise ValueError(
+                    f"REPLICA_COUNT is {count} but the replica index is not "
+                    f"set: set REPLICA_INDEX or run as a StatefulSet pod "
+                    f"(hostname {hostname!r} has no ordinal suffix)"
+                )
+
+            index = ordinal.group(1)
+
+            if int(index) >= count:
+                raise ValueError(
+                    f"Hostname {hostname!r} has ordinal {index}, outside "
+                    f"REPLICA_COUNT {count}: keep REPLICA_COUNT in step "
+                    f"with the StatefulSet replicas"
+                )
+
+        if index is None:
+            index = config.get("REPLICA_INDEX")
+
+        return cls(int(index), count)
+
+    @staticmethod
+    def _score(replica: int, endpoint: str) -> int:
+        """
+        Compute the rendezvous weight of a replica for an endpoint.
+
+        Args:
+            replica (int): Replica index.
+            endpoint (str): Metrics endpoint URL.
+
+        Returns:
+            int: 64-bit weight.
+        """
+        digest = hashlib.blake2b(
+            f"{replica}:{endpoint}".encode("utf-8"), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big")
+
+    def owner(self, endpoint: str) -> int:
+        """
+        Find the replica responsible for an endpoint.
+
+        Args:
+            endpoint (str): Metrics endpoint URL.
+
+        Returns:
+            int: Index of the owning replica.
+        """
+        return max(
+            range(self.replica_count),
+            key=lambda replica: self._score(replica, endpoint),
+        )
+
+    def assign(self, endpoints: Iterable[str]) -> List[str]:
+        """
+        Select the endpoints owned by this replica.
+
+        Args:
+            endpoints (Iterable[str]): Full list of endpoints.
+
+        Returns:
+            List[str]: Endpoints this replica should poll, in input order.
+        """
+        if self.replica_count == 1:
+            return list(endpoints)
+
+        return [
+            endpoint for endpoint in endpoints
+            if self.owner(endpoint) == self.replica_index
+        ]
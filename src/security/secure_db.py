@@ -1,4 +1,5 @@
 import sqlite3
+from typing import Iterable, Tuple
 
 
 def insert_metric(conn: sqlite3.Connection, metric: str, value: float) -> None:
@@ -22,3 +23,28 @@ def insert_metric(conn: sqlite3.Connection, metric: str, value: float) -> None:
         (metric, value),
     )
     conn.commit()
+
+
+def insert_metrics(
+    conn: sqlite3.Connection,
+    rows: Iterable[Tuple[str, float]]
+) -> None:
+    """
+    Insert many metric records in a single transaction.
+
+    Uses the same parameterized query as `insert_metric`, but binds
+    all rows with `executemany` and commits once, which avoids a
+    journal sync per row.
+
+    Args:
+        conn (sqlite3.Connection): Active SQLite database connection.
+        rows (Iterable[Tuple[str, float]]): Metric names and values.
+
+    Returns:
+        None
+    """
+    with conn:
+        conn.executemany(
+            "INSERT INTO metrics (metric, value) VALUES (?, ?)",
+            rows,
+        )
@@ -0,0 +1,423 @@
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from src.instrumentation.registry import MetricsRegistry
+from src.metaclasses.config_manager import ConfigManager
+from src.processors.alerts import Alert
+
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectStoreClient(ABC):
+    """
+    Abstract base class for object store backends.
+
+    Implementations upload one immutable object per call and raise on
+    failure, so the uploader can retry.
+    """
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Upload an object.
+
+        Args:
+            key (str): Object key, using ``/`` as separator.
+            data (bytes): Object contents.
+        """
+        pass
+
+
+class LocalDirectoryClient(ObjectStoreClient):
+    """
+    Object store backend writing objects as files under a directory.
+
+    Useful for tests and single-node deployments; keys map to relative
+    paths and objects appear atomically.
+    """
+
+    def __init__(self, root: str) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            root (str): Directory holding the objects.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Write an object file.
+
+        Args:
+            key (str): Object key, used as the relative path.
+            data (bytes): Object contents.
+
+        Raises:
+            ValueError: If the key escapes the root directory.
+        """
+        path = (self.root / key).resolve()
+
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Object key escapes the store: {key}")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.tmp")
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+
+
+class ObjectStoreUploader:
+    """
+    Batches records into compressed objects and uploads them.
+
+    Records are serialized as JSON lines into a chunk that is sealed
+    once it holds `UPLOAD_CHUNK_BYTES` or is `UPLOAD_CHUNK_SECONDS` old.
+    Sealed chunks are gzip-compressed and uploaded by up to
+    `UPLOAD_CONCURRENCY` worker threads; at most `UPLOAD_MAX_PENDING`
+    chunks wait for upload before callers are made to wait. Failed
+    uploads are retried `UPLOAD_RETRIES` times with exponential backoff;
+    objects that still fail are spilled under `UPLOAD_SPILL_PATH` with
+    their key as relative path, so they can be uploaded later.
+    """
+
+    def __init__(
+        self,
+        client: ObjectStoreClient,
+        prefix: str | None = None
+    ) -> None:
+        """
+        Initialize the uploader.
+
+        Args:
+            client (ObjectStoreClient): Backend receiving the objects.
+            prefix (str | None): Key prefix. Defaults to `UPLOAD_PREFIX`.
+        """
+        config = ConfigManager()
+        self._client = client
+        self._prefix = prefix or config.get("UPLOAD_PREFIX")
+        self._chunk_bytes = int(config.get("UPLOAD_CHUNK_BYTES"))
+        self._chunk_seconds = float(config.get("UPLOAD_CHUNK_SECONDS"))
+        self._level = int(config.get("UPLOAD_COMPRESSION_LEVEL"))
+        self._retries = int(config.get("UPLOAD_RETRIES"))
+        self._backoff = float(config.get("UPLOAD_BACKOFF_BASE"))
+        self._spill_path = Path(config.get("UPLOAD_SPILL_PATH"))
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(config.get("UPLOAD_CONCURRENCY")),
+            thread_name_prefix=type(self).__name__,
+        )
+        self._slots = threading.BoundedSemaphore(
+            int(config.get("UPLOAD_MAX_PENDING"))
+        )
+
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sealer: threading.Thread | None = None
+        self._chunk: List[bytes] = []
+        self._chunk_size = 0
+        self._chunk_records = 0
+        self._chunk_started = 0.0
+        self._pending: List[Future] = []
+        self._sequence = 0
+        self._closed = False
+        self._stats = {"records": 0, "objects": 0, "raw_bytes": 0,
+                       "compressed_bytes": 0, "retries": 0, "failures": 0,
+                       "spilled": 0, "dropped": 0}
+
+        registry = MetricsRegistry()
+        self._objects = registry.counter(
+            "monitor_upload_objects_total",
+            "Objects uploaded to the object store.",
+        )
+        self._records = registry.counter(
+            "monitor_upload_records_total",
+            "Records uploaded to the object store.",
+        )
+        self._bytes = registry.counter(
+            "monitor_upload_bytes_total",
+            "Bytes uploaded to the object store by compression stage.",
+            ("kind",),
+        )
+        self._failures = registry.counter(
+            "monitor_upload_failures_total",
+            "Objects that exhausted their upload retries.",
+        )
+        self._upload_time = registry.histogram(
+            "monitor_upload_seconds",
+            "Time spent uploading one object, including retries.",
+        )
+
+    @staticmethod
+    def _encode(data: Any) -> bytes:
+        """
+        Serialize a record as one JSON line.
+
+        Args:
+            data (Any): `Alert` record, dictionary or other value.
+
+        Returns:
+            bytes: UTF-8 encoded JSON line.
+        """
+        if isinstance(data, Alert):
+            data = {"timestamp": data.timestamp, "metric": data.metric,
+                    "value": data.value, "endpoint": data.endpoint,
+                    "state": data.state, "detector": data.detector,
+                    "score": data.score}
+        elif not isinstance(data, dict):
+            data = {"message": str(data)}
+
+        line = json.dumps(data, separators=(",", ":"))
+        return line.encode("utf-8") + b"\n"
+
+    def add(self, items: List[Any]) -> None:
+        """
+        Append records to the current chunk, sealing it when full.
+
+        Records added after `close` are logged and dropped, since no
+        chunk would be sealed again.
+
+        Args:
+            items (List[Any]): Records to upload.
+        """
+        lines = [self._encode(data) for data in items]
+        sealed = None
+
+        with self._lock:
+            if self._closed:
+                with self._stats_lock:
+                    self._stats["dropped"] += len(lines)
+                logger.warning("Dropping %d records added after close",
+                               len(lines))
+                return
+
+            if not self._chunk:
+                self._chunk_started = time.monotonic()
+
+            self._chunk.extend(lines)
+            self._chunk_size += sum(len(line) for line in lines)
+            self._chunk_records += len(lines)
+
+            if self._chunk_size >= self._chunk_bytes:
+                sealed = self._take()
+
+        if sealed is not None:
+            self._seal(*sealed)
+
+        if self._sealer is None and self._chunk_seconds > 0:
+            self._start_sealer()
+
+    def _start_sealer(self) -> None:
+        """
+        Start the thread sealing chunks that reached their age limit.
+        """
+        with self._lock:
+            if self._sealer is not None:
+                return
+
+            self._sealer = threading.Thread(
+                target=self._seal_loop,
+                name=f"{type(self).__name__}-sealer",
+                daemon=True,
+            )
+            self._sealer.start()
+
+    def _seal_loop(self) -> None:
+        """
+        Seal the current chunk once it is `UPLOAD_CHUNK_SECONDS` old.
+        """
+        while not self._stop.wait(min(self._chunk_seconds, 1.0)):
+            sealed = None
+
+            with self._lock:
+                if self._chunk and (
+                    time.monotonic() - self._chunk_started
+                    >= self._chunk_seconds
+                ):
+                    sealed = self._take()
+
+            if sealed is not None:
+                self._seal(*sealed)
+
+    def _take(self) -> Tuple[str, List[bytes], int] | None:
+        """
+        Detach the current chunk and name its object.
+
+        Must be called with the lock held; compression and upload
+        happen in `_seal`, outside the lock.
+
+        Returns:
+            Tuple[str, List[bytes], int] | None: Object key, lines and
+            record count, or None when the chunk is empty.
+        """
+        if not self._chunk:
+            return None
+
+        lines, records = self._chunk, self._chunk_records
+        self._chunk, self._chunk_size, self._chunk_records = [], 0, 0
+        self._sequence += 1
+        key = (
+            f"{self._prefix}/{time.strftime('%Y/%m/%d/%H%M%S', time.gmtime())}"
+            f"-{self._sequence:06d}-{uuid.uuid4().hex[:8]}.jsonl.gz"
+        )
+        return key, lines, records
+
+    def _seal(self, key: str, lines: List[bytes], records: int) -> None:
+        """
+        Compress a detached chunk and schedule its upload.
+
+        Waits for a pending slot when `UPLOAD_MAX_PENDING` chunks are
+        already queued; other callers keep appending meanwhile.
+
+        Args:
+            key (str): Object key.
+            lines (List[bytes]): Encoded records.
+            records (int): Number of records.
+        """
+        raw = b"".join(lines)
+        body = gzip.compress(raw, self._level)
+
+        self._slots.acquire()
+        future = self._executor.submit(
+            self._upload, key, body, len(raw), records
+        )
+        future.add_done_callback(lambda _: self._slots.release())
+
+        with self._lock:
+            self._pending = [pending for pending in self._pending
+                             if not pending.done()]
+            self._pending.append(future)
+
+    def _upload(
+        self,
+        key: str,
+        body: bytes,
+        raw_size: int,
+        records: int
+    ) -> None:
+        """
+        Upload one object, retrying with exponential backoff.
+
+        Args:
+            key (str): Object key.
+            body (bytes): Compressed object contents.
+            raw_size (int): Size before compression.
+            records (int): Number of records in the object.
+        """
+        started = time.perf_counter()
+
+        for attempt in range(self._retries + 1):
+            try:
+                self._client.put(key, body)
+                break
+            except Exception as exc:
+                if attempt == self._retries:
+                    with self._stats_lock:
+                        self._stats["failures"] += 1
+                    self._failures.inc()
+                    logger.error("Failed to upload %s: %s", key, exc)
+                    self._spill(key, body)
+                    return
+
+                with self._stats_lock:
+                    self._stats["retries"] += 1
+                time.sleep(self._backoff * 2 ** attempt)
+
+        self._upload_time.observe(time.perf_counter() - started)
+
+        with self._stats_lock:
+            self._stats["records"] += records
+            self._stats["objects"] += 1
+            self._stats["raw_bytes"] += raw_size
+            self._stats["compressed_bytes"] += len(body)
+
+        self._objects.inc()
+        self._records.inc(records)
+        self._bytes.labels("raw").inc(raw_size)
+        self._bytes.labels("compressed").inc(len(body))
+
+    def _spill(self, key: str, body: bytes) -> None:
+        """
+        Keep an object that could not be uploaded on local disk.
+
+        Args:
+            key (str): Object key, used as the relative path.
+            body (bytes): Compressed object contents.
+        """
+        try:
+            LocalDirectoryClient(str(self._spill_path)).put(key, body)
+        except (OSError, ValueError):
+            logger.exception("Failed to spill %s, dropping it", key)
+            return
+
+        with self._stats_lock:
+            self._stats["spilled"] += 1
+        logger.warning("Spilled %s to %s", key, self._spill_path)
+
+    def flush(self) -> None:
+        """
+        Seal the current chunk and wait for every pending upload.
+        """
+        with self._lock:
+            sealed = self._take()
+
+        if sealed is not None:
+            self._seal(*sealed)
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        """
+        Upload everything still buffered and stop the worker threads.
+
+        Calling it again has no effect.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        self._stop.set()
+
+        if self._sealer is not None:
+            self._sealer.join()
+            self._sealer = None
+
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report upload counters.
+
+        Returns:
+            Dict[str, float]: Records, objects, raw and compressed bytes,
+            retries, failures, spilled objects and records dropped after
+            close, plus records per object and the compression ratio.
+        """
+        with self._stats_lock:
+            stats: Dict[str, float] = dict(self._stats)
+
+        stats["records_per_object"] = (
+            stats["records"] / stats["objects"] if stats["objects"] else 0.0
+        )
+        stats["compression_ratio"] = (
+            stats["raw_bytes"] / stats["compressed_bytes"]
+            if stats["compressed_bytes"] else 0.0
+        )
+        return stats
@@ -0,0 +1,334 @@
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.observer import Recorder
+
+
+LAYOUT_CACHE_SIZE = 4096
+
+
+class RingBufferHistory(Recorder):
+    """
+    Fixed-capacity in-memory history of the most recent samples.
+
+    All series share two preallocated 2-D blocks, one of timestamps and
+    one of values, with a row per (endpoint, metric) series. Each row
+    is twice the capacity long and every sample is written twice, at
+    its ring position and one capacity further on, so the newest ``n``
+    samples of a series always form one contiguous slice and are
+    returned as zero-copy views.
+
+    The blocks are allocated once and never grow: appends write into
+    them in place, so the memory used is fixed by `RING_HISTORY_SERIES`
+    and `RING_HISTORY_CAPACITY` (see `required_bytes`). Samples of
+    series beyond the series limit are dropped and counted, and so are
+    non-integral samples of an ``np.int64`` history.
+    """
+
+    def __init__(
+        self,
+        capacity: int | None = None,
+        max_series: int | None = None,
+        dtype: type = np.float64
+    ) -> None:
+        """
+        Allocate the history blocks.
+
+        Args:
+            capacity (int | None): Samples kept per series. Defaults to
+                `RING_HISTORY_CAPACITY`.
+            max_series (int | None): Number of series rows. Defaults to
+                `RING_HISTORY_SERIES`.
+            dtype (type): Value type, ``np.float64`` or ``np.int64``.
+
+        Raises:
+            ValueError: If a size is not positive or the value type is
+                unsupported.
+        """
+        config = ConfigManager()
+        self.capacity = int(capacity or config.get("RING_HISTORY_CAPACITY"))
+        self.max_series = int(max_series or config.get("RING_HISTORY_SERIES"))
+        self.dtype = np.dtype(dtype)
+
+        if self.capacity < 1 or self.max_series < 1:
+            raise ValueError(
+                f"Invalid ring size: {self.max_series} x {self.capacity}"
+            )
+
+        if self.dtype not in (np.float64, np.int64):
+            raise ValueError(f"Unsupported value type: {self.dtype}")
+
+        shape = (self.max_series, 2 * self.capacity)
+        self._timestamps = np.zeros(shape, np.float64)
+        self._values = np.zeros(shape, self.dtype)
+        self._flat_timestamps = self._timestamps.reshape(-1)
+        self._flat_values = self._values.reshape(-1)
+        self._written = np.zeros(self.max_series, np.int64)
+        self._slots: Dict[Tuple[str, str], int] = {}
+        self._layouts: Dict[Tuple[str, Tuple[str, ...]], np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._stats = {"samples": 0, "dropped": 0, "invalid": 0}
+
+    @staticmethod
+    def required_bytes(
+        max_series: int,
+        capacity: int,
+        dtype: type = np.float64
+    ) -> int:
+        """
+        Memory needed by a history of the given size.
+
+        Args:
+            max_series (int): Number of series rows.
+            capacity (int): Samples kept per series.
+            dtype (type): Value type.
+
+        Returns:
+            int: Size in bytes of the preallocated blocks.
+        """
+        per_sample = np.dtype(np.float64).itemsize + np.dtype(dtype).itemsize
+        per_series = 2 * capacity * per_sample + np.dtype(np.int64).itemsize
+        return max_series * per_series
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the history blocks.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return (self._timestamps.nbytes + self._values.nbytes
+                + self._written.nbytes)
+
+    def _layout(self, endpoint: str, names: Tuple[str, ...]) -> np.ndarray:
+        """
+        Map the metrics of a payload to rows, assigning rows to new series.
+
+        Endpoints report the same metrics on every poll, so the rows of
+        each distinct payload layout are computed once and cached. The
+        cache holds at most `LAYOUT_CACHE_SIZE` layouts, evicting the
+        oldest first. Must be called with the lock held.
+
+        Args:
+            endpoint (str): Endpoint that reported the metrics.
+            names (Tuple[str, ...]): Metric names in payload order.
+
+        Returns:
+            np.ndarray: Row of each metric, or -1 for metrics that did
+            not fit in the series limit.
+        """
+        rows = self._layouts.get((endpoint, names))
+
+        if rows is None:
+            rows = np.empty(len(names), np.intp)
+
+            for i, name in enumerate(names):
+                row = self._slots.get((endpoint, name))
+
+                if row is None and len(self._slots) < self.max_series:
+                    row = self._slots[(endpoint, name)] = len(self._slots)
+
+                rows[i] = -1 if row is None else row
+
+            if len(self._layouts) >= LAYOUT_CACHE_SIZE:
+                del self._layouts[next(iter(self._layouts))]
+
+            self._layouts[(endpoint, names)] = rows
+
+        return rows
+
+    def _convert(
+        self,
+        metrics: Dict[str, float]
+    ) -> Tuple[np.ndarray, np.ndarray | None]:
+        """
+        Convert the values of a payload to the value type.
+
+        Integer histories reject values that are not whole numbers in
+        the int64 range instead of truncating them.
+
+        Args:
+            metrics (Dict[str, float]): Mapping of metric names to values.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray | None]: Converted values, and
+            for integer histories a mask of the values that are valid.
+        """
+        if self.dtype == np.float64:
+            return np.fromiter(metrics.values(), np.float64,
+                               len(metrics)), None
+
+        raw = np.array(list(metrics.values()))
+
+        if raw.dtype.kind in "biu" and (
+            raw.dtype.kind != "u" or not raw.size or raw.max() < 2 ** 63
+        ):
+            return raw.astype(np.int64), np.ones(len(raw), bool)
+
+        floats = raw.astype(np.float64)
+        valid = (np.isfinite(floats) & (floats == np.trunc(floats))
+                 & (np.abs(floats) < 2.0 ** 63))
+        return np.where(valid, floats, 0).astype(np.int64), valid
+
+    def record(
+        self,
+        endpoint: str,
+        metrics: Dict[str, float],
+        timestamp: float
+    ) -> None:
+        """
+        Append one sample of every metric in a payload.
+
+        Args:
+            endpoint (str): Endpoint that reported the payload.
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            timestamp (float): Sample time in seconds since the epoch.
+        """
+        values, valid = self._convert(metrics)
+
+        with self._lock:
+            rows = self._layout(endpoint, tuple(metrics))
+            kept = rows >= 0
+
+            if valid is not None and not valid.all():
+                self._stats["invalid"] += int(np.count_nonzero(~valid))
+                kept &= valid
+
+            if not kept.all():
+                self._stats["dropped"] += int(np.count_nonzero(rows < 0))
+                rows, values = rows[kept], values[kept]
+
+            if not rows.size:
+                return
+
+            written = self._written[rows]
+            index = rows * (2 * self.capacity) + written % self.capacity
+            self._flat_timestamps[index] = timestamp
+            self._flat_timestamps[index + self.capacity] = timestamp
+            self._flat_values[index] = values
+            self._flat_values[index + self.capacity] = values
+            self._written[rows] = written + 1
+            self._stats["samples"] += len(rows)
+
+    def append(
+        self,
+        endpoint: str,
+        metric: str,
+        value: float,
+        timestamp: float
+    ) -> None:
+        """
+        Append one sample to one series.
+
+        Args:
+            endpoint (str): Endpoint that reports the series.
+            metric (str): Metric name.
+            value (float): Sample value.
+            timestamp (float): Sample time in seconds since the epoch.
+        """
+        self.record(endpoint, {metric: value}, timestamp)
+
+    def last(
+        self,
+        endpoint: str,
+        metric: str,
+        n: int | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        View the newest samples of a series, oldest first.
+
+        The arrays are read-only views into the ring: they are only
+        valid until `capacity - n` further samples of the series have
+        been recorded, after which their contents are overwritten. Copy
+        them to keep them longer.
+
+        Args:
+            endpoint (str): Endpoint that reports the series.
+            metric (str): Metric name.
+            n (int | None): Number of samples; all retained samples
+                when omitted or larger than what is retained.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Timestamps and values.
+        """
+        with self._lock:
+            row = self._slots.get((endpoint, metric))
+
+            if row is None:
+                return np.empty(0), np.empty(0, self.dtype)
+
+            written = int(self._written[row])
+            count = min(written, self.capacity)
+            n = count if n is None else min(n, count)
+            end = written % self.capacity + self.capacity
+
+        views = (self._timestamps[row, end - n:end],
+                 self._values[row, end - n:end])
+
+        for view in views:
+            view.flags.writeable = False
+
+        return views
+
+    def window(
+        self,
+        endpoint: str,
+        metrics: Iterable[str] | None = None,
+        n: int | None = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        View the newest values of several metrics of an endpoint.
+
+        Values are aligned on the newest sample and trimmed to the
+        shortest series, so the result has equal-length columns and can
+        be handed to `MetricsAnalytics` without copying.
+
+        Args:
+            endpoint (str): Endpoint that reports the metrics.
+            metrics (Iterable[str] | None): Metric names; all metrics of
+                the endpoint when omitted.
+            n (int | None): Number of samples per metric.
+
+        Returns:
+            Dict[str, np.ndarray]: Read-only value views keyed by
+            metric name.
+        """
+        if metrics is None:
+            with self._lock:
+                keys = list(self._slots)
+
+            metrics = sorted(
+                metric for owner, metric in keys if owner == endpoint
+            )
+
+        views = {metric: self.last(endpoint, metric, n)[1]
+                 for metric in metrics}
+        length = min((len(values) for values in views.values()), default=0)
+        return {metric: values[len(values) - length:]
+                for metric, values in views.items()}
+
+    def series(self) -> List[Tuple[str, str]]:
+        """
+        List the tracked series.
+
+        Returns:
+            List[Tuple[str, str]]: (endpoint, metric) pairs.
+        """
+        with self._lock:
+            return list(self._slots)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report history counters.
+
+        Returns:
+            Dict[str, int]: Samples recorded, samples dropped for lack
+            of series rows, non-integral samples rejected by integer
+            histories, series count and preallocated bytes.
+        """
+        return {**self._stats, "series": len(self._slots),
+                "nbytes": self.nbytes}
@@ -0,0 +1,711 @@
+import json
+import logging
+import math
+import os
+import threading
+import time
+import zipfile
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.data_handlers.sketches import DDSketch
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.observer import Recorder
+
+
+COLUMNS = ("starts", "mins", "maxs", "sums", "counts", "lasts")
+
+logger = logging.getLogger(__name__)
+
+
+class Rollup:
+    """
+    Ring of fixed-width aggregate buckets of one series.
+
+    Each bucket keeps the minimum, maximum, sum, count and last value of
+    the samples that fell into it, plus the bins of a `DDSketch` for
+    quantiles. The ring holds the newest `retain` buckets; a sample for
+    a new bucket overwrites the oldest one, so adding a sample is O(1).
+
+    Only the bucket receiving samples keeps a live `DDSketch`. Once the
+    ring moves on, its bins are frozen into two flat integer arrays
+    shared by all buckets of the ring (see `DDSketch.bins`), located by
+    per-bucket offsets and lengths. Space left by overwritten buckets is
+    reclaimed once it makes up half of the arrays.
+    """
+
+    __slots__ = ("resolution", "retain", "alpha", "head", "starts", "mins",
+                 "maxs", "sums", "counts", "lasts", "zeros", "codes",
+                 "weights", "offsets", "lengths", "garbage", "live",
+                 "live_slot")
+
+    def __init__(self, resolution: int, retain: int, alpha: float) -> None:
+        """
+        Initialize an empty ring.
+
+        Args:
+            resolution (int): Bucket width in seconds.
+            retain (int): Number of buckets kept.
+            alpha (float): Relative accuracy of the bucket sketches.
+        """
+        self.resolution = resolution
+        self.retain = retain
+        self.alpha = alpha
+        self.head = 0
+
+        for column in COLUMNS:
+            setattr(self, column, array("d", [math.nan]) * retain)
+
+        self.zeros = array("q", [0]) * retain
+        self.codes = array("q")
+        self.weights = array("q")
+        self.offsets = array("q", [0]) * retain
+        self.lengths = array("q", [0]) * retain
+        self.garbage = 0
+        self.live: DDSketch | None = None
+        self.live_slot = -1
+
+    def _freeze(self) -> None:
+        """
+        Move the bins of the live sketch into the bin arrays.
+        """
+        live, slot = self.live, self.live_slot
+
+        if live is None:
+            return
+
+        codes, counts = live.bins()
+        self.offsets[slot] = len(self.codes)
+        self.lengths[slot] = len(codes)
+        self.zeros[slot] = live.zero_count
+        self.codes.extend(codes)
+        self.weights.extend(counts)
+        self.live, self.live_slot = None, -1
+
+        if self.garbage > 1024 and self.garbage > len(self.codes) >> 1:
+            self._compact()
+
+    def _compact(self) -> None:
+        """
+        Rewrite the bin arrays without the bins of overwritten buckets.
+        """
+        codes, weights, offset = array("q"), array("q"), 0
+
+        for slot in range(self.retain):
+            start, length = self.offsets[slot], self.lengths[slot]
+            codes.extend(self.codes[start:start + length])
+            weights.extend(self.weights[start:start + length])
+            self.offsets[slot] = offset
+            offset += length
+
+        self.codes, self.weights, self.garbage = codes, weights, 0
+
+    def _discard(self, slot: int) -> None:
+        """
+        Drop the frozen bins of a bucket.
+
+        Args:
+            slot (int): Ring position.
+        """
+        self.garbage += self.lengths[slot]
+        self.lengths[slot] = 0
+        self.zeros[slot] = 0
+
+    def _thaw(self, slot: int) -> None:
+        """
+        Make a bucket's sketch the live one, so it can take samples.
+
+        Args:
+            slot (int): Ring position.
+        """
+        self._freeze()
+        sketch = DDSketch(self.alpha)
+
+        if self.counts[slot] > 0:
+            start, length = self.offsets[slot], self.lengths[slot]
+            sketch.add_bins(
+                np.frombuffer(self.codes, np.int64)[start:start + length],
+                np.frombuffer(self.weights, np.int64)[start:start + length],
+                self.zeros[slot], self.sums[slot], self.mins[slot],
+                self.maxs[slot],
+            )
+
+        self._discard(slot)
+        self.live, self.live_slot = sketch, slot
+
+    def _reset(self, slot: int, start: float) -> None:
+        """
+        Reuse a slot for a new bucket.
+
+        Args:
+            slot (int): Ring position.
+            start (float): Start time of the bucket.
+        """
+        self.starts[slot] = start
+        self.mins[slot] = math.inf
+        self.maxs[slot] = -math.inf
+        self.sums[slot] = 0.0
+        self.counts[slot] = 0.0
+        self.lasts[slot] = math.nan
+
+        if slot != self.live_slot:
+            self._freeze()
+            self._discard(slot)
+
+        self.live, self.live_slot = DDSketch(self.alpha), slot
+
+    def add(self, timestamp: float, value: float) -> None:
+        """
+        Add one sample to its bucket.
+
+        Samples older than the retained buckets and non-finite values
+        are ignored.
+
+        Args:
+            timestamp (float): Sample time in seconds since the epoch.
+            value (float): Sample value.
+        """
+        if not math.isfinite(value):
+            return
+
+        start = timestamp - timestamp % self.resolution
+        newest = self.starts[self.head]
+        slot = self.head
+
+        if math.isnan(newest) or start > newest:
+            if not math.isnan(newest):
+                steps = int((start - newest) // self.resolution)
+                slot = (self.head + steps) % self.retain
+            self.head = slot
+            self._reset(slot, start)
+        elif start < newest:
+            steps = int((newest - start) // self.resolution)
+
+            if steps >= self.retain:
+                return
+
+            slot = (self.head - steps) % self.retain
+
+            if self.starts[slot] != start:
+                self._reset(slot, start)
+
+        if slot != self.live_slot:
+            self._thaw(slot)
+
+        if value < self.mins[slot]:
+            self.mins[slot] = value
+        if value > self.maxs[slot]:
+            self.maxs[slot] = value
+
+        self.sums[slot] += value
+        self.counts[slot] += 1
+        self.lasts[slot] = value
+        self.live.add(value)
+
+    def oldest(self) -> float:
+        """
+        Start time of the oldest bucket the ring can still hold.
+
+        Returns:
+            float: Start time, or NaN for an empty ring.
+        """
+        return (
+            self.starts[self.head] - (self.retain - 1) * self.resolution
+        )
+
+    def select(self, start: float, end: float) -> np.ndarray:
+        """
+        Find the buckets overlapping a time range.
+
+        Args:
+            start (float): Inclusive lower bound.
+            end (float): Exclusive upper bound.
+
+        Returns:
+            np.ndarray: Ring positions ordered by bucket start.
+        """
+        starts = np.frombuffer(self.starts, np.float64)
+        slots = np.flatnonzero(
+            (starts > start - self.resolution) & (starts < end)
+        )
+        return slots[np.argsort(starts[slots])]
+
+    def merge_into(self, sketch: DDSketch, slots: np.ndarray) -> None:
+        """
+        Add the sketches of several buckets to one sketch.
+
+        Args:
+            sketch (DDSketch): Sketch receiving the bins.
+            slots (np.ndarray): Ring positions.
+        """
+        frozen = [slot for slot in slots.tolist()
+                  if slot != self.live_slot and self.counts[slot] > 0]
+
+        if frozen:
+            codes = np.frombuffer(self.codes, np.int64)
+            weights = np.frombuffer(self.weights, np.int64)
+            ranges = [(self.offsets[slot], self.lengths[slot])
+                      for slot in frozen]
+            sketch.add_bins(
+                np.concatenate([codes[o:o + n] for o, n in ranges]),
+                np.concatenate([weights[o:o + n] for o, n in ranges]),
+                sum(self.zeros[slot] for slot in frozen),
+                sum(self.sums[slot] for slot in frozen),
+                min(self.mins[slot] for slot in frozen),
+                max(self.maxs[slot] for slot in frozen),
+            )
+
+        if self.live is not None and self.live_slot in slots:
+            sketch.merge(self.live)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Copy the ring state for serialization.
+
+        Freezes the live sketch and copies the flat arrays, which is a
+        few memory copies, so it is cheap enough to run under a lock.
+
+        Returns:
+            Dict[str, Any]: Column, bin and ring position copies.
+        """
+        self._freeze()
+        state: Dict[str, Any] = {
+            name: getattr(self, name)[:]
+            for name in COLUMNS + ("zeros", "codes", "weights", "offsets",
+                                   "lengths")
+        }
+        state["head"] = self.head
+        return state
+
+    @staticmethod
+    def pack(state: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gather the bins of a snapshot in slot order, without garbage.
+
+        Args:
+            state (Dict[str, Any]): Ring state from `snapshot`.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Bucket codes and counts, the
+            bins of each slot following those of the previous slot.
+        """
+        offsets = np.frombuffer(state["offsets"], np.int64)
+        lengths = np.frombuffer(state["lengths"], np.int64)
+        ends = np.cumsum(lengths)
+        index = (np.arange(ends[-1] if len(ends) else 0)
+                 - np.repeat(ends - lengths - offsets, lengths))
+        return (np.frombuffer(state["codes"], np.int64)[index],
+                np.frombuffer(state["weights"], np.int64)[index])
+
+    def restore(
+        self,
+        head: int,
+        columns: Dict[str, np.ndarray],
+        lengths: np.ndarray,
+        codes: np.ndarray,
+        weights: np.ndarray
+    ) -> None:
+        """
+        Load ring state written by the pipeline checkpoint.
+
+        Args:
+            head (int): Ring position of the newest bucket.
+            columns (Dict[str, np.ndarray]): `COLUMNS` and ``zeros``.
+            lengths (np.ndarray): Number of bins of each slot.
+            codes (np.ndarray): Bucket codes of all slots, in slot order.
+            weights (np.ndarray): Counts aligned with `codes`.
+        """
+        self.head = int(head)
+
+        for name, values in columns.items():
+            column = getattr(self, name)
+            dtype = np.float64 if column.typecode == "d" else np.int64
+            column[:] = array(
+                column.typecode, np.asarray(values, dtype).tobytes()
+            )
+
+        self.lengths = array("q", np.asarray(lengths, np.int64).tobytes())
+        self.offsets = array(
+            "q", (np.cumsum(lengths) - lengths).astype(np.int64).tobytes()
+        )
+        self.codes = array("q", np.asarray(codes, np.int64).tobytes())
+        self.weights = array("q", np.asarray(weights, np.int64).tobytes())
+        self.garbage = 0
+        self.live, self.live_slot = None, -1
+
+
+class RollupPipeline(Recorder):
+    """
+    Incremental downsampling of every recorded series.
+
+    Each sample updates one bucket per resolution in
+    `ROLLUP_RESOLUTIONS` (bucket seconds mapped to the number of
+    buckets kept, 1-minute, 5-minute and 1-hour by default), so the
+    cost per sample is constant. Queries are served from the coarsest
+    resolution that still covers the requested range at the requested
+    step, instead of scanning raw samples.
+
+    The rollups are written to `ROLLUP_CHECKPOINT_PATH` every
+    `ROLLUP_CHECKPOINT_INTERVAL` seconds by a background thread, and on
+    close, and reloaded on start so they survive restarts.
+    """
+
+    def __init__(self, checkpoint_path: str | None = None) -> None:
+        """
+        Initialize the pipeline and restore the last checkpoint.
+
+        Args:
+            checkpoint_path (str | None): Checkpoint file. Defaults to
+                `ROLLUP_CHECKPOINT_PATH`.
+        """
+        config = ConfigManager()
+        self._resolutions = sorted(
+            (int(resolution), int(retain))
+            for resolution, retain in config.get("ROLLUP_RESOLUTIONS").items()
+        )
+        self._alpha = float(config.get("SKETCH_RELATIVE_ACCURACY"))
+        self._max_points = int(config.get("ROLLUP_MAX_POINTS"))
+        self._interval = float(config.get("ROLLUP_CHECKPOINT_INTERVAL"))
+        self.checkpoint_path = Path(
+            checkpoint_path or config.get("ROLLUP_CHECKPOINT_PATH")
+        )
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._checkpoint_lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], List[Rollup]] = {}
+        self._invalid = 0
+        self._checkpointed_at = time.monotonic()
+        self._load()
+
+    def _rollups(self, endpoint: str, metric: str) -> List[Rollup]:
+        """
+        Get or create the rollups of a series.
+
+        Args:
+            endpoint (str): Endpoint that reports the series.
+            metric (str): Metric name.
+
+        Returns:
+            List[Rollup]: One ring per resolution, finest first.
+        """
+        rollups = self._series.get((endpoint, metric))
+
+        if rollups is None:
+            rollups = [
+                Rollup(resolution, retain, self._alpha)
+                for resolution, retain in self._resolutions
+            ]
+            self._series[(endpoint, metric)] = rollups
+
+        return rollups
+
+    def record(
+        self,
+        endpoint: str,
+        metrics: Dict[str, float],
+        timestamp: float
+    ) -> None:
+        """
+        Add one sample of every metric in a payload to its rollups.
+
+        Values that are not numeric or not finite are dropped and
+        counted as invalid.
+
+        Args:
+            endpoint (str): Endpoint that reported the payload.
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            timestamp (float): Sample time in seconds since the epoch.
+        """
+        samples = []
+
+        for metric, value in metrics.items():
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                value = math.nan
+
+            if math.isfinite(value):
+                samples.append((metric, value))
+
+        with self._lock:
+            self._invalid += len(metrics) - len(samples)
+
+            for metric, value in samples:
+                for rollup in self._rollups(endpoint, metric):
+                    rollup.add(timestamp, value)
+
+        if (
+            self._interval > 0
+            and time.monotonic() - self._checkpointed_at >= self._interval
+            and not self._checkpoint_lock.locked()
+        ):
+            self._checkpointed_at = time.monotonic()
+            threading.Thread(
+                target=self.checkpoint,
+                name=f"{type(self).__name__}-checkpoint",
+                daemon=True,
+            ).start()
+
+    def _choose(
+        self,
+        rollups: List[Rollup],
+        start: float,
+        end: float,
+        step: float | None
+    ) -> Rollup:
+        """
+        Pick the resolution that serves a query.
+
+        Args:
+            rollups (List[Rollup]): Rings of the series, finest first.
+            start (float): Inclusive lower bound of the range.
+            end (float): Exclusive upper bound of the range.
+            step (float | None): Widest acceptable bucket; defaults to the
+                range split into `ROLLUP_MAX_POINTS` buckets.
+
+        Returns:
+            Rollup: Coarsest ring within `step` that still reaches back
+            to `start`, or the finest ring that does when none is
+            within `step`.
+        """
+        if step is None:
+            step = (end - start) / self._max_points
+
+        covering = [
+            rollup for rollup in rollups if rollup.oldest() <= start
+        ] or rollups[-1:]
+        fitting = [
+            rollup for rollup in covering if rollup.resolution <= step
+        ]
+        return fitting[-1] if fitting else covering[0]
+
+    def query(
+        self,
+        endpoint: str,
+        metric: str,
+        start: float,
+        end: float | None = None,
+        step: float | None = None
+    ) -> Dict[str, Any]:
+        """
+        Read aggregates of a series over a time range.
+
+        Args:
+            endpoint (str): Endpoint that reports the series.
+            metric (str): Metric name.
+            start (float): Inclusive lower bound, seconds since the epoch.
+            end (float | None): Exclusive upper bound; defaults to now.
+            step (float | None): Widest acceptable bucket in seconds.
+
+        Returns:
+            Dict[str, Any]: The chosen ``resolution`` in seconds, plus
+            ``timestamp`` (bucket starts), ``min``, ``max``, ``sum``,
+            ``count``, ``last`` and ``mean`` arrays in time order.
+        """
+        end = time.time() if end is None else end
+
+        with self._lock:
+            rollups = self._series.get((endpoint, metric))
+
+            if rollups is None:
+                return {"resolution": None, **{
+                    name: np.empty(0) for name in
+                    ("timestamp", "min", "max", "sum", "count", "last", "mean")
+                }}
+
+            rollup = self._choose(rollups, start, end, step)
+            slots = rollup.select(start, end)
+            result = {
+                name: np.frombuffer(getattr(rollup, column), np.float64)[slots]
+                for name, column in (
+                    ("timestamp", "starts"), ("min", "mins"),
+                    ("max", "maxs"), ("sum", "sums"),
+                    ("count", "counts"), ("last", "lasts"),
+                )
+            }
+
+        result["mean"] = result["sum"] / result["count"]
+        return {"resolution": rollup.resolution, **result}
+
+    def quantiles(
+        self,
+        endpoint: str,
+        metric: str,
+        quantiles: Iterable[float],
+        start: float,
+        end: float | None = None
+    ) -> List[float]:
+        """
+        Estimate quantiles of a series over a time range.
+
+        Merges the bucket sketches of the coarsest resolution covering
+        the range.
+
+        Args:
+            endpoint (str): Endpoint that reports the series.
+            metric (str): Metric name.
+            quantiles (Iterable[float]): Quantiles between 0 and 1.
+            start (float): Inclusive lower bound, seconds since the epoch.
+            end (float | None): Exclusive upper bound; defaults to now.
+
+        Returns:
+            List[float]: Estimates within `SKETCH_RELATIVE_ACCURACY`;
+            NaN when there is no data.
+        """
+        end = time.time() if end is None else end
+        merged = DDSketch(self._alpha)
+
+        with self._lock:
+            rollups = self._series.get((endpoint, metric))
+
+            if rollups is not None:
+                rollup = self._choose(rollups, start, end, None)
+                rollup.merge_into(merged, rollup.select(start, end))
+
+        return merged.quantiles(quantiles)
+
+    def checkpoint(self) -> None:
+        """
+        Write all rollups to the checkpoint file atomically.
+
+        Ring state is copied under the lock, which takes a few memory
+        copies per ring; packing and writing happen outside it, so
+        recording is not held up by the checkpoint. The file is a NumPy
+        ``.npz`` archive with one 2-D block per column and resolution
+        and the packed sketch bins of each resolution.
+        """
+        with self._checkpoint_lock:
+            with self._lock:
+                keys = list(self._series)
+                states = [
+                    [rollup.snapshot() for rollup in self._series[key]]
+                    for key in keys
+                ]
+
+            arrays: Dict[str, np.ndarray] = {
+                "series": np.array(json.dumps(keys)),
+            }
+
+            for index, (resolution, retain) in enumerate(self._resolutions):
+                prefix = f"r{resolution}_{retain}"
+                rings = [series[index] for series in states]
+                packed = [Rollup.pack(ring) for ring in rings]
+                arrays[f"{prefix}_head"] = np.array(
+                    [ring["head"] for ring in rings], np.int64
+                )
+
+                for name in COLUMNS + ("zeros", "lengths"):
+                    dtype = np.float64 if name in COLUMNS else np.int64
+                    arrays[f"{prefix}_{name}"] = np.array(
+                        [np.frombuffer(ring[name], dtype) for ring in rings],
+                        dtype,
+                    ).reshape(len(rings), retain)
+
+                # Bucket codes and per-bucket counts fit in 32 bits.
+                arrays[f"{prefix}_codes"] = np.concatenate(
+                    [codes for codes, _ in packed] or [np.empty(0, np.int64)]
+                ).astype(np.int32)
+                arrays[f"{prefix}_weights"] = np.concatenate(
+                    [weights for _, weights in packed]
+                    or [np.empty(0, np.int64)]
+                ).astype(np.int32)
+
+            temporary = self.checkpoint_path.with_name(
+                f"{self.checkpoint_path.name}.tmp"
+            )
+            with open(temporary, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(temporary, self.checkpoint_path)
+            self._checkpointed_at = time.monotonic()
+
+    def _load(self) -> None:
+        """
+        Restore rollups from the checkpoint file, if there is one.
+
+        Rings whose resolution or retention changed since the checkpoint
+        was written start empty. An unreadable checkpoint is logged and
+        ignored, so the pipeline starts empty instead of failing.
+        """
+        if not self.checkpoint_path.exists():
+            return
+
+        try:
+            with np.load(self.checkpoint_path, allow_pickle=False) as data:
+                self._restore(data)
+        except (OSError, ValueError, KeyError, EOFError,
+                zipfile.BadZipFile) as exc:
+            self._series.clear()
+            logger.warning("Ignoring unreadable rollup checkpoint %s: %s",
+                           self.checkpoint_path, exc)
+
+    def _restore(self, data: Any) -> None:
+        """
+        Rebuild the rings from a loaded checkpoint archive.
+
+        Args:
+            data (Any): Archive opened with `np.load`.
+
+        Raises:
+            ValueError: If the arrays do not match the series list.
+        """
+        keys = [tuple(key) for key in json.loads(str(data["series"]))]
+
+        for key in keys:
+            self._rollups(*key)
+
+        for index, (resolution, retain) in enumerate(self._resolutions):
+            prefix = f"r{resolution}_{retain}"
+
+            if f"{prefix}_head" not in data.files:
+                continue
+
+            lengths = data[f"{prefix}_lengths"]
+            codes = data[f"{prefix}_codes"]
+            weights = data[f"{prefix}_weights"]
+            columns = {name: data[f"{prefix}_{name}"]
+                       for name in COLUMNS + ("zeros",)}
+
+            if (
+                lengths.shape != (len(keys), retain)
+                or any(block.shape != lengths.shape
+                       for block in columns.values())
+                or len(codes) != lengths.sum()
+                or len(weights) != lengths.sum()
+            ):
+                raise ValueError(f"Malformed rollup block {prefix}")
+
+            ends = np.cumsum(lengths.sum(axis=1))
+
+            for row, key in enumerate(keys):
+                start = ends[row - 1] if row else 0
+                self._series[key][index].restore(
+                    data[f"{prefix}_head"][row],
+                    {name: block[row] for name, block in columns.items()},
+                    lengths[row],
+                    codes[start:ends[row]],
+                    weights[start:ends[row]],
+                )
+
+    def close(self) -> None:
+        """
+        Write a final checkpoint.
+        """
+        self.checkpoint()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report pipeline size.
+
+        Returns:
+            Dict[str, int]: Number of series and rollup rings, and of
+            invalid samples dropped.
+        """
+        return {
+            "series": len(self._series),
+            "rollups": len(self._series) * len(self._resolutions),
+            "invalid": self._invalid,
+        }
@@ -0,0 +1,476 @@
+import hashlib
+import json
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.observer import Recorder
+
+
+SAMPLE_BYTES = np.dtype(np.float64).itemsize
+
+
+class Segment:
+    """
+    One append-only chunk of a series.
+
+    A segment is a pair of files holding float64 timestamps and float64
+    values. Only the newest segment of a series receives appends; older
+    segments are sealed and never change again.
+    """
+
+    __slots__ = ("ts_path", "val_path", "seq", "count", "first", "last")
+
+    def __init__(self, directory: Path, seq: int) -> None:
+        """
+        Open a segment, reading its extent from disk if it exists.
+
+        Args:
+            directory (Path): Series directory.
+            seq (int): Sequence number of the segment within the series.
+        """
+        self.seq = seq
+        self.ts_path = directory / f"{seq:08d}.ts"
+        self.val_path = directory / f"{seq:08d}.val"
+        self.count = 0
+        self.first = self.last = float("nan")
+
+        if self.ts_path.exists():
+            self.count = min(
+                self.ts_path.stat().st_size,
+                self.val_path.stat().st_size,
+            ) // SAMPLE_BYTES
+
+            if self.count:
+                timestamps = self.columns()[0]
+                self.first = float(timestamps[0])
+                self.last = float(timestamps[-1])
+
+    def append(self, timestamps: array, values: array) -> None:
+        """
+        Append samples to the segment files.
+
+        Args:
+            timestamps (array): Timestamps, ascending.
+            values (array): Values aligned with `timestamps`.
+        """
+        with open(self.ts_path, "ab") as file:
+            timestamps.tofile(file)
+        with open(self.val_path, "ab") as file:
+            values.tofile(file)
+
+        if not self.count:
+            self.first = timestamps[0]
+
+        self.last = timestamps[-1]
+        self.count += len(timestamps)
+
+    def columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Map the segment into memory.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Read-only memory-mapped
+            timestamp and value columns.
+        """
+        return (
+            np.memmap(self.ts_path, np.float64, "r", shape=(self.count,)),
+            np.memmap(self.val_path, np.float64, "r", shape=(self.count,)),
+        )
+
+    def unlink(self) -> None:
+        """
+        Delete the segment files.
+        """
+        self.ts_path.unlink(missing_ok=True)
+        self.val_path.unlink(missing_ok=True)
+
+
+class Series:
+    """
+    Segments and not yet written samples of one (endpoint, metric) pair.
+    """
+
+    __slots__ = ("endpoint", "metric", "directory", "segments",
+                 "pending_ts", "pending_val", "last_ts", "created")
+
+    def __init__(
+        self,
+        endpoint: str,
+        metric: str,
+        directory: Path,
+        created: bool = True
+    ) -> None:
+        """
+        Open a series directory, loading existing segments.
+
+        Args:
+            endpoint (str): Endpoint that reports the series.
+            metric (str): Metric name.
+            directory (Path): Directory holding the segment files.
+            created (bool): Whether the directory exists on disk. New
+                series are created by the first write instead.
+        """
+        self.endpoint = endpoint
+        self.metric = metric
+        self.directory = directory
+        self.created = created
+        self.segments = [
+            Segment(directory, int(path.stem))
+            for path in sorted(directory.glob("*.ts"))
+        ] if created else []
+        self.segments = [segment for segment in self.segments if segment.count]
+        self.pending_ts = array("d")
+        self.pending_val = array("d")
+        self.last_ts = self.segments[-1].last if self.segments else -np.inf
+
+
+class TimeSeriesStore(Recorder):
+    """
+    Embedded columnar store for metric history.
+
+    Each (endpoint, metric) series lives in its own directory of
+    append-only segment files: one float64 column of timestamps and
+    one of values. Recorded samples are buffered in memory and written
+    by a background thread every `HISTORY_FLUSH_INTERVAL` seconds, so
+    recording never waits on disk.
+
+    A segment is sealed, and a new one started, once it holds
+    `HISTORY_SEGMENT_SAMPLES` samples or spans `HISTORY_SEGMENT_SECONDS`.
+    Sealed segments whose newest sample is older than
+    `HISTORY_RETENTION_SECONDS` are deleted.
+
+    Range queries memory-map the overlapping segments and binary-search
+    the timestamp column, so a range within one segment is returned as
+    a zero-copy view of the file.
+    """
+
+    def __init__(self, root: str | None = None) -> None:
+        """
+        Open (or create) a store and load the series already on disk.
+
+        Args:
+            root (str | None): Store directory. Defaults to `HISTORY_PATH`.
+        """
+        config = ConfigManager()
+        self.root = Path(root or config.get("HISTORY_PATH"))
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._segment_samples = int(config.get("HISTORY_SEGMENT_SAMPLES"))
+        self._segment_seconds = float(config.get("HISTORY_SEGMENT_SECONDS"))
+        self._retention = float(config.get("HISTORY_RETENTION_SECONDS"))
+        self._flush_interval = float(config.get("HISTORY_FLUSH_INTERVAL"))
+
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._series: Dict[Tuple[str, str], Series] = {}
+        self._stats = {"samples": 0, "out_of_order": 0, "invalid": 0,
+                       "sealed": 0, "expired": 0}
+
+        for meta_path in self.root.glob("*/series.json"):
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            key = (meta["endpoint"], meta["metric"])
+            self._series[key] = Series(*key, meta_path.parent)
+
+    def _create(self, endpoint: str, metric: str) -> Series:
+        """
+        Register a new series in memory.
+
+        Its directory is created by the first write, on the flush
+        thread, so recording never touches the disk.
+
+        Args:
+            endpoint (str): Endpoint that reports the series.
+            metric (str): Metric name.
+
+        Returns:
+            Series: Empty series.
+        """
+        digest = hashlib.blake2b(
+            f"{endpoint}\0{metric}".encode("utf-8"), digest_size=10
+        ).hexdigest()
+        series = Series(endpoint, metric, self.root / digest, created=False)
+        self._series[(endpoint, metric)] = series
+        return series
+
+    @staticmethod
+    def _materialize(series: Series) -> None:
+        """
+        Create the directory and metadata file of a new series.
+
+        Args:
+            series (Series): Series not yet on disk.
+        """
+        series.directory.mkdir(exist_ok=True)
+        (series.directory / "series.json").write_text(
+            json.dumps({"endpoint": series.endpoint,
+                        "metric": series.metric}),
+            encoding="utf-8",
+        )
+        series.created = True
+
+    def record(
+        self,
+        endpoint: str,
+        metrics: Dict[str, float],
+        timestamp: float
+    ) -> None:
+        """
+        Buffer one sample of every metric in a payload.
+
+        Samples older than the newest sample of their series are
+        dropped, keeping every series ordered by time, and values that
+        are not numeric are dropped and counted as invalid.
+
+        Args:
+            endpoint (str): Endpoint that reported the payload.
+            metrics (Dict[str, float]): Mapping of metric names to values.
+            timestamp (float): Sample time in seconds since the epoch.
+        """
+        with self._lock:
+            for metric, value in metrics.items():
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    self._stats["invalid"] += 1
+                    continue
+
+                series = self._series.get((endpoint, metric))
+
+                if series is None:
+                    series = self._create(endpoint, metric)
+
+                if timestamp <= series.last_ts:
+                    self._stats["out_of_order"] += 1
+                    continue
+
+                series.pending_ts.append(timestamp)
+                series.pending_val.append(value)
+                series.last_ts = timestamp
+                self._stats["samples"] += 1
+
+        if self._flusher is None and self._flush_interval > 0:
+            self._start_flusher()
+
+    def _start_flusher(self) -> None:
+        """
+        Start the background flush thread once.
+        """
+        with self._lock:
+            if self._flusher is not None:
+                return
+
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name=f"{type(self).__name__}-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        """
+        Periodically write buffered samples and apply retention.
+        """
+        while not self._stop.wait(self._flush_interval):
+            self.flush()
+            self.expire()
+
+    def _write(self, series: Series) -> None:
+        """
+        Write the buffered samples of a series to its segments.
+
+        Must be called with the I/O lock held.
+
+        Args:
+            series (Series): Series to write.
+        """
+        with self._lock:
+            timestamps, values = series.pending_ts, series.pending_val
+
+            if not timestamps:
+                return
+
+            series.pending_ts, series.pending_val = array("d"), array("d")
+
+        if not series.created:
+            self._materialize(series)
+
+        start = 0
+
+        while start < len(timestamps):
+            segment = series.segments[-1] if series.segments else None
+
+            if segment is None or (
+                segment.count >= self._segment_samples
+                or timestamps[start] - segment.first >= self._segment_seconds
+            ):
+                if segment is not None:
+                    self._stats["sealed"] += 1
+
+                seq = segment.seq + 1 if segment is not None else 0
+                segment = Segment(series.directory, seq)
+                series.segments.append(segment)
+
+            end = min(
+                len(timestamps),
+                start + self._segment_samples - segment.count,
+            )
+            segment.append(timestamps[start:end], values[start:end])
+            start = end
+
+    def flush(self) -> None:
+        """
+        Write every buffered sample to disk.
+        """
+        with self._io_lock:
+            for series in list(self._series.values()):
+                self._write(series)
+
+    def expire(self, now: float | None = None) -> int:
+        """
+        Delete sealed segments older than the retention period.
+
+        Args:
+            now (float | None): Current time. Defaults to `time.time()`.
+
+        Returns:
+            int: Number of deleted segments.
+        """
+        cutoff = (time.time() if now is None else now) - self._retention
+        expired = 0
+
+        with self._io_lock:
+            for series in list(self._series.values()):
+                while (
+                    len(series.segments) > 1
+                    and series.segments[0].last < cutoff
+                ):
+                    series.segments.pop(0).unlink()
+                    expired += 1
+
+        self._stats["expired"] += expired
+        return expired
+
+    def query(
+        self,
+        endpoint: str,
+        metric: str,
+        start: float | None = None,
+        end: float | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read the samples of a series within a time range.
+
+        Args:
+            endpoint (str): Endpoint that reports the series.
+            metric (str): Metric name.
+            start (float | None): Inclusive lower bound, unbounded if None.
+            end (float | None): Exclusive upper bound, unbounded if None.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Timestamps and values. When
+            the range lies within one segment these are read-only views
+            of the memory-mapped files.
+        """
+        series = self._series.get((endpoint, metric))
+
+        if series is None:
+            return np.empty(0), np.empty(0)
+
+        low = -np.inf if start is None else start
+        high = np.inf if end is None else end
+        parts: List[Tuple[np.ndarray, np.ndarray]] = []
+
+        with self._io_lock:
+            self._write(series)
+
+            for segment in series.segments:
+                if segment.last < low or segment.first >= high:
+                    continue
+
+                timestamps, values = segment.columns()
+                lo = np.searchsorted(timestamps, low, "left")
+                hi = np.searchsorted(timestamps, high, "left")
+                parts.append((timestamps[lo:hi], values[lo:hi]))
+
+        if not parts:
+            return np.empty(0), np.empty(0)
+
+        if len(parts) == 1:
+            return parts[0]
+
+        return (
+            np.concatenate([timestamps for timestamps, _ in parts]),
+            np.concatenate([values for _, values in parts]),
+        )
+
+    def query_metrics(
+        self,
+        endpoint: str,
+        metrics: Iterable[str] | None = None,
+        start: float | None = None,
+        end: float | None = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Read the values of several metrics of an endpoint.
+
+        The result can be passed straight to `MetricsAnalytics`.
+
+        Args:
+            endpoint (str): Endpoint that reports the metrics.
+            metrics (Iterable[str] | None): Metric names; all metrics of
+                the endpoint when omitted.
+            start (float | None): Inclusive lower bound, unbounded if None.
+            end (float | None): Exclusive upper bound, unbounded if None.
+
+        Returns:
+            Dict[str, np.ndarray]: Values keyed by metric name.
+        """
+        if metrics is None:
+            metrics = sorted(
+                metric for owner, metric in self._series if owner == endpoint
+            )
+
+        return {
+            metric: self.query(endpoint, metric, start, end)[1]
+            for metric in metrics
+        }
+
+    def series(self) -> List[Tuple[str, str]]:
+        """
+        List the stored series.
+
+        Returns:
+            List[Tuple[str, str]]: (endpoint, metric) pairs.
+        """
+        return list(self._series)
+
+    def close(self) -> None:
+        """
+        Stop the flush thread and write every buffered sample.
+        """
+        self._stop.set()
+
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+
+        self.flush()
+        self._stop.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report store counters.
+
+        Returns:
+            Dict[str, int]: Samples recorded, out-of-order and invalid
+            samples dropped, segments sealed and expired, and series
+            count.
+        """
+        return {**self._stats, "series": len(self._series)}
@@ -0,0 +1,59 @@
+import pytest
+
+from src.metaclasses.config_manager import ConfigManager
+from src.rules.alert_state import AlertStateTable
+from src.rules.engine import RuleEngine
+
+
+@pytest.fixture
+def engine():
+    """
+    Rule engine with a hysteresis rule requiring a 10 s breach to fire.
+    """
+    config = ConfigManager()
+    previous = config.get("METRIC_RULES")
+    config.set("METRIC_RULES", [{
+        "metric": "cpu", "threshold": 90, "clear": 80,
+        "for": 10, "renotify": 60,
+    }])
+    yield RuleEngine()
+    config.set("METRIC_RULES", previous)
+
+
+def _step(table, engine, value, now):
+    metrics = {"cpu": value}
+    return table.update("host", metrics, engine.evaluate(metrics), now)
+
+
+def test_alert_fires_after_min_duration_and_resolves_with_hysteresis(engine):
+    """
+    Verify pending, firing, re-notify and hysteresis-based resolution.
+
+    This test ensures that a breach fires only after the `for` duration,
+    repeats only after the re-notify interval, stays firing inside the
+    hysteresis band, and resolves once below the clear threshold.
+    """
+    table = AlertStateTable(engine)
+
+    assert _step(table, engine, 95.0, now=0) == []
+    assert table.state("host", "cpu") == "pending"
+    assert _step(table, engine, 95.0, now=10) == [("cpu", 95.0, "firing")]
+    assert _step(table, engine, 96.0, now=20) == []
+    assert _step(table, engine, 85.0, now=30) == []
+    assert table.state("host", "cpu") == "firing"
+    assert _step(table, engine, 97.0, now=70) == [("cpu", 97.0, "firing")]
+    assert _step(table, engine, 75.0, now=80) == [("cpu", 75.0, "resolved")]
+    assert table.state("host", "cpu") == "ok"
+    assert len(table) == 0
+
+
+def test_pending_breach_that_recovers_never_fires(engine):
+    """
+    Verify that a breach shorter than `for` is forgotten silently.
+    """
+    table = AlertStateTable(engine)
+
+    assert _step(table, engine, 95.0, now=0) == []
+    assert _step(table, engine, 50.0, now=5) == []
+    assert _step(table, engine, 95.0, now=12) == []
+    assert table.state("host", "cpu") == "pending"
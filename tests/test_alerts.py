@@ -0,0 +1,37 @@
+from src.patterns.strategy import FileStorageStrategy
+from src.processors.alerts import Alert, AlertProcessor
+
+
+def test_alert_record_renders_legacy_message():
+    """
+    Verify that alert records render to the existing message format.
+
+    This test ensures that deferring formatting to the storage edge
+    does not change the text written by text backends.
+    """
+    processor = AlertProcessor()
+    record = processor.build(
+        {"metric": "cpu", "value": 95.0, "endpoint": "http://a/metrics"}
+    )
+
+    assert isinstance(record, Alert)
+    assert record.endpoint == "http://a/metrics"
+    assert str(record) == "ALERT: cpu crossed threshold with value 95.0"
+    assert processor.process({"metric": "cpu", "value": 95.0}) == str(record)
+    assert Alert("cpu", 70.0, state="resolved").render() == (
+        "RESOLVED: cpu back within threshold with value 70.0"
+    )
+
+
+def test_file_storage_renders_records_on_write(tmp_path):
+    """
+    Verify that the file backend renders alert records as text lines.
+    """
+    storage = FileStorageStrategy(str(tmp_path / "alerts.txt"))
+    storage.store_many([Alert("cpu", 95.0), Alert("disk", 99.0)])
+    storage.close()
+
+    assert (tmp_path / "alerts.txt").read_text(encoding="utf-8") == (
+        "ALERT: cpu crossed threshold with value 95.0\n"
+        "ALERT: disk crossed threshold with value 99.0\n"
+    )
@@ -1,4 +1,7 @@
-from src.data_handlers.analytics import MetricsAnalytics
+import numpy as np
+import pandas as pd
+
+from src.data_handlers.analytics import MetricsAnalytics, StreamingPercentiles
 
 
 def test_percentiles():
@@ -25,3 +28,63 @@ def test_anomaly_detection():
     analytics = MetricsAnalytics(data)
     anomalies = analytics.detect_anomalies()
     assert not anomalies.empty
+
+
+def test_sketch_percentiles_track_exact_percentiles():
+    """
+    Verify that sketch percentiles match the exact ones within bounds.
+
+    This test ensures that the streaming mode returns the same shape
+    as the pandas path and stays within the documented 1% relative
+    error on dense data, and that per-replica estimates merge.
+    """
+    rng = np.random.default_rng(7)
+    data = {
+        "cpu": rng.uniform(1, 100, 20000),
+        "lat": rng.lognormal(0, 1, 20000),
+    }
+    analytics = MetricsAnalytics(data)
+
+    exact = analytics.percentiles()
+    estimate = analytics.percentiles(method="sketch")
+
+    assert list(estimate.index) == list(exact.index)
+    assert list(estimate.columns) == list(exact.columns)
+    assert np.allclose(estimate, exact, rtol=0.011)
+
+    left, right = StreamingPercentiles(), StreamingPercentiles()
+    for value in data["cpu"][:10000]:
+        left.add("cpu", value)
+    right.extend("cpu", data["cpu"][10000:])
+    left.merge(right)
+    assert np.allclose(left.percentiles()["cpu"], estimate["cpu"])
+
+
+def test_vectorized_anomalies_match_column_loop():
+    """
+    Verify that vectorized IQR detection matches per-column detection.
+
+    This test ensures that the single-pass implementation reports the
+    same rows in the same order as checking each column in turn and
+    concatenating the flagged rows, including duplicate rows and NaNs.
+    """
+    data = {
+        "cpu": [10, 12, 11, 13, 1000, 12, 1000, 11],
+        "mem": [1.0, 1.1, 500.0, 1.2, 1.0, 1.1, 1.0, 1.2],
+        "disk": [5.0, float("nan"), 5.1, 90.0, 5.0, 5.2, 5.0, 5.1],
+    }
+    analytics = MetricsAnalytics(data)
+
+    expected = pd.DataFrame()
+    for column in analytics.df.columns:
+        values = analytics.df[column]
+        q1, q3 = values.quantile(0.25), values.quantile(0.75)
+        iqr = q3 - q1
+        mask = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+        expected = pd.concat([expected, analytics.df[mask]])
+    expected = expected.drop_duplicates()
+
+    pd.testing.assert_frame_equal(analytics.detect_anomalies(), expected)
+    assert list(expected.index) == [4, 2, 3]
+    assert analytics.anomaly_rows().tolist() == [2, 3, 4, 6]
+    assert analytics.anomaly_mask().sum() == 4
@@ -25,3 +25,188 @@ async def test_async_fetch():
 
     assert isinstance(results, list)
 
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_reuses_connections():
+    """
+    Verify that the collector reuses pooled connections across cycles.
+
+    This test serves metrics from a local aiohttp server and checks
+    that a second collection cycle is served on a kept-alive connection
+    instead of opening a new one.
+    """
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    async def handler(request):
+        return web.json_response({"cpu": 10.0})
+
+    app = web.Application()
+    app.router.add_get("/metrics", handler)
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/metrics"))
+
+        async with AsyncMetricsCollector() as collector:
+            first = await collector.collect([url])
+            second = await collector.collect([url])
+            stats = collector.stats()
+
+    assert first == second == [{"cpu": 10.0}]
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_collect_streams_results_within_deadline():
+    """
+    Verify that results stream in completion order under a cycle deadline.
+
+    This test serves one fast and one slow endpoint and checks that the
+    fast result is yielded while the slow fetch is cancelled once the
+    cycle deadline expires.
+    """
+    import asyncio
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    async def fast(request):
+        return web.json_response({"cpu": 10.0})
+
+    async def slow(request):
+        await asyncio.sleep(1)
+        return web.json_response({"cpu": 20.0})
+
+    app = web.Application()
+    app.router.add_get("/fast", fast)
+    app.router.add_get("/slow", slow)
+
+    async with TestServer(app) as server:
+        endpoints = [
+            str(server.make_url("/slow")),
+            str(server.make_url("/fast")),
+        ]
+
+        async with AsyncMetricsCollector() as collector:
+            results = [
+                result
+                async for result in collector.iter_collect(
+                    endpoints, deadline=0.2
+                )
+            ]
+            stats = collector.stats()
+
+    assert results == [(endpoints[1], {"cpu": 10.0})]
+    assert stats["deadline_cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_conditional_fetch_reuses_payload_on_304():
+    """
+    Verify that ETag validators turn unchanged payloads into 304 hits.
+
+    This test serves a payload with an ETag and checks that the second
+    cycle sends If-None-Match, receives 304, returns the cached payload
+    and reports the hit in the not-modified ratio.
+    """
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    async def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"cpu": 10.0}, headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/metrics", handler)
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/metrics"))
+
+        async with AsyncMetricsCollector() as collector:
+            first = await collector.collect([url])
+            second = await collector.collect([url])
+            stats = collector.stats()
+
+    assert first == second == [{"cpu": 10.0}]
+    assert stats["not_modified"] == 1
+    assert stats["not_modified_ratio"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_oversized_payload_is_rejected():
+    """
+    Verify that bodies above MAX_PAYLOAD_BYTES are refused.
+
+    This test ensures that the collector reports a payload_too_large
+    error instead of buffering and decoding an oversized document.
+    """
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from src.metaclasses.config_manager import ConfigManager
+
+    async def handler(request):
+        return web.json_response({"blob": "x" * 4096})
+
+    app = web.Application()
+    app.router.add_get("/metrics", handler)
+
+    config = ConfigManager()
+    previous = config.get("MAX_PAYLOAD_BYTES")
+    config.set("MAX_PAYLOAD_BYTES", 1024)
+
+    try:
+        collector = AsyncMetricsCollector()
+    finally:
+        config.set("MAX_PAYLOAD_BYTES", previous)
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/metrics"))
+
+        async with collector:
+            results = await collector.collect([url])
+
+    assert results == [{"error": "payload_too_large", "url": url}]
+
+
+@pytest.mark.asyncio
+async def test_run_once_survives_malformed_payloads():
+    """
+    Verify that one bad collector payload does not end the cycle.
+
+    This test serves a JSON list, a metrics object with a null value
+    and a valid payload, and checks that the valid payload is still
+    evaluated while the other two are counted by the app.
+    """
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from src.app import MonitoringApp
+
+    async def listing(request):
+        return web.json_response([1, 2])
+
+    async def null(request):
+        return web.json_response({"cpu": None})
+
+    async def valid(request):
+        return web.json_response({"cpu": 10.0})
+
+    app = web.Application()
+    app.router.add_get("/list", listing)
+    app.router.add_get("/null", null)
+    app.router.add_get("/valid", valid)
+
+    async with TestServer(app) as server:
+        endpoints = [
+            str(server.make_url(path)) for path in ("/list", "/null", "/valid")
+        ]
+        monitoring = MonitoringApp(replica_index=0, replica_count=1)
+
+        try:
+            evaluated = await monitoring.run_once(endpoints)
+        finally:
+            await monitoring.close()
+
+    assert evaluated == 1
+    assert monitoring.stats() == {"payloads_invalid": 1, "payloads_failed": 1}
@@ -0,0 +1,49 @@
+import pytest
+
+from src.async_collectors.decoders import JsonDecoder
+from src.metaclasses.config_manager import ConfigManager
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_decoded_off_the_event_loop():
+    """
+    Verify that bodies above the offload threshold use the thread pool.
+
+    This test ensures that small and large documents decode to the same
+    structures and that only the large one is offloaded.
+    """
+    config = ConfigManager()
+    previous = config.get("DECODE_OFFLOAD_BYTES")
+    config.set("DECODE_OFFLOAD_BYTES", 1024)
+
+    try:
+        decoder = JsonDecoder()
+    finally:
+        config.set("DECODE_OFFLOAD_BYTES", previous)
+
+    small = b'{"cpu": 10.0}'
+    large = b"{" + b",".join(
+        b'"m%d": %d' % (i, i) for i in range(500)
+    ) + b"}"
+
+    assert await decoder.decode(small) == {"cpu": 10.0}
+    assert decoder.offloaded == 0
+    assert (await decoder.decode(large))["m499"] == 499
+    assert decoder.offloaded == 1
+
+    decoder.close()
+
+
+def test_unknown_decoder_backend_is_rejected():
+    """
+    Verify that configuring an unknown decoder backend fails loudly.
+    """
+    config = ConfigManager()
+    previous = config.get("DECODER_BACKEND")
+    config.set("DECODER_BACKEND", "yaml")
+
+    try:
+        with pytest.raises(ValueError):
+            JsonDecoder()
+    finally:
+        config.set("DECODER_BACKEND", previous)
@@ -0,0 +1,138 @@
+import numpy as np
+
+from src.patterns.observer import MetricMonitor, Observer
+from src.rules.detectors import (
+    EWMADetector,
+    RateOfChangeDetector,
+    RollingIQRDetector,
+)
+
+
+class _Collector(Observer):
+    def __init__(self):
+        self.items = []
+
+    def update(self, data):
+        self.items.append(data)
+
+
+def test_rolling_iqr_matches_recomputed_window():
+    """
+    Verify that the rolling IQR detector matches a per-window recompute.
+
+    This test ensures that the incrementally maintained order statistics
+    give the same flags as sorting each series' previous `window`
+    samples from scratch, across many interleaved series.
+    """
+    rng = np.random.default_rng(7)
+    window, warmup, series = 8, 4, 50
+    detector = RollingIQRDetector(window=window, k=1.5, warmup=warmup,
+                                  holddown=0)
+    data = rng.integers(0, 10, size=(300, series)).astype(float)
+    data[rng.random(data.shape) < 0.05] *= 20
+
+    for step, row in enumerate(data):
+        metrics = {f"m{i}": float(value) for i, value in enumerate(row)}
+        flagged = {name for name, _, _ in detector.update("h", metrics, step)}
+
+        expected = set()
+        if step >= warmup:
+            past = data[max(0, step - window):step]
+            q1, q3 = np.quantile(past, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            outside = (row < q1 - 1.5 * iqr) | (row > q3 + 1.5 * iqr)
+            expected = {f"m{i}" for i in np.flatnonzero(outside)}
+
+        assert flagged == expected, step
+
+    assert len(detector) == series
+    np.testing.assert_array_equal(
+        np.sort(detector._ring[:series, 1, :window], axis=1),
+        np.sort(data[-window:].T, axis=1),
+    )
+
+
+def test_ewma_and_rate_detectors_flag_sudden_changes():
+    """
+    Verify EWMA z-score and rate-of-change flagging.
+
+    This test ensures that both detectors stay quiet on a steady series
+    and flag a sudden spike, and that non-finite values are ignored.
+    """
+    ewma = EWMADetector(alpha=0.1, threshold=4.0, warmup=5)
+    rate = RateOfChangeDetector(max_rate=10.0)
+
+    for step in range(20):
+        value = 50.0 + (step % 3)
+        assert ewma.update("h", {"cpu": value}, step) == []
+        assert rate.update("h", {"cpu": value}, step) == []
+
+    assert ewma.update("h", {"cpu": float("nan")}, 20) == []
+    [(metric, value, score)] = ewma.update("h", {"cpu": 90.0}, 21)
+    assert (metric, value) == ("cpu", 90.0) and score > 4.0
+    assert rate.update("h", {"cpu": 90.0}, 21) == [("cpu", 90.0, 19.5)]
+
+
+def test_monitor_reports_detector_anomalies():
+    """
+    Verify that registered detectors raise anomaly alerts.
+
+    This test ensures that the monitor forwards detector findings to
+    observers with the anomaly state, detector name and endpoint.
+    """
+    monitor = MetricMonitor()
+    collector = _Collector()
+    monitor.register_observer(collector)
+    monitor.register_detector(RateOfChangeDetector(max_rate=1e6))
+
+    monitor.update_metrics({"cpu": 10.0}, endpoint="web-1")
+    monitor.update_metrics({"cpu": 1e12}, endpoint="web-1")
+
+    anomalies = [item for item in collector.items
+                 if item.get("state") == "anomaly"]
+    assert len(anomalies) == 1
+    assert anomalies[0]["detector"] == "rate"
+    assert anomalies[0]["endpoint"] == "web-1"
+    assert anomalies[0]["value"] == 1e12
+
+
+def test_anomalies_are_held_down_and_stored_with_detector(tmp_path):
+    """
+    Verify the anomaly hold-down, explicit zero settings and storage.
+
+    This test ensures that a series that keeps misbehaving is reported
+    once per hold-down period, that explicit zero settings are not
+    replaced by the configured defaults, and that the detector name and
+    score survive a round trip through the database.
+    """
+    from src.patterns.strategy import DatabaseStorageStrategy
+
+    rate = RateOfChangeDetector(max_rate=0, holddown=10)
+    assert (rate.max_rate, rate.holddown) == (0.0, 10.0)
+    assert EWMADetector(alpha=0, warmup=0).warmup == 0
+
+    rate.update("h", {"cpu": 0.0}, 0)
+    flagged = [bool(rate.update("h", {"cpu": float(t)}, t))
+               for t in range(1, 25)]
+    assert [t for t, hit in enumerate(flagged, start=1) if hit] == [1, 11, 21]
+
+    monitor = MetricMonitor()
+    collector = _Collector()
+    monitor.register_observer(collector)
+    monitor.register_detector(RateOfChangeDetector(max_rate=1e6))
+    monitor.update_metrics({"cpu": 10.0}, endpoint="web-1")
+    monitor.update_metrics({"cpu": 1e12}, endpoint="web-1")
+    monitor.update_metrics({"cpu": 1e24}, endpoint="web-1")
+
+    anomalies = [item for item in collector.items
+                 if item.get("state") == "anomaly"]
+    assert len(anomalies) == 1
+
+    storage = DatabaseStorageStrategy(str(tmp_path / "alerts.db"))
+    storage.store(anomalies[0])
+    storage.flush()
+    [alert] = storage.recent_alerts()
+    storage.close()
+
+    assert alert.detector == "rate"
+    assert alert.score == anomalies[0]["score"] > 1e6
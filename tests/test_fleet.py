@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from src.data_handlers.analytics import MetricsAnalytics
+from src.data_handlers.fleet import FleetAnalyticsRunner
+from src.metaclasses.config_manager import ConfigManager
+from src.timeseries.ring import RingBufferHistory
+
+
+@pytest.fixture
+def fleet_config():
+    """
+    Small chunks and no minimum size, so tiny inputs use the pool.
+    """
+    config = ConfigManager()
+    keys = ("FLEET_CHUNK_SERIES", "FLEET_MIN_PARALLEL_SAMPLES")
+    previous = {key: config.get(key) for key in keys}
+    config.set("FLEET_CHUNK_SERIES", 8)
+    config.set("FLEET_MIN_PARALLEL_SAMPLES", 0)
+    yield config
+    for key, value in previous.items():
+        config.set(key, value)
+
+
+def test_parallel_run_matches_metrics_analytics(fleet_config):
+    """
+    Verify that pooled fleet analysis matches per-series analytics.
+
+    This test ensures that series of different lengths analyzed in
+    worker processes through shared memory yield the same percentiles
+    and anomaly counts as `MetricsAnalytics`, in input order.
+    """
+    rng = np.random.default_rng(3)
+    series = {
+        (f"host-{i}", "cpu"): rng.normal(50, 5, 200 + i) for i in range(30)
+    }
+    series[("host-0", "cpu")][:3] = [500.0, -500.0, 400.0]
+
+    runner = FleetAnalyticsRunner(workers=2)
+    try:
+        result = runner.analyze(series)
+    finally:
+        runner.close()
+
+    stats = runner.stats()
+    assert stats["mode"] == "process" and stats["chunks"] == 4
+    assert list(result.index) == list(series)
+
+    analytics = MetricsAnalytics({key[0]: values
+                                  for key, values in series.items()})
+    np.testing.assert_allclose(
+        result[analytics.percentiles().index.tolist()].to_numpy(),
+        analytics.percentiles().T.to_numpy(),
+    )
+    np.testing.assert_array_equal(
+        result["anomalies"], analytics.anomaly_mask().sum(axis=0)
+    )
+    assert result.loc[("host-0", "cpu"), "anomalies"] >= 3
+    assert result["count"].tolist() == [200 + i for i in range(30)]
+
+
+def test_small_input_runs_inline():
+    """
+    Verify that small inputs skip the process pool.
+
+    This test ensures that inputs below `FLEET_MIN_PARALLEL_SAMPLES` are
+    analyzed in the calling process, here straight from a ring history.
+    """
+    ring = RingBufferHistory(capacity=16, max_series=4)
+    for step in range(20):
+        ring.record("h", {"cpu": float(step), "mem": 1.0}, float(step))
+
+    runner = FleetAnalyticsRunner(workers=4)
+    result = runner.analyze_history(ring)
+
+    assert runner.stats()["mode"] == "inline"
+    assert runner._pool is None
+    assert result.loc[("h", "cpu"), 0.5] == 11.5
+    assert result.loc[("h", "mem"), "count"] == 16
+
+
+def test_series_are_bucketed_by_length(fleet_config):
+    """
+    Verify that short series are not padded to the longest one.
+
+    This test ensures that a few long series only widen the chunk they
+    land in, that results stay in input order, and that empty inputs
+    yield an empty frame.
+    """
+    series = {(f"host-{i}", "cpu"): np.arange(10.0) for i in range(40)}
+    series[("host-7", "cpu")] = np.arange(5000.0)
+
+    runner = FleetAnalyticsRunner(workers=1)
+    result = runner.analyze(series)
+    stats = runner.stats()
+
+    assert list(result.index) == list(series)
+    assert result.loc[("host-7", "cpu"), "count"] == 5000
+    assert result.loc[("host-0", "cpu"), 0.5] == 4.5
+    assert stats["cells"] <= 8 * 5000 + 32 * 10 < len(series) * 5000
+    assert "speedup" not in stats and 0 < stats["utilization"]
+    assert runner.analyze({}).empty
@@ -0,0 +1,53 @@
+from src.async_collectors.health import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from src.metaclasses.config_manager import ConfigManager
+
+
+def test_circuit_opens_and_recovers_through_half_open_probe():
+    """
+    Verify the closed -> open -> half-open -> closed breaker cycle.
+
+    This test ensures that consecutive failures open the circuit,
+    that only a single probe is allowed once the backoff expires,
+    and that a successful probe closes the circuit again.
+    """
+    config = ConfigManager()
+    previous = config.get("CB_BACKOFF_BASE")
+    config.set("CB_BACKOFF_BASE", 0.0)
+
+    try:
+        breaker = CircuitBreaker()
+    finally:
+        config.set("CB_BACKOFF_BASE", previous)
+
+    url = "http://host/metrics"
+
+    for _ in range(config.get("CB_FAILURE_THRESHOLD")):
+        assert breaker.allow(url)
+        breaker.record_failure(url)
+
+    assert breaker.snapshot()[url]["state"] == OPEN
+
+    assert breaker.allow(url)
+    assert breaker.snapshot()[url]["state"] == HALF_OPEN
+    assert not breaker.allow(url)
+
+    breaker.record_success(url, 0.01)
+    assert breaker.snapshot()[url]["state"] == CLOSED
+
+
+def test_adaptive_timeout_tracks_observed_latency():
+    """
+    Verify that request timeouts shrink to fit observed latencies.
+
+    This test ensures that the timeout starts at ASYNC_TIMEOUT and,
+    after enough fast responses, is clamped to the configured minimum.
+    """
+    breaker = CircuitBreaker()
+    url = "http://host/metrics"
+
+    assert breaker.timeout(url) == ConfigManager().get("ASYNC_TIMEOUT")
+
+    for _ in range(20):
+        breaker.record_success(url, 0.001)
+
+    assert breaker.timeout(url) == ConfigManager().get("CB_MIN_TIMEOUT")
@@ -0,0 +1,98 @@
+import aiohttp
+import pytest
+
+from src.instrumentation.registry import MetricsRegistry
+from src.instrumentation.server import MetricsServer
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.observer import AlertObserver, MetricMonitor
+
+
+def test_histogram_renders_cumulative_buckets():
+    """
+    Verify the Prometheus text rendering of a labelled histogram.
+
+    This test ensures that bucket counts are cumulative, end with +Inf,
+    and that sum and count lines are emitted per label set.
+    """
+    family = MetricsRegistry().histogram(
+        "test_render_seconds", "Test histogram.", ("endpoint",),
+        buckets=(0.1, 1.0),
+    )
+    family.labels("a").observe(0.05)
+    family.labels("a").observe(0.5)
+    family.labels("a").observe(5.0)
+
+    lines = family.render()
+
+    assert 'test_render_seconds_bucket{endpoint="a",le="0.1"} 1' in lines
+    assert 'test_render_seconds_bucket{endpoint="a",le="1.0"} 2' in lines
+    assert 'test_render_seconds_bucket{endpoint="a",le="+Inf"} 3' in lines
+    assert 'test_render_seconds_count{endpoint="a"} 3' in lines
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_evaluation_timings():
+    """
+    Verify that /metrics serves monitor self-instrumentation.
+
+    This test evaluates a breaching payload and checks that the alert
+    counter and evaluation histogram appear in the scraped document.
+    """
+    monitor = MetricMonitor()
+    monitor.register_observer(AlertObserver())
+    monitor.update_metrics({"cpu": 99.0})
+
+    config = ConfigManager()
+    previous = config.get("METRICS_PORT")
+    config.set("METRICS_PORT", 0)
+
+    try:
+        server = MetricsServer()
+    finally:
+        config.set("METRICS_PORT", previous)
+
+    await server.start()
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            url = f"http://127.0.0.1:{server.port}/metrics"
+            async with session.get(url) as response:
+                body = await response.text()
+    finally:
+        await server.close()
+
+    assert "# TYPE monitor_alerts_total counter" in body
+    assert "monitor_evaluate_seconds_count" in body
+    assert "monitor_storage_write_seconds_bucket" in body
+
+
+@pytest.mark.asyncio
+async def test_queue_gauges_are_bound_while_running():
+    """
+    Verify that callback gauges belong to one running instance.
+
+    This test ensures that a queued observer exposes its queue depth
+    only between start and close, that a second running queue of the
+    same observer class is refused instead of silently rebinding the
+    gauge, and that the gauge can be bound again after close.
+    """
+    registry = MetricsRegistry()
+    first = MetricMonitor(dispatch="async")
+    first.register_observer(AlertObserver())
+    second = MetricMonitor(dispatch="async")
+    second.register_observer(AlertObserver())
+
+    await first.start()
+
+    try:
+        assert ('monitor_observer_queue_depth{observer="AlertObserver"} 0'
+                in registry.render())
+        with pytest.raises(ValueError):
+            await second.start()
+    finally:
+        await first.close()
+
+    assert ('monitor_observer_queue_depth{observer="AlertObserver"}'
+            not in registry.render())
+    await second.start()
+    await second.close()
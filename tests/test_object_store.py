@@ -0,0 +1,116 @@
+import gzip
+import json
+
+import pytest
+
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.strategy import CloudStorageStrategy
+from src.processors.alerts import Alert
+from src.storage.object_store import LocalDirectoryClient, ObjectStoreClient
+
+
+@pytest.fixture
+def upload_config():
+    """
+    Small chunks, no age-based sealing and no retry backoff.
+    """
+    config = ConfigManager()
+    keys = ("UPLOAD_CHUNK_BYTES", "UPLOAD_CHUNK_SECONDS",
+            "UPLOAD_BACKOFF_BASE")
+    previous = {key: config.get(key) for key in keys}
+    config.set("UPLOAD_CHUNK_BYTES", 2048)
+    config.set("UPLOAD_CHUNK_SECONDS", 0)
+    config.set("UPLOAD_BACKOFF_BASE", 0)
+    yield config
+    for key, value in previous.items():
+        config.set(key, value)
+
+
+class FlakyClient(ObjectStoreClient):
+    """
+    Client failing the first uploads before delegating to a directory.
+    """
+
+    def __init__(self, root, failures):
+        self.inner = LocalDirectoryClient(root)
+        self.failures = failures
+
+    def put(self, key, data):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("upload failed")
+        self.inner.put(key, data)
+
+
+def test_cloud_storage_uploads_compressed_batches(tmp_path, upload_config):
+    """
+    Verify that alerts are uploaded as a few compressed objects.
+
+    This test ensures that alerts are batched into size-bounded,
+    gzip-compressed JSON-lines objects rather than uploaded one by one,
+    and that every alert arrives exactly once.
+    """
+    storage = CloudStorageStrategy(LocalDirectoryClient(str(tmp_path)))
+
+    for i in range(100):
+        storage.store_many([Alert("cpu", float(i), f"http://h{i}/metrics")])
+    storage.close()
+
+    objects = sorted(tmp_path.rglob("*.jsonl.gz"))
+    lines = [
+        json.loads(line)
+        for path in objects
+        for line in gzip.decompress(path.read_bytes()).splitlines()
+    ]
+    stats = storage.stats()
+
+    assert 1 < len(objects) < 10
+    assert [line["value"] for line in lines] == [float(i) for i in range(100)]
+    assert stats["objects"] == len(objects)
+    assert stats["records"] == 100
+    assert stats["compression_ratio"] > 1
+
+
+def test_uploader_retries_failed_uploads(tmp_path, upload_config):
+    """
+    Verify that transient upload failures are retried.
+    """
+    storage = CloudStorageStrategy(FlakyClient(str(tmp_path), failures=2))
+    storage.store({"metric": "cpu", "value": 95.0})
+    storage.close()
+
+    assert storage.stats()["retries"] == 2
+    assert storage.stats()["failures"] == 0
+    assert len(list(tmp_path.rglob("*.jsonl.gz"))) == 1
+
+
+def test_uploader_spills_objects_that_keep_failing(tmp_path, upload_config):
+    """
+    Verify that objects exhausting their retries are kept on disk.
+
+    This test ensures that an object whose uploads all fail is written
+    under `UPLOAD_SPILL_PATH` with its key instead of being dropped,
+    that closing the storage twice is harmless, and that records stored
+    after close are counted as dropped.
+    """
+    previous = upload_config.get("UPLOAD_SPILL_PATH")
+    upload_config.set("UPLOAD_SPILL_PATH", str(tmp_path / "spill"))
+
+    try:
+        storage = CloudStorageStrategy(
+            FlakyClient(str(tmp_path / "store"), failures=100)
+        )
+    finally:
+        upload_config.set("UPLOAD_SPILL_PATH", previous)
+
+    storage.store({"metric": "cpu", "value": 95.0})
+    storage.close()
+    storage.close()
+    storage.store({"metric": "cpu", "value": 96.0})
+
+    [spilled] = list((tmp_path / "spill").rglob("*.jsonl.gz"))
+    assert json.loads(gzip.decompress(spilled.read_bytes()))["value"] == 95.0
+    assert storage.stats()["failures"] == 1
+    assert storage.stats()["spilled"] == 1
+    assert storage.stats()["dropped"] == 1
+    assert not list((tmp_path / "store").rglob("*.jsonl.gz"))
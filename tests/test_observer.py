@@ -1,3 +1,5 @@
+import pytest
+
 from src.patterns.observer import MetricMonitor
 from src.patterns.observer import AlertObserver
 
@@ -16,4 +18,135 @@ def test_alert_trigger():
     d = {"cpu": 95.0}
     monitor.update_metrics(d)
 
-    assert observer.last_alert is not None
\ No newline at end of file
+    assert observer.last_alert is not None
+
+
+def test_breaches_are_delivered_as_one_batch():
+    """
+    Verify that all breaches of one payload reach observers as a batch.
+
+    This test ensures that update_metrics calls update_batch once with
+    every breaching metric, instead of notifying once per metric.
+    """
+    from src.patterns.observer import Observer
+
+    class RecordingObserver(Observer):
+        def __init__(self):
+            self.batches = []
+
+        def update(self, data):
+            raise AssertionError("expected a batch notification")
+
+        def update_batch(self, batch):
+            self.batches.append(batch)
+
+    monitor = MetricMonitor()
+    observer = RecordingObserver()
+    monitor.register_observer(observer)
+
+    monitor.update_metrics({"cpu": 95.0, "memory": 10.0, "disk": 99.0})
+
+    assert observer.batches == [[
+        {"metric": "cpu", "value": 95.0, "state": "firing"},
+        {"metric": "disk", "value": 99.0, "state": "firing"},
+    ]]
+
+
+@pytest.mark.asyncio
+async def test_async_dispatch_drops_oldest_when_queue_is_full():
+    """
+    Verify queued delivery and the drop-oldest overflow policy.
+
+    This test registers a blocking observer in async dispatch mode with
+    a queue of two batches, publishes three batches before the worker
+    starts, and checks that the oldest is dropped and the rest are
+    delivered in order on close.
+    """
+    from src.metaclasses.config_manager import ConfigManager
+    from src.patterns.observer import Observer
+
+    class SlowObserver(Observer):
+        blocking = True
+
+        def __init__(self):
+            self.seen = []
+
+        def update(self, data):
+            self.seen.append(data["value"])
+
+    config = ConfigManager()
+    previous = config.get("OBSERVER_QUEUE_SIZE")
+    config.set("OBSERVER_QUEUE_SIZE", 2)
+
+    try:
+        monitor = MetricMonitor(dispatch="async")
+        observer = SlowObserver()
+        monitor.register_observer(observer)
+    finally:
+        config.set("OBSERVER_QUEUE_SIZE", previous)
+
+    for host, value in (("a", 91.0), ("b", 92.0), ("c", 93.0)):
+        monitor.update_metrics({"cpu": value}, endpoint=host)
+
+    assert observer.seen == []
+
+    await monitor.start()
+    await monitor.close()
+
+    stats = monitor.observer_stats()["SlowObserver"]
+    assert observer.seen == [92.0, 93.0]
+    assert stats["dropped"] == 1
+    assert stats["delivered"] == 2
+
+
+@pytest.mark.asyncio
+async def test_block_policy_never_delivers_on_the_calling_thread():
+    """
+    Verify that the block policy parks overflow instead of delivering it.
+
+    This test fills a one-batch queue in block mode from the synchronous
+    path and checks that no batch reaches the observer on the calling
+    thread, and that all batches are delivered in order once the worker
+    runs.
+    """
+    import threading
+
+    from src.metaclasses.config_manager import ConfigManager
+    from src.patterns.observer import Observer
+
+    class ThreadObserver(Observer):
+        blocking = True
+
+        def __init__(self):
+            self.seen = []
+
+        def update(self, data):
+            self.seen.append((data["value"], threading.get_ident()))
+
+    config = ConfigManager()
+    keys = ("OBSERVER_QUEUE_SIZE", "OBSERVER_OVERFLOW")
+    previous = {key: config.get(key) for key in keys}
+    config.set("OBSERVER_QUEUE_SIZE", 1)
+    config.set("OBSERVER_OVERFLOW", "block")
+
+    try:
+        monitor = MetricMonitor(dispatch="async")
+        observer = ThreadObserver()
+        monitor.register_observer(observer)
+    finally:
+        for key, value in previous.items():
+            config.set(key, value)
+
+    for host, value in (("a", 91.0), ("b", 92.0), ("c", 93.0)):
+        monitor.update_metrics({"cpu": value}, endpoint=host)
+
+    assert observer.seen == []
+    assert monitor.observer_stats()["ThreadObserver"]["backlog"] == 2
+
+    await monitor.start()
+    await monitor.close()
+
+    caller = threading.get_ident()
+    assert [value for value, _ in observer.seen] == [91.0, 92.0, 93.0]
+    assert all(thread != caller for _, thread in observer.seen)
+    assert monitor.observer_stats()["ThreadObserver"]["backlog"] == 0
@@ -0,0 +1,116 @@
+import gzip
+import json
+import threading
+
+import aiohttp
+import pytest
+
+from src.ingestion.push_server import PushIngestionServer
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.observer import AlertObserver, MetricMonitor, Observer
+
+
+def _server(queue_size: int, monitor: MetricMonitor | None = None):
+    config = ConfigManager()
+    previous = (config.get("PUSH_PORT"), config.get("PUSH_QUEUE_SIZE"))
+    config.set("PUSH_PORT", 0)
+    config.set("PUSH_QUEUE_SIZE", queue_size)
+
+    try:
+        observer = AlertObserver()
+        if monitor is None:
+            monitor = MetricMonitor()
+            monitor.register_observer(observer)
+        return PushIngestionServer(monitor), observer
+    finally:
+        config.set("PUSH_PORT", previous[0])
+        config.set("PUSH_QUEUE_SIZE", previous[1])
+
+
+@pytest.mark.asyncio
+async def test_gzip_batch_is_ingested_and_evaluated():
+    """
+    Verify that a gzip-compressed batch reaches the metric monitor.
+
+    This test pushes a compressed batch containing a breaching metric
+    and checks that it is accepted and raises an alert.
+    """
+    server, observer = _server(queue_size=10)
+    await server.start()
+
+    body = gzip.compress(json.dumps([
+        {"endpoint": "host-1", "metrics": {"cpu": 99.0}},
+        {"endpoint": "host-2", "metrics": {"cpu": 10.0}},
+    ]).encode())
+
+    async with aiohttp.ClientSession() as session:
+        async with session.post(
+            f"http://127.0.0.1:{server.port}/ingest",
+            data=body,
+            headers={"Content-Encoding": "gzip"},
+        ) as response:
+            assert response.status == 202
+
+    await server.close()
+
+    stats = server.stats()
+    assert stats["samples_received"] == 2
+    assert stats["samples_processed"] == 2
+    assert observer.last_alert == ("cpu", 99.0)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_answers_429():
+    """
+    Verify that the server applies backpressure when its queue is full.
+
+    This test stalls alert delivery behind a gated observer with a
+    one-batch blocking observer queue, so evaluation of pushed batches
+    waits and the push queue fills up, and checks that further pushes
+    are rejected with 429 until delivery resumes.
+    """
+    release = threading.Event()
+
+    class GatedObserver(Observer):
+        blocking = True
+
+        def update(self, data):
+            release.wait(10)
+
+    config = ConfigManager()
+    keys = ("OBSERVER_QUEUE_SIZE", "OBSERVER_OVERFLOW")
+    previous = {key: config.get(key) for key in keys}
+    config.set("OBSERVER_QUEUE_SIZE", 1)
+    config.set("OBSERVER_OVERFLOW", "block")
+
+    try:
+        monitor = MetricMonitor(dispatch="async")
+        monitor.register_observer(GatedObserver())
+    finally:
+        for key, value in previous.items():
+            config.set(key, value)
+
+    server, _ = _server(queue_size=1, monitor=monitor)
+    await monitor.start()
+    await server.start()
+
+    try:
+        url = f"http://127.0.0.1:{server.port}/ingest"
+        statuses = []
+
+        async with aiohttp.ClientSession() as session:
+            while 429 not in statuses and len(statuses) < 10:
+                # A new endpoint per push, so every batch raises an alert.
+                sample = {"endpoint": f"host-{len(statuses)}",
+                          "metrics": {"cpu": 1000.0}}
+                async with session.post(url, json=sample) as response:
+                    statuses.append(response.status)
+    finally:
+        release.set()
+        await server.close()
+        await monitor.close()
+
+    assert statuses[0] == 202 and statuses[-1] == 429
+    stats = server.stats()
+    assert stats["batches_rejected"] == 1
+    assert stats["samples_processed"] == stats["batches_accepted"]
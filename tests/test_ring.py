@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from src.data_handlers.analytics import MetricsAnalytics
+from src.timeseries.ring import RingBufferHistory
+
+
+def test_ring_keeps_newest_samples_as_zero_copy_views():
+    """
+    Verify wrap-around, last-N views and fixed memory of the ring.
+
+    This test ensures that after more samples than the capacity only
+    the newest ones are returned, oldest first, as read-only views of
+    the preallocated block, and that memory matches `required_bytes`.
+    """
+    ring = RingBufferHistory(capacity=4, max_series=2)
+    before = ring.nbytes
+
+    for step in range(10):
+        ring.record("h", {"cpu": step, "mem": 100 + step}, float(step))
+
+    timestamps, values = ring.last("h", "cpu")
+    np.testing.assert_array_equal(timestamps, [6, 7, 8, 9])
+    np.testing.assert_array_equal(values, [6, 7, 8, 9])
+    np.testing.assert_array_equal(ring.last("h", "mem", 2)[1], [108, 109])
+    assert np.shares_memory(values, ring._values)
+    assert not values.flags.writeable
+
+    ring.record("h", {"disk": 1.0}, 10.0)
+    assert ring.stats()["dropped"] == 1
+    assert ring.nbytes == before == RingBufferHistory.required_bytes(2, 4)
+
+
+def test_metrics_analytics_from_history_shares_ring_memory():
+    """
+    Verify that analytics can run directly on ring-buffer views.
+
+    This test ensures that `MetricsAnalytics.from_history` aligns metrics
+    on their newest sample without copying and computes the same
+    percentiles as a frame built from lists.
+    """
+    ring = RingBufferHistory(capacity=8, max_series=4)
+
+    for step in range(6):
+        ring.record("h", {"cpu": float(step)}, float(step))
+    for step in range(6, 12):
+        ring.record("h", {"cpu": float(step), "mem": 2.0 * step}, float(step))
+
+    analytics = MetricsAnalytics.from_history(ring, "h", n=5)
+    expected = MetricsAnalytics({
+        "cpu": [7.0, 8.0, 9.0, 10.0, 11.0],
+        "mem": [14.0, 16.0, 18.0, 20.0, 22.0],
+    })
+
+    assert np.shares_memory(analytics.df["cpu"].to_numpy(), ring._values)
+    assert analytics.percentiles().equals(expected.percentiles())
+
+    with pytest.raises(ValueError):
+        RingBufferHistory(capacity=4, max_series=1, dtype=np.float32)
+
+
+def test_integer_ring_rejects_fractions_and_bounds_layouts(monkeypatch):
+    """
+    Verify integral checks of integer rings and the layout cache bound.
+
+    This test ensures that an ``np.int64`` history stores whole numbers
+    exactly, including integers beyond float precision, rejects and
+    counts fractional or non-finite values instead of truncating them,
+    and that payload layouts are evicted once the cache is full.
+    """
+    from src.timeseries import ring as ring_module
+
+    ring = RingBufferHistory(capacity=4, max_series=8, dtype=np.int64)
+    ring.record("h", {"a": 3, "b": 2 ** 60 + 1}, 1.0)
+    ring.record("h", {"a": 4.0, "b": 2.5, "c": float("nan")}, 2.0)
+
+    np.testing.assert_array_equal(ring.last("h", "a")[1], [3, 4])
+    np.testing.assert_array_equal(ring.last("h", "b")[1], [2 ** 60 + 1])
+    assert len(ring.last("h", "c")[1]) == 0
+    assert ring.stats()["invalid"] == 2
+    assert ring.stats()["dropped"] == 0
+
+    monkeypatch.setattr(ring_module, "LAYOUT_CACHE_SIZE", 3)
+    for i in range(10):
+        ring.record("h", {"a": i, f"m{i % 4}": i}, float(i))
+    assert len(ring._layouts) == 3
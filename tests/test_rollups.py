@@ -0,0 +1,155 @@
+import math
+
+import pytest
+
+from src.data_handlers.sketches import DDSketch
+from src.metaclasses.config_manager import ConfigManager
+from src.timeseries.rollups import RollupPipeline
+
+
+@pytest.fixture
+def rollup_config():
+    """
+    Short rollup rings without background checkpoints.
+    """
+    config = ConfigManager()
+    keys = ("ROLLUP_RESOLUTIONS", "ROLLUP_CHECKPOINT_INTERVAL",
+            "ROLLUP_MAX_POINTS")
+    previous = {key: config.get(key) for key in keys}
+    config.set("ROLLUP_RESOLUTIONS", {60: 10, 300: 10})
+    config.set("ROLLUP_CHECKPOINT_INTERVAL", 0)
+    config.set("ROLLUP_MAX_POINTS", 100)
+    yield config
+    for key, value in previous.items():
+        config.set(key, value)
+
+
+def test_rollups_aggregate_and_survive_restart(tmp_path, rollup_config):
+    """
+    Verify incremental aggregates, resolution choice and checkpoints.
+
+    This test ensures that samples are folded into 1- and 5-minute
+    buckets, that queries use the coarsest resolution covering the
+    range, and that rollups are restored from the checkpoint.
+    """
+    path = str(tmp_path / "rollups.npz")
+    pipeline = RollupPipeline(path)
+
+    for ts in range(0, 1200, 10):
+        pipeline.record("host", {"cpu": float(ts)}, float(ts))
+    pipeline.close()
+
+    restored = RollupPipeline(path)
+    recent = restored.query("host", "cpu", 600, 1200, step=60)
+    assert recent["resolution"] == 60
+    assert recent["timestamp"].tolist() == list(range(600, 1200, 60))
+    assert recent["min"][0] == 600 and recent["max"][0] == 650
+    assert recent["count"].tolist() == [6.0] * 10
+    assert recent["mean"][0] == 625.0
+
+    full = restored.query("host", "cpu", 0, 1200)
+    assert full["resolution"] == 300
+    assert full["sum"].sum() == sum(range(0, 1200, 10))
+    assert full["last"].tolist() == [290.0, 590.0, 890.0, 1190.0]
+
+    median = restored.quantiles("host", "cpu", [0.5], 0, 1200)[0]
+    assert math.isclose(median, 590.0, rel_tol=0.01)
+
+
+def test_rollups_drop_invalid_values(tmp_path, rollup_config):
+    """
+    Verify that non-numeric and non-finite values are dropped.
+
+    This test ensures that NaN, infinite, null and string values are
+    counted as invalid without creating series or poisoning the sums
+    of the bucket that the valid values fall into.
+    """
+    pipeline = RollupPipeline(str(tmp_path / "rollups.npz"))
+    pipeline.record("host", {"cpu": 1.0, "mem": None}, 0.0)
+    pipeline.record("host", {"cpu": math.nan, "disk": "full"}, 10.0)
+    pipeline.record("host", {"cpu": math.inf, "io": "2.5"}, 20.0)
+
+    result = pipeline.query("host", "cpu", 0, 60, step=60)
+    assert result["sum"].tolist() == [1.0]
+    assert result["count"].tolist() == [1.0]
+    assert pipeline.stats()["invalid"] == 4
+    assert pipeline.stats()["series"] == 2
+    pipeline.close()
+
+
+def test_sketch_merge_matches_single_sketch():
+    """
+    Verify that merged sketches answer like one sketch over all data.
+    """
+    values = [float(value) for value in range(-50, 1000)]
+    whole, left, right = DDSketch(), DDSketch(), DDSketch()
+    whole.extend(values)
+    left.extend(values[:300])
+    right.extend(values[300:])
+    left.merge(right)
+
+    quantiles = [0.0, 0.25, 0.5, 0.75, 0.95, 1.0]
+    exact = [values[math.floor(q * (len(values) - 1))] for q in quantiles]
+
+    assert left.quantiles(quantiles) == whole.quantiles(quantiles)
+    for estimate, value in zip(whole.quantiles(quantiles), exact):
+        assert math.isclose(estimate, value, rel_tol=0.01)
+
+
+def test_sketch_ignores_infinite_values():
+    """
+    Verify that infinities are skipped like NaN by both insert paths.
+
+    This test ensures that adding +inf or -inf one at a time does not
+    raise, that bulk loading does not turn them into bogus buckets,
+    and that both sketches match one built from the finite values.
+    """
+    values = [float(value) for value in range(1, 10)]
+    finite, single, bulk = DDSketch(), DDSketch(), DDSketch()
+    finite.extend(values)
+
+    for value in values + [math.inf, -math.inf, math.nan]:
+        single.add(value)
+    bulk.extend(values + [math.inf, -math.inf, math.nan])
+
+    quantiles = [0.0, 0.5, 0.95, 1.0]
+    for sketch in (single, bulk):
+        assert sketch.count == 9
+        assert (sketch.min, sketch.max) == (1.0, 9.0)
+        assert sketch.quantiles(quantiles) == finite.quantiles(quantiles)
+
+
+def test_frozen_buckets_answer_like_one_sketch(tmp_path, rollup_config):
+    """
+    Verify compact bucket bins, late samples and corrupt checkpoints.
+
+    This test ensures that quantiles merged from frozen bucket bins,
+    including buckets reopened by late samples and buckets restored
+    from a checkpoint, match one sketch over the same values, and that
+    an unreadable checkpoint leaves the pipeline empty instead of
+    failing.
+    """
+    path = tmp_path / "rollups.npz"
+    pipeline = RollupPipeline(str(path))
+    values = [float(value) for value in range(-20, 280)]
+    whole = DDSketch()
+    whole.extend(values)
+
+    for index, value in enumerate(values[:250]):
+        pipeline.record("host", {"cpu": value}, float(index))
+    for index, value in enumerate(values[250:], start=250):
+        pipeline.record("host", {"cpu": value}, float(index - 200))
+
+    quantiles = [0.1, 0.5, 0.9, 1.0]
+    assert pipeline.quantiles("host", "cpu", quantiles, 0, 600) == (
+        whole.quantiles(quantiles)
+    )
+    pipeline.close()
+
+    restored = RollupPipeline(str(path))
+    assert restored.quantiles("host", "cpu", quantiles, 0, 600) == (
+        whole.quantiles(quantiles)
+    )
+
+    path.write_bytes(b"not a checkpoint")
+    assert RollupPipeline(str(path)).stats()["series"] == 0
@@ -0,0 +1,133 @@
+import random
+
+import pytest
+
+from src.metaclasses.config_manager import ConfigManager
+from src.rules.engine import RuleEngine
+
+
+RULES = [
+    {"metric": "disk.root", "host": "db-*", "threshold": 70},
+    {"metric": "disk.*", "threshold": 95},
+    {"metric": "free_memory", "threshold": 10, "direction": "below"},
+    {"metric": "temperature", "min": 10, "max": 80},
+]
+
+
+@pytest.fixture
+def rules_config():
+    """
+    Install the test rules for the duration of a test.
+    """
+    config = ConfigManager()
+    previous = config.get("METRIC_RULES")
+    config.set("METRIC_RULES", RULES)
+    yield config
+    config.set("METRIC_RULES", previous)
+
+
+def test_rules_resolve_by_exact_name_pattern_and_host(rules_config):
+    """
+    Verify rule precedence, directions and per-host selection.
+
+    This test ensures that host-specific exact rules, glob rules,
+    below and range rules and the global fallback are all applied.
+    """
+    engine = RuleEngine()
+    payload = {
+        "disk.root": 80.0,
+        "disk.data": 90.0,
+        "free_memory": 5.0,
+        "temperature": 5.0,
+        "cpu": 95.0,
+    }
+
+    assert engine.evaluate(payload, "http://db-1:9100/metrics") == [
+        ("disk.root", 80.0),
+        ("free_memory", 5.0),
+        ("temperature", 5.0),
+        ("cpu", 95.0),
+    ]
+    assert engine.evaluate(payload, "http://web-1/metrics") == [
+        ("free_memory", 5.0),
+        ("temperature", 5.0),
+        ("cpu", 95.0),
+    ]
+
+
+def test_vectorized_path_matches_scalar_path(rules_config):
+    """
+    Verify that the NumPy path returns the same breaches as the loop.
+    """
+    payload = {
+        f"disk.{i}" if i % 2 else f"m{i}": random.uniform(0, 100)
+        for i in range(5000)
+    }
+    vector_min = rules_config.get("RULES_VECTORIZE_MIN")
+
+    rules_config.set("RULES_VECTORIZE_MIN", 10 ** 9)
+    scalar = RuleEngine().evaluate(payload, "host")
+    rules_config.set("RULES_VECTORIZE_MIN", 1)
+    vector = RuleEngine().evaluate(payload, "host")
+    rules_config.set("RULES_VECTORIZE_MIN", vector_min)
+
+    assert scalar == vector
+    assert scalar
+
+
+def test_rules_recompile_when_config_changes():
+    """
+    Verify that a configuration change is picked up on the next payload.
+    """
+    config = ConfigManager()
+    engine = RuleEngine()
+    previous = config.get("METRIC_THRESHOLD")
+
+    assert engine.evaluate({"cpu": 50.0}) == []
+
+    config.set("METRIC_THRESHOLD", 40.0)
+
+    try:
+        assert engine.evaluate({"cpu": 50.0}) == [("cpu", 50.0)]
+    finally:
+        config.set("METRIC_THRESHOLD", previous)
+
+
+def test_plans_are_shared_across_endpoints_and_bounded(rules_config,
+                                                       monkeypatch):
+    """
+    Verify plan sharing without host-scoped rules and LRU eviction.
+
+    This test ensures that endpoints reporting the same metrics share
+    one plan when no rule is host-scoped, that plans are keyed by host
+    otherwise, and that the caches evict least recently used entries
+    instead of growing past their bound.
+    """
+    from src.rules import engine as engine_module
+
+    monkeypatch.setattr(engine_module, "PLAN_CACHE_SIZE", 2)
+    monkeypatch.setattr(engine_module, "RESOLVE_CACHE_SIZE", 4)
+    rules_config.set("METRIC_RULES", RULES[1:])
+    vector_min = rules_config.get("RULES_VECTORIZE_MIN")
+    rules_config.set("RULES_VECTORIZE_MIN", 1)
+
+    try:
+        shared = RuleEngine()
+        for i in range(50):
+            shared.evaluate({"disk.root": 80.0, "cpu": 95.0},
+                            f"http://web-{i}/")
+        assert len(shared._plans) == 1
+
+        rules_config.set("METRIC_RULES", RULES)
+        scoped = RuleEngine()
+        for i in range(50):
+            scoped.evaluate({"disk.root": 80.0}, f"http://web-{i}/")
+        assert len(scoped._plans) == 2
+        assert len(scoped._resolved) == 4
+
+        assert scoped.evaluate({"disk.root": 80.0}, "http://db-1/") == [
+            ("disk.root", 80.0)
+        ]
+        assert scoped.evaluate({"disk.root": 80.0}, "http://web-1/") == []
+    finally:
+        rules_config.set("RULES_VECTORIZE_MIN", vector_min)
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from src.scheduling.scheduler import FixedRateScheduler
+
+
+@pytest.mark.asyncio
+async def test_fixed_rate_scheduler_skips_overruns():
+    """
+    Verify that ticks keep a fixed rate and overlapping polls are skipped.
+
+    This test schedules an endpoint whose poll takes longer than its
+    interval and checks that the scheduler counts overruns instead of
+    queueing extra polls, while still dispatching on schedule.
+    """
+    polled = []
+
+    async def poll(batch):
+        polled.append(batch)
+        await asyncio.sleep(0.12)
+
+    scheduler = FixedRateScheduler(poll, jitter=0)
+    scheduler.add("http://host/metrics", 0.05)
+
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.33)
+    runner.cancel()
+    await asyncio.gather(runner, return_exceptions=True)
+
+    stats = scheduler.stats()
+    assert stats["ticks"] >= 6
+    assert stats["overruns"] >= 3
+    assert len(polled) == stats["ticks"] - stats["overruns"]
+    assert all(batch == ["http://host/metrics"] for batch in polled)
+
+
+def test_scheduler_rejects_invalid_interval():
+    """
+    Verify that non-positive poll intervals are rejected.
+    """
+    scheduler = FixedRateScheduler(lambda batch: None)
+
+    with pytest.raises(ValueError):
+        scheduler.add("http://host/metrics", 0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_polls_late_endpoints_and_counts_errors():
+    """
+    Verify endpoints added while running are polled and errors counted.
+
+    This test adds an endpoint after the scheduler has started and
+    checks that it is polled, and that a poll batch that raises is
+    counted as a poll error without stopping the schedule.
+    """
+    polled = []
+
+    async def poll(batch):
+        polled.extend(batch)
+        if "http://late/metrics" in batch:
+            raise RuntimeError("poll failed")
+
+    scheduler = FixedRateScheduler(poll, jitter=0)
+    scheduler.add("http://host/metrics", 1.0)
+
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.05)
+    scheduler.add("http://late/metrics", 0.05)
+    await asyncio.sleep(0.18)
+    runner.cancel()
+    await asyncio.gather(runner, return_exceptions=True)
+
+    assert polled.count("http://late/metrics") >= 3
+    assert scheduler.stats()["poll_errors"] == polled.count(
+        "http://late/metrics"
+    )
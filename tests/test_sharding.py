@@ -0,0 +1,78 @@
+import pytest
+
+from src.app import MonitoringApp
+from src.metaclasses.config_manager import ConfigManager
+from src.scheduling.sharding import RendezvousSharder
+
+
+ENDPOINTS = [f"http://host-{i}/metrics" for i in range(1000)]
+
+
+def test_replicas_in_one_process_partition_endpoints():
+    """
+    Verify that N app instances split the endpoint list without overlap.
+
+    This test runs three MonitoringApp replicas in a single process and
+    checks that their shards are disjoint, cover every endpoint, and are
+    roughly balanced.
+    """
+    config = ConfigManager()
+    previous = config.get("METRIC_ENDPOINTS")
+    config.set("METRIC_ENDPOINTS", ENDPOINTS)
+
+    try:
+        shards = [
+            MonitoringApp(replica_index=i, replica_count=3).owned_endpoints()
+            for i in range(3)
+        ]
+    finally:
+        config.set("METRIC_ENDPOINTS", previous)
+
+    assert sum(len(shard) for shard in shards) == len(ENDPOINTS)
+    assert set().union(*shards) == set(ENDPOINTS)
+    assert all(250 < len(shard) < 420 for shard in shards)
+
+
+def test_scaling_out_moves_only_endpoints_of_the_new_replica():
+    """
+    Verify that adding a replica causes minimal reassignment.
+
+    This test ensures that growing from 3 to 4 replicas only moves
+    endpoints onto the new replica, about a quarter of the fleet.
+    """
+    before = RendezvousSharder(0, 3)
+    after = RendezvousSharder(0, 4)
+
+    moved = [
+        endpoint for endpoint in ENDPOINTS
+        if before.owner(endpoint) != after.owner(endpoint)
+    ]
+
+    assert all(after.owner(endpoint) == 3 for endpoint in moved)
+    assert 150 < len(moved) < 350
+
+
+def test_from_config_uses_hostname_ordinal_only_when_sharded(monkeypatch):
+    """
+    Verify replica index resolution from the pod hostname.
+
+    This test ensures that a single replica ignores hostname suffixes,
+    that a sharded StatefulSet pod takes its ordinal, and that a sharded
+    pod without a usable ordinal fails with a clear message.
+    """
+    monkeypatch.delenv("REPLICA_INDEX", raising=False)
+    monkeypatch.delenv("REPLICA_COUNT", raising=False)
+    monkeypatch.setenv("HOSTNAME", "monitoring-system-24567")
+    assert RendezvousSharder.from_config().replica_index == 0
+
+    monkeypatch.setenv("REPLICA_COUNT", "3")
+    monkeypatch.setenv("HOSTNAME", "monitoring-system-2")
+    assert RendezvousSharder.from_config().replica_index == 2
+
+    monkeypatch.setenv("HOSTNAME", "monitoring-system-5")
+    with pytest.raises(ValueError, match="outside REPLICA_COUNT"):
+        RendezvousSharder.from_config()
+
+    monkeypatch.setenv("HOSTNAME", "localhost")
+    with pytest.raises(ValueError, match="REPLICA_INDEX"):
+        RendezvousSharder.from_config()
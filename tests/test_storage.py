@@ -0,0 +1,152 @@
+import gzip
+import sqlite3
+
+import pytest
+
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.strategy import DatabaseStorageStrategy, FileStorageStrategy
+from src.processors.alerts import Alert
+
+
+@pytest.fixture
+def storage_config():
+    """
+    Restore storage settings changed by a test.
+    """
+    config = ConfigManager()
+    keys = (
+        "STORAGE_FSYNC", "STORAGE_FSYNC_EVERY", "STORAGE_FLUSH_INTERVAL",
+        "STORAGE_ROTATE_BYTES", "STORAGE_ROTATE_KEEP",
+    )
+    previous = {key: config.get(key) for key in keys}
+    yield config
+    for key, value in previous.items():
+        config.set(key, value)
+
+
+def test_file_storage_buffers_until_flush(tmp_path, storage_config):
+    """
+    Verify that records are buffered and written by flush and close.
+
+    This test ensures that the file storage keeps a persistent
+    buffered handle instead of writing through on every record,
+    and that `every_n` fsync forces data out after N records.
+    """
+    storage_config.set("STORAGE_FLUSH_INTERVAL", 0)
+    storage_config.set("STORAGE_FSYNC", "every_n")
+    storage_config.set("STORAGE_FSYNC_EVERY", 3)
+    path = tmp_path / "alerts.txt"
+    storage = FileStorageStrategy(str(path))
+
+    storage.store("a")
+    storage.store("b")
+    assert path.read_text(encoding="utf-8") == ""
+
+    storage.store("c")
+    assert path.read_text(encoding="utf-8") == "a\nb\nc\n"
+
+    storage.store("d")
+    storage.close()
+    assert path.read_text(encoding="utf-8") == "a\nb\nc\nd\n"
+    assert storage.stats() == {"records": 4, "fsyncs": 2, "rotations": 0}
+
+
+def test_file_storage_rotates_and_compresses_segments(
+    tmp_path,
+    storage_config
+):
+    """
+    Verify size-based rotation, gzip compression and segment retention.
+    """
+    storage_config.set("STORAGE_FLUSH_INTERVAL", 0)
+    storage_config.set("STORAGE_FSYNC", "never")
+    storage_config.set("STORAGE_ROTATE_BYTES", 10)
+    storage_config.set("STORAGE_ROTATE_KEEP", 2)
+    path = tmp_path / "alerts.txt"
+    storage = FileStorageStrategy(str(path))
+
+    for record in ("one", "two", "three", "four", "five", "six"):
+        storage.store(record)
+    storage.close()
+
+    segments = sorted(tmp_path.glob("alerts.txt.*.gz"))
+    assert storage.stats()["rotations"] == 3
+    assert len(segments) == 2
+    assert all(
+        gzip.decompress(segment.read_bytes()) for segment in segments
+    )
+    assert path.read_text(encoding="utf-8") == "six\n"
+
+
+def test_interval_fsync_without_flush_thread_syncs_every_batch(
+    tmp_path,
+    storage_config
+):
+    """
+    Verify that the interval policy still fsyncs without a flush thread.
+
+    This test ensures that with `STORAGE_FLUSH_INTERVAL` of 0, where no
+    background thread runs the interval fsync, every batch is fsynced
+    and written through instead of staying in the buffer.
+    """
+    storage_config.set("STORAGE_FLUSH_INTERVAL", 0)
+    storage_config.set("STORAGE_FSYNC", "interval")
+    path = tmp_path / "alerts.txt"
+    storage = FileStorageStrategy(str(path))
+
+    storage.store("a")
+    storage.store_many(["b", "c"])
+    assert path.read_text(encoding="utf-8") == "a\nb\nc\n"
+    assert storage.stats()["fsyncs"] == 2
+    storage.close()
+
+
+def test_database_storage_batches_and_queries_alerts(tmp_path):
+    """
+    Verify that SQLite storage persists batches and serves recent alerts.
+
+    This test ensures that queued alerts are committed by the writer
+    thread in WAL mode and can be queried by metric and time.
+    """
+    storage = DatabaseStorageStrategy(str(tmp_path / "alerts.db"))
+    storage.store_many([
+        Alert("cpu", 91.0, "http://a/metrics", timestamp=100.0),
+        Alert("disk", 99.0, "http://a/metrics", timestamp=101.0),
+        Alert("cpu", 95.0, "http://b/metrics", timestamp=102.0),
+    ])
+    storage.store({"metric": "cpu", "value": 70.0, "state": "resolved"})
+    storage.flush()
+
+    recent = storage.recent_alerts(metric="cpu", since=101.0)
+    assert [(a.value, a.endpoint, a.state) for a in recent[1:]] == [
+        (95.0, "http://b/metrics", "firing"),
+    ]
+    assert recent[0].state == "resolved"
+    assert len(storage.recent_alerts(limit=2)) == 2
+
+    storage.close()
+    with sqlite3.connect(tmp_path / "alerts.db") as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert conn.execute("SELECT COUNT(*) FROM alerts").fetchone() == (4,)
+
+
+def test_database_writer_survives_failing_batches(tmp_path, caplog):
+    """
+    Verify that a failing batch is logged and does not stop the writer.
+
+    This test ensures that a batch whose rows cannot be inserted is
+    counted and logged, that batches queued with it are still stored,
+    and that the writer keeps committing later batches.
+    """
+    storage = DatabaseStorageStrategy(str(tmp_path / "alerts.db"))
+    storage.store(Alert("cpu", 91.0))
+    storage.store(Alert("cpu", {"not": "a number"}))
+    storage.store(Alert("cpu", 92.0))
+    storage.flush()
+    storage.store(Alert("cpu", 93.0))
+    storage.close()
+
+    stats = storage.stats()
+    assert stats["rows"] == 3
+    assert stats["failed_rows"] == 1
+    assert "Failed to store 1 alerts" in caplog.text
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.data_handlers.analytics import MetricsAnalytics
+from src.metaclasses.config_manager import ConfigManager
+from src.patterns.observer import MetricMonitor
+from src.timeseries.store import TimeSeriesStore
+
+
+@pytest.fixture
+def history_config():
+    """
+    Small segments and no background flushing for deterministic tests.
+    """
+    config = ConfigManager()
+    keys = ("HISTORY_SEGMENT_SAMPLES", "HISTORY_FLUSH_INTERVAL",
+            "HISTORY_RETENTION_SECONDS")
+    previous = {key: config.get(key) for key in keys}
+    config.set("HISTORY_SEGMENT_SAMPLES", 4)
+    config.set("HISTORY_FLUSH_INTERVAL", 0)
+    config.set("HISTORY_RETENTION_SECONDS", 100.0)
+    yield config
+    for key, value in previous.items():
+        config.set(key, value)
+
+
+def test_store_records_seals_and_serves_ranges(tmp_path, history_config):
+    """
+    Verify that recorded samples survive a reopen and range queries.
+
+    This test ensures that samples recorded through the monitor are
+    split into sealed segments, that a range inside one segment is a
+    zero-copy memory-mapped view, and that results feed analytics.
+    """
+    store = TimeSeriesStore(str(tmp_path))
+    monitor = MetricMonitor()
+    monitor.register_recorder(store)
+    monitor.update_metrics({"cpu": 1.0}, endpoint="http://b/metrics")
+
+    for ts in range(10):
+        store.record("http://a/metrics", {"cpu": float(ts), "mem": 5.0}, ts)
+    store.close()
+
+    reopened = TimeSeriesStore(str(tmp_path))
+    timestamps, values = reopened.query("http://a/metrics", "cpu", 2, 7)
+
+    assert timestamps.tolist() == [2, 3, 4, 5, 6]
+    assert values.tolist() == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert isinstance(reopened.query("http://a/metrics", "mem", 4, 8)[1],
+                      np.memmap)
+    assert reopened.query("http://b/metrics", "cpu")[1].tolist() == [1.0]
+    assert reopened.stats()["series"] == 3
+
+    analytics = MetricsAnalytics(
+        reopened.query_metrics("http://a/metrics", start=0)
+    )
+    assert analytics.percentiles().loc[0.5, "cpu"] == 4.5
+
+
+def test_store_drops_out_of_order_and_expired_segments(
+    tmp_path,
+    history_config
+):
+    """
+    Verify ordering and the retention policy.
+    """
+    store = TimeSeriesStore(str(tmp_path))
+
+    for ts in (1.0, 2.0, 2.0, 3.0, 4.0, 5.0, 200.0, 1.5):
+        store.record("host", {"cpu": ts}, ts)
+    store.flush()
+
+    assert store.stats()["out_of_order"] == 2
+    assert store.expire(now=150.0) == 1
+    assert store.query("host", "cpu")[0].tolist() == [5.0, 200.0]
+    assert len(list(tmp_path.glob("*/*.ts"))) == 1
+
+
+def test_store_skips_invalid_values_and_defers_directories(
+    tmp_path,
+    history_config
+):
+    """
+    Verify that non-numeric values are dropped without touching disk.
+
+    This test ensures that a null or string value is counted as invalid
+    instead of leaving the timestamp and value columns out of step, and
+    that new series directories are only created by the flush.
+    """
+    store = TimeSeriesStore(str(tmp_path))
+
+    store.record("h", {"cpu": 1.0}, 1.0)
+    store.record("h", {"cpu": None, "mem": "high"}, 2.0)
+    store.record("h", {"cpu": "3.5"}, 3.0)
+    assert list(tmp_path.iterdir()) == []
+
+    store.flush()
+    timestamps, values = store.query("h", "cpu")
+
+    assert timestamps.tolist() == [1.0, 3.0]
+    assert values.tolist() == [1.0, 3.5]
+    assert store.stats()["invalid"] == 2
+    assert len(list(tmp_path.glob("*/series.json"))) == 1